@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark conjugation over the verbs of the frequency lists and the corpus.
+
+For every language, the known verbs are those of frequency/<language>.txt
+and the infinitives of preprocessing/data/in/<language>.csv; the unknown
+verbs are made up from them, so that verbecc has to predict their templates.
+Measures:
+1. "construction": CompleteConjugator construction time and peak memory, each
+   in a fresh process
+2. "inflect": Inflector.inflect latency per known and unknown verb
+3. "handler": lambda_handler.handler latency per known and unknown verb
+
+The conjugation cache is cleared before every conjugation, so that the
+latencies are those of conjugating.
+
+The report is appended to benchmark/results/corpus.ndjson unless --output is
+given, and lists the latencies that got slower since the previous report in
+the same file under "regressions".
+
+Usage:
+    python benchmark/benchmark_corpus.py [--languages it es] [--cold-runs 3]
+                                         [--rounds 3] [--output results.ndjson]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import SERVICE_ROOT, emit, metadata, peak_rss_mb, previous_report
+from report import regressions, summarize
+
+# isort: split
+from corpus import LEMMAS, load_verbs, unknown_verbs
+
+DEFAULT_OUTPUT = SERVICE_ROOT / "benchmark" / "results" / "corpus.ndjson"
+
+# Latency metrics compared with the previous report
+_COMPARED = ("construction_ms", "p50_us", "p95_us")
+
+
+def measure_construction(language: str) -> dict:
+    """
+    Construct the CompleteConjugator for a language.
+
+    Runs in a child process, so that no model is loaded yet.
+
+    Returns:
+        The construction duration and peak memory of the process.
+    """
+    logging.disable(logging.INFO)
+    from verbecc import CompleteConjugator, LangCodeISO639_1
+
+    start = time.perf_counter()
+    CompleteConjugator(LangCodeISO639_1(language))
+    return {
+        "construction_ms": (time.perf_counter() - start) * 1e3,
+        "max_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_construction(language: str, runs: int) -> dict:
+    """Measure the conjugator construction in `runs` fresh processes."""
+    context = multiprocessing.get_context("spawn")
+    samples = []
+    for _ in range(runs):
+        with context.Pool(1) as pool:
+            samples.append(pool.apply(measure_construction, (language,)))
+    return {
+        key: round(statistics.median(sample[key] for sample in samples), 1)
+        for key in ("construction_ms", "max_rss_mb")
+    }
+
+
+def run_inflect(language: str, lemmas: list[str], rounds: int) -> dict:
+    """
+    Conjugate every lemma `rounds` times with Inflector.inflect.
+
+    Returns:
+        Latency statistics and the number of verbs that could not be conjugated.
+    """
+    import conjugation_cache
+    from inflector import InflectionError, Inflector
+
+    inflector = Inflector(language)
+    timings: list[float] = []
+    failures = 0
+    for _ in range(rounds):
+        for lemma in lemmas:
+            conjugation_cache.get_cache().clear()
+            start = time.perf_counter()
+            try:
+                inflector.inflect(lemma)
+            except InflectionError:
+                failures += 1
+            timings.append(time.perf_counter() - start)
+    return {**summarize(timings), "failures": failures}
+
+
+def run_handler(language: str, lemmas: list[str], rounds: int) -> dict:
+    """
+    Invoke the handler for every lemma `rounds` times.
+
+    Returns:
+        Latency statistics and status code counts.
+    """
+    import conjugation_cache
+    import lambda_handler
+
+    events = [
+        {
+            "body": json.dumps({"lemma": lemma, "pos": "VERB"}),
+            "path": f"/dev/inflections/{language}",
+        }
+        for lemma in lemmas
+    ]
+    timings: list[float] = []
+    statuses: dict[int, int] = {}
+    for _ in range(rounds):
+        for event in events:
+            conjugation_cache.get_cache().clear()
+            start = time.perf_counter()
+            response = lambda_handler.handler(event, None)
+            timings.append(time.perf_counter() - start)
+            status = response["statusCode"]
+            statuses[status] = statuses.get(status, 0) + 1
+    return {**summarize(timings), "status_codes": statuses}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument(
+        "--cold-runs", type=int, default=3, help="Fresh processes per construction"
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the verbs")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (default: 0.2)",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(DEFAULT_OUTPUT),
+        help="Append the report to this NDJSON file",
+    )
+    args = parser.parse_args()
+
+    # verbecc and the handler log to stdout, which is reserved for the report;
+    # the handler also logs a warning for every verb it cannot conjugate
+    logging.disable(logging.WARNING)
+    # Load conjugators on demand, for whichever languages are measured
+    os.environ["LANGUAGE_CODE"] = "all"
+
+    import conjugator_registry
+    from verbecc import LangCodeISO639_1
+
+    results = {}
+    for language in args.languages:
+        conjugator = conjugator_registry.get_conjugator(LangCodeISO639_1(language))
+        infinitives = set(conjugator.get_infinitives())
+        known = load_verbs(language, infinitives)
+        unknown = unknown_verbs(known, infinitives)
+
+        results[language] = {
+            "verbs": {"known": len(known), "unknown": len(unknown)},
+            "construction": run_construction(language, args.cold_runs),
+            "inflect": {
+                "known": run_inflect(language, known, args.rounds),
+                "unknown": run_inflect(language, unknown, args.rounds),
+            },
+            "handler": {
+                "known": run_handler(language, known, args.rounds),
+                "unknown": run_handler(language, unknown, args.rounds),
+            },
+        }
+
+    previous = previous_report(args.output, "corpus")
+    report = {
+        "benchmark": "corpus",
+        "meta": metadata(),
+        "results": results,
+        "regressions": regressions(
+            results,
+            previous["results"] if previous else None,
+            _COMPARED,
+            args.threshold,
+        ),
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
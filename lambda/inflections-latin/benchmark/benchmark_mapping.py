@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark mapping verbecc conjugations to merged inflections.
+
+"single_pass" is conjugation_mapper.map_tense_conjugation; "per_form" maps
+every Conjugation on its own with map_conjugation, which validates and builds
+one Inflection per form without merging, as the reference for the cost of
+mapping each form once. Both run on every mood and tense of the corpus verbs,
+conjugated once up front, so that only the mapping is measured.
+
+Usage:
+    python benchmark/benchmark_mapping.py [--languages it es] [--output results.ndjson]
+"""
+
+import argparse
+import logging
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, summarize
+
+# isort: split
+import conjugator_registry
+from conjugation_mapper import map_conjugation, map_tense_conjugation
+from corpus import LEMMAS
+from verbecc import LangCodeISO639_1, TenseConjugation
+
+
+def map_per_form(tense_conjugation: TenseConjugation, lemma: str) -> list:
+    """Map a tense's conjugations one by one, without merging."""
+    return [map_conjugation(conjugation, lemma) for conjugation in tense_conjugation]
+
+
+def tense_conjugations(language: str) -> list[tuple[TenseConjugation, str]]:
+    """Conjugate the corpus verbs of a language in every mood and tense."""
+    conjugator = conjugator_registry.get_conjugator(LangCodeISO639_1(language))
+    result = []
+    for lemma in LEMMAS[language]:
+        moods = conjugator.conjugate(lemma).get_moods()
+        for mood in moods:
+            for tense in moods[mood]:
+                result.append((moods[mood][tense], lemma))
+    return result
+
+
+def run(
+    tenses: list[tuple[TenseConjugation, str]], rounds: int, single_pass: bool
+) -> dict:
+    """
+    Map every tense `rounds` times.
+
+    Args:
+        tenses: The tense conjugations to map, with their lemmas.
+        rounds: Number of passes over the tenses.
+        single_pass: Whether to use map_tense_conjugation.
+
+    Returns:
+        Latency statistics per mapped tense.
+    """
+    mapper = map_tense_conjugation if single_pass else map_per_form
+    timings: list[float] = []
+    for _ in range(rounds):
+        for tense_conjugation, lemma in tenses:
+            start = time.perf_counter()
+            mapper(tense_conjugation, lemma)
+            timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument("--rounds", type=int, default=50, help="Passes over the tenses")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    # verbecc routes all logging to stdout, which is reserved for the report
+    logging.disable(logging.INFO)
+
+    results = {}
+    for language in args.languages:
+        tenses = tense_conjugations(language)
+        results[language] = {
+            "per_form": run(tenses, args.rounds, single_pass=False),
+            "single_pass": run(tenses, args.rounds, single_pass=True),
+        }
+
+    emit({"benchmark": "mapping", "meta": metadata(), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
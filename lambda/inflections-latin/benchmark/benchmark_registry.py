@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request handler latency with and without the conjugator registry.
+
+"per_request_construction" empties the registry before every request, which
+reproduces constructing a CompleteConjugator per request; "shared_conjugator"
+serves all requests from the process-wide conjugator. The conjugation cache is
+emptied before every request in both modes, so that every request conjugates.
+
+Usage:
+    python benchmark/benchmark_registry.py [--languages it es] [--output results.ndjson]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, summarize
+
+# isort: split
+import conjugation_cache
+import conjugator_registry
+import lambda_handler
+from corpus import LEMMAS
+
+
+def run(language: str, lemmas: list[str], rounds: int, shared: bool) -> dict:
+    """
+    Invoke the handler for every lemma `rounds` times.
+
+    Args:
+        language: The language code put into the request path.
+        lemmas: The verbs to conjugate.
+        rounds: Number of passes over the lemmas.
+        shared: Whether conjugators are kept between requests.
+
+    Returns:
+        Latency statistics for the handler invocations.
+    """
+    events = [
+        {
+            "body": json.dumps({"lemma": lemma, "pos": "VERB"}),
+            "path": f"/dev/inflections/{language}",
+        }
+        for lemma in lemmas
+    ]
+    timings: list[float] = []
+    for _ in range(rounds):
+        for event in events:
+            conjugation_cache.get_cache().clear()
+            if not shared:
+                conjugator_registry.clear()
+            start = time.perf_counter()
+            response = lambda_handler.handler(event, None)
+            timings.append(time.perf_counter() - start)
+            assert response["statusCode"] == 200, response
+    return summarize(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument("--rounds", type=int, default=2, help="Passes over the lemmas")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    # verbecc routes all logging to stdout, which is reserved for the report
+    logging.disable(logging.INFO)
+
+    results = {}
+    for language in args.languages:
+        results[language] = {
+            "per_request_construction": run(
+                language, LEMMAS[language], args.rounds, shared=False
+            ),
+            "shared_conjugator": run(
+                language, LEMMAS[language], args.rounds, shared=True
+            ),
+        }
+
+    emit({"benchmark": "registry", "meta": metadata(), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading conjugators from snapshots vs. from the model archives.
+
+For every language, a snapshot is written to a temporary directory first.
+Each mode is then measured in a fresh process: "zip" constructs the
+CompleteConjugator from the trained model archive, "snapshot" loads the
+pickled conjugator. "load_ms" is the time to get the conjugator from the
+registry, "max_rss_mb" the peak memory of the process afterwards.
+
+Usage:
+    python benchmark/benchmark_snapshot.py [--languages it es] [--rounds 3] [--output results.ndjson]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, peak_rss_mb
+
+# isort: split
+from corpus import LEMMAS
+
+
+def measure_load(language: str, snapshot_dir: str | None) -> dict:
+    """
+    Load the conjugator for a language through the registry.
+
+    Runs in a child process, so that no model is loaded yet.
+
+    Args:
+        language: The language to load the conjugator for.
+        snapshot_dir: The snapshot directory, or None to use the model archive.
+
+    Returns:
+        The load duration and peak memory of the process.
+    """
+    if snapshot_dir:
+        os.environ["CONJUGATOR_SNAPSHOT_DIR"] = snapshot_dir
+    logging.disable(logging.INFO)
+
+    import conjugator_registry
+    from verbecc import LangCodeISO639_1
+
+    start = time.perf_counter()
+    conjugator_registry.get_conjugator(LangCodeISO639_1(language))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "load_ms": elapsed * 1e3,
+        "max_rss_mb": peak_rss_mb(),
+    }
+
+
+def run(language: str, snapshot_dir: str | None, rounds: int) -> dict:
+    """Measure loading a conjugator in `rounds` fresh processes."""
+    context = multiprocessing.get_context("spawn")
+    samples = []
+    for _ in range(rounds):
+        with context.Pool(1) as pool:
+            samples.append(pool.apply(measure_load, (language, snapshot_dir)))
+    return {
+        key: round(statistics.median(sample[key] for sample in samples), 1)
+        for key in ("load_ms", "max_rss_mb")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument("--rounds", type=int, default=3, help="Processes per mode")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    # verbecc routes all logging to stdout, which is reserved for the report
+    logging.disable(logging.INFO)
+
+    import conjugator_snapshot
+    from verbecc import LangCodeISO639_1
+
+    results = {}
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        for language in args.languages:
+            path = conjugator_snapshot.save(snapshot_dir, LangCodeISO639_1(language))
+            results[language] = {
+                "zip": run(language, None, args.rounds),
+                "snapshot": run(language, snapshot_dir, args.rounds),
+                "snapshot_size_mb": round(path.stat().st_size / 1e6, 1),
+            }
+
+    emit({"benchmark": "snapshot", "meta": metadata(), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
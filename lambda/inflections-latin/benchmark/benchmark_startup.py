@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the first-request cost per language of the multi-language image.
+
+Every language is measured in a fresh process with LANGUAGE_CODE=all, i.e.
+without a conjugator loaded at init: "import" is the Lambda init phase,
+"first_request" includes loading the language's model, "warm_requests" are
+the requests that follow. "max_rss_mb" is the peak memory of the process.
+A final run loads every language in one process, in order, to show how
+memory grows with the number of loaded models.
+
+Usage:
+    python benchmark/benchmark_startup.py [--languages it es] [--output results.ndjson]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, peak_rss_mb, summarize
+
+# isort: split
+from corpus import LEMMAS
+
+
+def _event(language: str, lemma: str) -> dict:
+    return {
+        "body": json.dumps({"lemma": lemma, "pos": "VERB"}),
+        "path": f"/dev/inflections/{language}",
+    }
+
+
+def _request(handler, language: str, lemma: str) -> float:
+    start = time.perf_counter()
+    response = handler(_event(language, lemma), None)
+    elapsed = time.perf_counter() - start
+    assert response["statusCode"] == 200, response
+    return elapsed
+
+
+def measure_languages(languages: list[str]) -> dict:
+    """
+    Send requests for each language, in order, to a freshly imported handler.
+
+    Runs in a child process, so that no module or model is loaded yet.
+
+    Args:
+        languages: The languages to send requests for.
+
+    Returns:
+        Init duration, and first-request and warm latencies per language.
+    """
+    os.environ["LANGUAGE_CODE"] = "all"
+    logging.disable(logging.INFO)
+
+    start = time.perf_counter()
+    import lambda_handler
+
+    result = {
+        "import_ms": round((time.perf_counter() - start) * 1e3, 1),
+        "max_rss_mb_after_import": peak_rss_mb(),
+        "languages": {},
+    }
+
+    for language in languages:
+        first, *rest = LEMMAS[language]
+        first_request = _request(lambda_handler.handler, language, first)
+        warm = [_request(lambda_handler.handler, language, lemma) for lemma in rest]
+        result["languages"][language] = {
+            "first_request_ms": round(first_request * 1e3, 1),
+            "warm_requests": summarize(warm),
+            "max_rss_mb": peak_rss_mb(),
+        }
+
+    return result
+
+
+def run_in_fresh_process(languages: list[str]) -> dict:
+    """Run measure_languages in a newly spawned interpreter."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(measure_languages, (languages,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    results = {
+        "cold_per_language": {
+            language: run_in_fresh_process([language]) for language in args.languages
+        },
+        "all_languages_in_one_process": run_in_fresh_process(args.languages),
+    }
+
+    emit({"benchmark": "startup", "meta": metadata(), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
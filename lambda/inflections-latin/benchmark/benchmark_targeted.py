@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark targeted mood/tense conjugation against complete conjugation.
+
+"complete" conjugates every mood and tense of a verb and then selects the
+configured one; "targeted" is Inflector.inflect, which only computes the
+configured mood and tense.
+
+Usage:
+    python benchmark/benchmark_targeted.py [--languages it es] [--output results.ndjson]
+"""
+
+import argparse
+import logging
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, summarize
+
+# isort: split
+import conjugation_cache
+from conjugation_mapper import map_tense_conjugation
+from corpus import LEMMAS
+from inflector import Inflector, _localize
+
+
+def inflect_complete(inflector: Inflector, lemma: str) -> list:
+    """Inflect by conjugating all moods and tenses, as Inflector used to."""
+    moods = inflector._conjugator.conjugate(lemma).get_moods()
+    mood, tense = _localize(inflector.language, inflector.mood, inflector.tense)
+    return map_tense_conjugation(moods[mood][tense], lemma)
+
+
+def run(inflector: Inflector, lemmas: list[str], rounds: int, targeted: bool) -> dict:
+    """
+    Inflect every lemma `rounds` times.
+
+    Args:
+        inflector: The Inflector to use.
+        lemmas: The verbs to conjugate.
+        rounds: Number of passes over the lemmas.
+        targeted: Whether to use the targeted conjugation path.
+
+    Returns:
+        Latency statistics for the conjugations.
+    """
+    timings: list[float] = []
+    for _ in range(rounds):
+        for lemma in lemmas:
+            # Measure conjugating, not serving from the conjugation cache
+            conjugation_cache.get_cache().clear()
+            start = time.perf_counter()
+            if targeted:
+                inflector.inflect(lemma)
+            else:
+                inflect_complete(inflector, lemma)
+            timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--languages", nargs="+", default=sorted(LEMMAS))
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the lemmas")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    # verbecc routes all logging to stdout, which is reserved for the report
+    logging.disable(logging.INFO)
+
+    results = {}
+    for language in args.languages:
+        inflector = Inflector(language)
+        lemmas = LEMMAS[language]
+        results[language] = {
+            "complete": run(inflector, lemmas, args.rounds, targeted=False),
+            "targeted": run(inflector, lemmas, args.rounds, targeted=True),
+        }
+
+    emit({"benchmark": "targeted", "meta": metadata(), "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Verb lemmas for the inflections-latin benchmarks.
+
+LEMMAS is a handful of common verbs per language. load_verbs extends the
+bundled frequency lists (frequency/<language>.txt) with the infinitives found
+in the phrase/translation CSV files used by the preprocessing Lambda
+(preprocessing/data/in/<language>.csv).
+"""
+
+import csv
+import re
+from pathlib import Path
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+FREQUENCY_DIR = SERVICE_ROOT / "frequency"
+CORPUS_DIR = SERVICE_ROOT.parent / "preprocessing" / "data" / "in"
+
+# A few common verbs per language
+LEMMAS = {
+    "es": ["ser", "tener", "hablar", "vivir", "comer"],
+    "fr": ["être", "avoir", "parler", "finir", "prendre"],
+    "it": ["essere", "avere", "parlare", "finire", "prendere"],
+    "pt": ["ser", "ter", "falar", "viver", "comer"],
+}
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def load_verbs(language: str, infinitives: set[str]) -> list[str]:
+    """
+    Collect the known verbs of a language from the frequency list and corpus.
+
+    verbecc cannot lemmatize, so only words of the corpus phrases that are
+    infinitives known to verbecc are taken from the corpus.
+
+    Args:
+        language: The language code, e.g. "it".
+        infinitives: The infinitives known to the language's conjugator.
+
+    Returns:
+        Known verbs in order of first occurrence, frequency list first.
+    """
+    verbs: dict[str, None] = {}
+
+    frequency_list = FREQUENCY_DIR / f"{language}.txt"
+    if frequency_list.is_file():
+        for line in frequency_list.read_text(encoding="utf-8").splitlines():
+            if line.strip() in infinitives:
+                verbs[line.strip()] = None
+
+    corpus = CORPUS_DIR / f"{language}.csv"
+    if corpus.is_file():
+        with open(corpus, "r", encoding="utf-8") as f:
+            for line in csv.reader(f, delimiter="|"):
+                if not line:
+                    continue
+                for word in _WORD_PATTERN.findall(line[0].lower()):
+                    if word in infinitives:
+                        verbs[word] = None
+
+    return list(verbs)
+
+
+def unknown_verbs(verbs: list[str], infinitives: set[str]) -> list[str]:
+    """
+    Derive verbs unknown to verbecc, which it conjugates by predicting a template.
+
+    The made-up verbs keep the endings of known verbs, so that the prediction
+    works on realistic input.
+
+    Args:
+        verbs: Known verbs to derive the unknown verbs from.
+        infinitives: The infinitives known to the language's conjugator.
+
+    Returns:
+        One unknown verb per known verb.
+    """
+    return [f"zr{verb}" for verb in verbs if f"zr{verb}" not in infinitives]
@@ -0,0 +1,154 @@
+"""
+Helpers for reporting benchmark results in a machine-readable form.
+
+Every report carries enough metadata (service version, Python version, Lambda
+memory size) to compare results across releases and Lambda configurations.
+"""
+
+import datetime
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tomllib
+from pathlib import Path
+from typing import Optional
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+
+# Make the Lambda modules importable the same way pytest.ini does
+sys.path.insert(0, str(SERVICE_ROOT / "inflections"))
+
+
+def summarize(timings: list[float]) -> dict:
+    """Reduce a list of latencies in seconds to statistics in microseconds."""
+    timings = sorted(t * 1e6 for t in timings)
+    return {
+        "count": len(timings),
+        "mean_us": round(statistics.fmean(timings), 1),
+        "p50_us": round(timings[len(timings) // 2], 1),
+        "p95_us": round(timings[int(len(timings) * 0.95)], 1),
+        "p99_us": round(timings[int(len(timings) * 0.99)], 1),
+    }
+
+
+def peak_rss_mb() -> float:
+    """
+    Get the peak resident memory of the current process in MB.
+
+    Reads VmHWM on Linux, which unlike ru_maxrss is not inherited from the
+    parent of a spawned process.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1)
+
+
+def metadata(memory_size: Optional[int] = None) -> dict:
+    """
+    Describe the environment a benchmark ran in.
+
+    Args:
+        memory_size: Lambda memory size in MB. Defaults to the value of
+                     AWS_LAMBDA_FUNCTION_MEMORY_SIZE, if set.
+
+    Returns:
+        A JSON-compatible dictionary of run metadata.
+    """
+    with open(SERVICE_ROOT / "pyproject.toml", "rb") as f:
+        project = tomllib.load(f)["project"]
+
+    if memory_size is None and "AWS_LAMBDA_FUNCTION_MEMORY_SIZE" in os.environ:
+        memory_size = int(os.environ["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"])
+
+    return {
+        "service": project["name"],
+        "version": project["version"],
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "memory_size_mb": memory_size,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def emit(report: dict, output: Optional[str] = None) -> None:
+    """
+    Print a report as JSON and optionally append it to an NDJSON file.
+
+    Args:
+        report: The report to emit.
+        output: Path of an NDJSON file that collects reports across runs.
+    """
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if output:
+        with open(output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report, ensure_ascii=False) + "\n")
+
+
+def previous_report(path: Optional[str], benchmark: str) -> Optional[dict]:
+    """
+    Get the most recent report of a benchmark from an NDJSON file.
+
+    Args:
+        path: Path of an NDJSON file written by emit, if any.
+        benchmark: The "benchmark" name of the report.
+
+    Returns:
+        The last report of the benchmark, or None if there is none.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+
+    previous = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                report = json.loads(line)
+                if report.get("benchmark") == benchmark:
+                    previous = report
+    return previous
+
+
+def regressions(
+    current: dict, previous: Optional[dict], keys: tuple[str, ...], threshold: float
+) -> dict:
+    """
+    Compare the latencies of two results and list those that got slower.
+
+    Args:
+        current: The current results.
+        previous: The previous results, or None.
+        keys: The names of the latency metrics to compare, e.g. "p50_us".
+        threshold: The relative slowdown to report, e.g. 0.2 for 20%.
+
+    Returns:
+        The previous and current value of every slower metric, by its path
+        through the results, e.g. "it.known.p50_us".
+    """
+    found = {}
+
+    def compare(current: dict, previous: dict, path: str) -> None:
+        for key, value in current.items():
+            if key not in previous:
+                continue
+            if isinstance(value, dict) and isinstance(previous[key], dict):
+                compare(value, previous[key], f"{path}{key}.")
+            elif (
+                key in keys
+                and previous[key]
+                and value > previous[key] * (1 + threshold)
+            ):
+                found[f"{path}{key}"] = {"previous": previous[key], "current": value}
+
+    if previous:
+        compare(current, previous, "")
+    return found
@@ -3,17 +3,13 @@
 VERSION=$(uvx poetry version -s)
 export VERSION
 
-# Read models.txt line by line
-while IFS= read -r language || [ -n "$language" ]; do
-    # Skip empty lines
-    [ -z "$language" ] && continue
+build_and_push() {
+    local language="$1"
 
     # Build image with $language name appended to tag
     IMAGE_TAG="grammr/inflections-latin:$VERSION-$language"
     ECR_TAG="$AWS_ACCOUNT_ID.dkr.ecr.$AWS_REGION.amazonaws.com/grammr/inflections-latin:$VERSION-$language"
 
-    aws ecr get-login-password --region "$AWS_REGION" | docker login --username AWS --password-stdin "$AWS_ACCOUNT_ID.dkr.ecr.$AWS_REGION.amazonaws.com"
-
     echo "Building image for language: $language"
     docker build -t "$IMAGE_TAG" --build-arg LANGUAGE_CODE="$language" .
 
@@ -25,6 +21,23 @@ while IFS= read -r language || [ -n "$language" ]; do
 
     echo "Completed: $language"
     echo "---"
+}
+
+aws ecr get-login-password --region "$AWS_REGION" | docker login --username AWS --password-stdin "$AWS_ACCOUNT_ID.dkr.ecr.$AWS_REGION.amazonaws.com"
+
+# With --all, build a single image containing the models of every language in languages.txt
+if [ "$1" = "--all" ]; then
+    build_and_push all
+    echo "Multi-language image built and pushed successfully!"
+    exit 0
+fi
+
+# Read models.txt line by line
+while IFS= read -r language || [ -n "$language" ]; do
+    # Skip empty lines
+    [ -z "$language" ] && continue
+
+    build_and_push "$language"
 done < languages.txt
 
 echo "All models built and pushed successfully!"
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Bulk conjugation for large conjugation jobs.
+
+This module conjugates many verbs of one or more languages in parallel.
+Every language is processed by its own process pool whose workers each load
+the conjugator of that language once, so that no worker holds more than one
+model in memory. verbecc is pure Python, so it scales with the number of cores only
+across processes.
+
+It also trains the verbecc models of several languages in parallel.
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+import conjugation_response
+import feature_retriever
+from domain.inflection_request import InflectionRequest
+from inflector import InflectionError, Inflector
+from pydantic import ValidationError
+from verbecc import CompleteConjugator, LangCodeISO639_1
+
+# Languages whose models are shipped in the images
+MODEL_LANGUAGES = ["fr", "es", "it", "pt"]
+
+# Inflector of the current worker process, created by _init_worker
+_worker_inflector: Optional[Inflector] = None
+
+
+def read_requests(
+    lines: Iterable[str], language: Optional[str] = None
+) -> Iterator[tuple[str, dict]]:
+    """
+    Read (language, request item) pairs from a lemma list or NDJSON.
+
+    Args:
+        lines: Lines of either a lemma list (one verb per line) or NDJSON
+               requests, e.g. {"lemma": "essere", "pos": "VERB", "language": "it"}.
+        language: The language of the lemmas or requests. Required for
+                  lemma lists; NDJSON requests may specify their own.
+
+    Returns:
+        An iterator of (language, request item) pairs. Blank lines are skipped.
+
+    Raises:
+        ValueError: If the language of an item is unknown.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if line.startswith("{"):
+            item = json.loads(line)
+            item_language = item.pop("language", language)
+        else:
+            item = {"lemma": line, "pos": "VERB"}
+            item_language = language
+
+        if not item_language:
+            raise ValueError(f"No language given for '{line}'")
+        yield item_language, item
+
+
+def conjugate_bulk(
+    items: Iterable[tuple[str, dict]], max_workers: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Conjugate (language, request item) pairs in per-language process pools.
+
+    Args:
+        items: The items to conjugate, e.g. from read_requests.
+        max_workers: Maximum number of worker processes per language.
+                     Defaults to the number of processors.
+
+    Returns:
+        An iterator of serialized results, each with its "language". Results
+        are grouped by language, in order of each language's first item, and
+        keep the input order within a language. Failed items yield an object
+        with an "error" message.
+    """
+    by_language: dict[str, list[dict]] = {}
+    for language, item in items:
+        by_language.setdefault(language, []).append(item)
+
+    for language, language_items in by_language.items():
+        for result in _conjugate_language(language, language_items, max_workers):
+            yield {"language": language} | result
+
+
+def _conjugate_language(
+    language: str, items: list[dict], max_workers: Optional[int]
+) -> Iterator[dict]:
+    """Conjugate the items of a single language in a process pool."""
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(language,)
+    ) as pool:
+        yield from pool.map(_inflect_in_worker, items, chunksize=32)
+
+
+def _init_worker(language: str) -> None:
+    """Create the Inflector, and so load the conjugator, of a worker process."""
+    global _worker_inflector
+    # verbecc logs to stdout, which may carry the results
+    logging.disable(logging.INFO)
+    try:
+        _worker_inflector = Inflector(language)
+    except InflectionError:
+        # Reported for every item by _inflect_in_worker
+        _worker_inflector = None
+
+
+def _inflect_in_worker(item: dict) -> dict:
+    """Conjugate a single request item with the worker's Inflector."""
+    try:
+        request = InflectionRequest(**item)
+    except (TypeError, ValidationError):
+        return {"lemma": item.get("lemma"), "error": "Invalid request item"}
+
+    if not feature_retriever.is_word_inflectable(request.part_of_speech.value):
+        return conjugation_response.item_error(
+            request,
+            f"Part of speech '{request.part_of_speech.value}' cannot be conjugated",
+        )
+
+    if _worker_inflector is None:
+        return conjugation_response.item_error(request, "Unsupported language")
+
+    try:
+        return conjugation_response.conjugate(request, _worker_inflector)
+    except InflectionError as e:
+        return conjugation_response.item_error(request, str(e))
+
+
+def generate_models(
+    languages: Iterable[str] = MODEL_LANGUAGES, max_workers: Optional[int] = None
+) -> dict[str, float]:
+    """
+    Generate the pre-trained model archives of several languages in parallel.
+
+    verbecc trains and saves the model of a language when its conjugator is
+    first constructed without an existing archive.
+
+    Args:
+        languages: The languages to generate models for.
+        max_workers: Maximum number of worker processes.
+
+    Returns:
+        The seconds it took to generate each language's model.
+    """
+    languages = list(languages)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(languages, pool.map(_generate_model, languages)))
+
+
+def _generate_model(language: str) -> float:
+    """Construct the conjugator of a language, generating its model if needed."""
+    start = time.perf_counter()
+    CompleteConjugator(LangCodeISO639_1(language))
+    return time.perf_counter() - start
@@ -0,0 +1,151 @@
+"""
+Process-wide cache of conjugation results.
+
+Popular verbs are conjugated over and over, and lemmas verbecc rejects would
+otherwise pay the full failure cost on every retry. This module keeps a
+bounded LRU cache of merged inflections, keyed by language, lemma, mood and
+tense, shared for the lifetime of the process (i.e. across invocations of a
+warm Lambda). Failures are cached as well, but only for a short time.
+
+The cache size and failure TTL can be configured through the
+CONJUGATION_CACHE_SIZE and CONJUGATION_FAILURE_TTL_SECONDS environment
+variables.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Union
+
+from domain.inflection import Inflection
+
+DEFAULT_MAX_SIZE = 2048
+DEFAULT_FAILURE_TTL_SECONDS = 60.0
+
+CacheKey = tuple[str, str, str, str]
+
+
+class Failure:
+    """
+    A cached conjugation failure.
+
+    Attributes:
+        reason: The reason the conjugation failed.
+        expires_at: Clock time after which the failure is no longer cached.
+    """
+
+    __slots__ = ("reason", "expires_at")
+
+    def __init__(self, reason: str, expires_at: float):
+        self.reason = reason
+        self.expires_at = expires_at
+
+
+class ConjugationCache:
+    """
+    Thread-safe, bounded LRU cache of conjugation results and failures.
+
+    Successful results are kept until they are evicted as least recently used;
+    failures additionally expire after a TTL, so that a transient error does
+    not stick to a lemma for the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        failure_ttl: float = DEFAULT_FAILURE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached results and failures.
+            failure_ttl: Seconds for which a failure is cached.
+            clock: Monotonic clock used to expire failures.
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+
+        self.max_size = max_size
+        self.failure_ttl = failure_ttl
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, Union[list[Inflection], Failure]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Union[list[Inflection], Failure]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: The (language, lemma, mood, tense) to look up.
+
+        Returns:
+            A copy of the cached inflections, the cached Failure, or None if
+            nothing (or only an expired failure) is cached for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if isinstance(entry, Failure):
+                if entry.expires_at <= self._clock():
+                    del self._entries[key]
+                    return None
+                self._entries.move_to_end(key)
+                return entry
+
+            self._entries.move_to_end(key)
+            return list(entry)
+
+    def put(self, key: CacheKey, inflections: list[Inflection]) -> None:
+        """
+        Cache the inflections for a key.
+
+        Args:
+            key: The (language, lemma, mood, tense) that was conjugated.
+            inflections: The merged inflections of the conjugation.
+        """
+        self._store(key, list(inflections))
+
+    def put_failure(self, key: CacheKey, reason: str) -> None:
+        """
+        Cache a conjugation failure for the failure TTL.
+
+        Args:
+            key: The (language, lemma, mood, tense) that failed to conjugate.
+            reason: The reason the conjugation failed.
+        """
+        self._store(key, Failure(reason, self._clock() + self.failure_ttl))
+
+    def _store(self, key: CacheKey, entry: Union[list[Inflection], Failure]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results and failures."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = ConjugationCache(
+    max_size=int(os.getenv("CONJUGATION_CACHE_SIZE", DEFAULT_MAX_SIZE)),
+    failure_ttl=float(
+        os.getenv("CONJUGATION_FAILURE_TTL_SECONDS", DEFAULT_FAILURE_TTL_SECONDS)
+    ),
+)
+
+
+def get_cache() -> ConjugationCache:
+    """Get the process-wide conjugation cache."""
+    return _cache
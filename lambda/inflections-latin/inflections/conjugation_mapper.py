@@ -9,11 +9,30 @@ from typing import Optional
 
 from domain.feature import Feature, Gender, Number, Person
 from domain.inflection import Inflection
-from verbecc import Conjugation
+from verbecc import Conjugation, TenseConjugation
 from verbecc.src.defs.types.gender import Gender as VerbeccGender
 from verbecc.src.defs.types.number import Number as VerbeccNumber
 from verbecc.src.defs.types.person import Person as VerbeccPerson
 
+_PERSONS: dict[Optional[VerbeccPerson], Optional[Person]] = {
+    None: None,
+    VerbeccPerson.First: Person.FIRST,
+    VerbeccPerson.Second: Person.SECOND,
+    VerbeccPerson.Third: Person.THIRD,
+}
+
+_NUMBERS: dict[Optional[VerbeccNumber], Optional[Number]] = {
+    None: None,
+    VerbeccNumber.Singular: Number.SING,
+    VerbeccNumber.Plural: Number.PLUR,
+}
+
+_GENDERS: dict[Optional[VerbeccGender], Optional[Gender]] = {
+    None: None,
+    VerbeccGender.m: Gender.MASC,
+    VerbeccGender.f: Gender.FEM,
+}
+
 
 class ConjugationMappingError(Exception):
     """Raised when a Conjugation cannot be mapped to an Inflection."""
@@ -36,20 +55,11 @@ def _map_person(verbecc_person: Optional[VerbeccPerson]) -> Optional[Person]:
     Raises:
         ConjugationMappingError: If the person value is not recognized.
     """
-    if verbecc_person is None:
-        return None
-
-    mapping = {
-        VerbeccPerson.First: Person.FIRST,
-        VerbeccPerson.Second: Person.SECOND,
-        VerbeccPerson.Third: Person.THIRD,
-    }
-
-    if verbecc_person not in mapping:
+    try:
+        return _PERSONS[verbecc_person]
+    except KeyError:
         raise ConjugationMappingError(f"Unknown person value: {verbecc_person}")
 
-    return mapping[verbecc_person]
-
 
 def _map_number(verbecc_number: Optional[VerbeccNumber]) -> Optional[Number]:
     """
@@ -64,19 +74,11 @@ def _map_number(verbecc_number: Optional[VerbeccNumber]) -> Optional[Number]:
     Raises:
         ConjugationMappingError: If the number value is not recognized.
     """
-    if verbecc_number is None:
-        return None
-
-    mapping = {
-        VerbeccNumber.Singular: Number.SING,
-        VerbeccNumber.Plural: Number.PLUR,
-    }
-
-    if verbecc_number not in mapping:
+    try:
+        return _NUMBERS[verbecc_number]
+    except KeyError:
         raise ConjugationMappingError(f"Unknown number value: {verbecc_number}")
 
-    return mapping[verbecc_number]
-
 
 def _map_gender(verbecc_gender: Optional[VerbeccGender]) -> Optional[Gender]:
     """
@@ -91,19 +93,11 @@ def _map_gender(verbecc_gender: Optional[VerbeccGender]) -> Optional[Gender]:
     Raises:
         ConjugationMappingError: If the gender value is not recognized.
     """
-    if verbecc_gender is None:
-        return None
-
-    mapping = {
-        VerbeccGender.m: Gender.MASC,
-        VerbeccGender.f: Gender.FEM,
-    }
-
-    if verbecc_gender not in mapping:
+    try:
+        return _GENDERS[verbecc_gender]
+    except KeyError:
         raise ConjugationMappingError(f"Unknown gender value: {verbecc_gender}")
 
-    return mapping[verbecc_gender]
-
 
 def map_conjugation(conjugation: Conjugation, lemma: str) -> Inflection:
     """
@@ -161,3 +155,65 @@ def map_conjugation(conjugation: Conjugation, lemma: str) -> Inflection:
         inflected=inflected_form,
         features=features,
     )
+
+
+def map_tense_conjugation(
+    tense_conjugation: TenseConjugation, lemma: str
+) -> list[Inflection]:
+    """
+    Map the conjugations of a tense to inflections, one per person/number.
+
+    Works in a single pass that creates each Inflection once: conjugations
+    that differ only in gender (e.g. "lui è" and "lei è") become one
+    inflection, "lui/lei è", without gender features.
+
+    Args:
+        tense_conjugation: The verbecc conjugations of a single tense.
+        lemma: The base/dictionary form of the verb.
+
+    Returns:
+        A list of Inflection objects in the order of their first conjugation.
+
+    Raises:
+        ConjugationMappingError: If the lemma is empty, a conjugation has no
+                                 conjugated forms, or contains unrecognized
+                                 feature values.
+    """
+    if not lemma or not lemma.strip():
+        raise ConjugationMappingError("Lemma cannot be empty")
+    lemma = lemma.strip()
+
+    # (person, number) -> [pronoun, verb] of the first conjugation, or
+    # [None, form] if that form has no pronoun
+    rows: dict[tuple[Optional[Person], Optional[Number]], list] = {}
+
+    for conjugation in tense_conjugation:
+        conjugations = conjugation.get_conjugations()
+        if not conjugations:
+            raise ConjugationMappingError(
+                "Conjugation has no inflected forms", conjugation
+            )
+        # Validates the gender, which is then dropped by merging
+        _map_gender(conjugation.get_gender())
+
+        key = (
+            _map_person(conjugation.get_person()),
+            _map_number(conjugation.get_number()),
+        )
+        pronoun, separator, verb = conjugations[0].partition(" ")
+
+        row = rows.get(key)
+        if row is None:
+            rows[key] = [pronoun, verb] if separator else [None, conjugations[0]]
+        elif row[0] is not None and separator and verb == row[1]:
+            # Same verb form with another pronoun, e.g. "lei è" after "lui è"
+            row[0] = f"{row[0]}/{pronoun}"
+
+    return [
+        Inflection.model_construct(
+            lemma=lemma,
+            inflected=inflected if pronoun is None else f"{pronoun} {inflected}",
+            features={feature for feature in key if feature is not None},
+        )
+        for key, (pronoun, inflected) in rows.items()
+    ]
@@ -0,0 +1,51 @@
+"""
+Serialization of conjugations for responses.
+
+Shared by the Lambda handler and bulk conjugation, so that both answer a
+request item with the same body.
+"""
+
+from domain.inflection import Inflections, Paradigm
+from domain.inflection_request import InflectionRequest
+from inflector import Inflector
+
+
+def conjugate(request: InflectionRequest, inflector: Inflector) -> dict:
+    """
+    Conjugate the verb of a request and serialize the result.
+
+    Args:
+        request: The inflection request.
+        inflector: The Inflector for the request's language.
+
+    Returns:
+        The serialized inflections, or the serialized paradigm if the request
+        lists several moods and tenses.
+
+    Raises:
+        InflectionError: If the verb cannot be conjugated.
+    """
+    if request.tenses:
+        return Paradigm(
+            part_of_speech=request.part_of_speech,
+            lemma=request.lemma,
+            tenses=inflector.inflect_tenses(
+                lemma=request.lemma,
+                mood_tenses=[(t.mood, t.tense) for t in request.tenses],
+            ),
+        ).json()
+
+    return Inflections(
+        part_of_speech=request.part_of_speech,
+        lemma=request.lemma,
+        inflections=inflector.inflect(lemma=request.lemma),
+    ).json()
+
+
+def item_error(request: InflectionRequest, error: str) -> dict:
+    """Serialize the error of a request item."""
+    return {
+        "partOfSpeech": request.part_of_speech.name,
+        "lemma": request.lemma,
+        "error": error,
+    }
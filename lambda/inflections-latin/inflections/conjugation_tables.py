@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Precomputed conjugation tables for high-frequency verbs.
+
+Learners mostly look up the same few thousand verbs. This module conjugates
+a frequency list per language ahead of time and stores the merged
+person/number tables, already serialized for the response, in a compact
+indexed file per language. Lookups read a single compressed entry from the
+memory-mapped file and never touch verbecc.
+
+File layout:
+    4 bytes   magic number (b"CJT1")
+    4 bytes   length of the index, big-endian
+    n bytes   index: JSON object mapping "lemma<TAB>mood<TAB>tense" to
+              [offset, length] of its entry, relative to the end of the index
+    ...       entries: zlib-compressed JSON arrays of serialized inflections
+
+Usage:
+    python conjugation_tables.py <output_dir> <language> <frequency_list> \\
+        [--tenses indicative:present indicative:future ...]
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CJT1"
+_HEADER = struct.Struct(">4sI")
+
+
+def _key(lemma: str, mood: str, tense: str) -> str:
+    return f"{lemma}\t{mood}\t{tense}"
+
+
+def table_path(directory: Path, language: str) -> Path:
+    """Get the path of a language's conjugation table within a directory."""
+    return Path(directory) / f"conjugations-{language}.bin"
+
+
+class ConjugationTable:
+    """
+    Read-only view of a conjugation table file.
+
+    The index is read when the table is opened; entries are decompressed
+    on lookup.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a conjugation table.
+
+        Args:
+            path: The path of the table file.
+
+        Raises:
+            ValueError: If the file is not a conjugation table.
+        """
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = _HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a conjugation table")
+
+        self._entries_offset = _HEADER.size + index_length
+        self._index: dict[str, list[int]] = json.loads(
+            self._data[_HEADER.size : self._entries_offset]
+        )
+
+    def get(self, lemma: str, mood: str, tense: str) -> Optional[list[dict]]:
+        """
+        Look up the serialized inflections of a verb in a mood and tense.
+
+        Returns:
+            The inflections as serialized by Inflection.json(), or None if
+            the table does not contain the conjugation.
+        """
+        location = self._index.get(_key(lemma, mood, tense))
+        if location is None:
+            return None
+
+        offset, length = location
+        start = self._entries_offset + offset
+        return json.loads(zlib.decompress(self._data[start : start + length]))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def write_table(path: Path, tables: dict[tuple[str, str, str], list[dict]]) -> None:
+    """
+    Write a conjugation table file.
+
+    Args:
+        path: The path of the file to write.
+        tables: Serialized inflections, keyed by (lemma, mood, tense).
+    """
+    index = {}
+    entries = bytearray()
+    for (lemma, mood, tense), inflections in tables.items():
+        entry = zlib.compress(
+            json.dumps(inflections, ensure_ascii=False, separators=(",", ":")).encode(),
+            level=9,
+        )
+        index[_key(lemma, mood, tense)] = [len(entries), len(entry)]
+        entries += entry
+
+    encoded_index = json.dumps(
+        index, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(encoded_index)))
+        f.write(encoded_index)
+        f.write(entries)
+
+
+def build(
+    directory: Path,
+    language: str,
+    lemmas: list[str],
+    mood_tenses: list[tuple[str, str]],
+) -> Path:
+    """
+    Conjugate a list of verbs and write the language's conjugation table.
+
+    Verbs that cannot be conjugated in a mood and tense are left out, so
+    that requests for them fall back to live conjugation.
+
+    Args:
+        directory: The directory to write the table to.
+        language: The language of the verbs.
+        lemmas: The verbs to conjugate, most frequent first.
+        mood_tenses: The (mood, tense) pairs to conjugate each verb in.
+
+    Returns:
+        The path of the written table.
+    """
+    # Only the build needs verbecc; serving tables must not load it
+    from inflector import ConjugationError, Inflector
+
+    inflector = Inflector(language)
+    tables = {}
+    for lemma in dict.fromkeys(lemma.strip() for lemma in lemmas if lemma.strip()):
+        for mood, tense in mood_tenses:
+            try:
+                tense_inflections = inflector.inflect_tenses(lemma, [(mood, tense)])
+            except ConjugationError as e:
+                logger.warning(f"Skipping {lemma} ({mood} {tense}): {e.reason}")
+                continue
+            tables[(lemma, mood, tense)] = [
+                inflection.json() for inflection in tense_inflections[0].inflections
+            ]
+
+    path = table_path(directory, language)
+    write_table(path, tables)
+    return path
+
+
+class ConjugationTables:
+    """
+    The conjugation tables of all languages in a directory.
+
+    Each language's table is opened on its first lookup.
+    """
+
+    def __init__(self, directory: Optional[Path]):
+        """
+        Args:
+            directory: The directory containing the tables, or None to serve
+                       every lookup as a miss.
+        """
+        self._directory = Path(directory) if directory else None
+        self._tables: dict[str, Optional[ConjugationTable]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, language: str, lemma: str, mood: str, tense: str
+    ) -> Optional[list[dict]]:
+        """
+        Look up the serialized inflections of a verb in a mood and tense.
+
+        Returns:
+            The inflections as serialized by Inflection.json(), or None if
+            there is no table for the language or it lacks the conjugation.
+        """
+        table = self._table(language)
+        if table is None:
+            return None
+        return table.get(lemma, mood, tense)
+
+    def _table(self, language: str) -> Optional[ConjugationTable]:
+        if language in self._tables:
+            return self._tables[language]
+
+        # Languages come from the request path; never look outside the directory
+        if not language.isalpha():
+            return None
+
+        with self._lock:
+            if language not in self._tables:
+                self._tables[language] = self._open(language)
+            return self._tables[language]
+
+    def _open(self, language: str) -> Optional[ConjugationTable]:
+        if self._directory is None:
+            return None
+
+        path = table_path(self._directory, language)
+        if not path.is_file():
+            return None
+
+        try:
+            table = ConjugationTable(path)
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Ignoring conjugation table {path}: {e}")
+            return None
+
+        logger.info(f"Opened conjugation table {path} with {len(table)} entries")
+        return table
+
+
+_tables = ConjugationTables(os.getenv("CONJUGATION_TABLES_DIR"))
+
+
+def get_tables() -> ConjugationTables:
+    """Get the conjugation tables configured via CONJUGATION_TABLES_DIR."""
+    return _tables
+
+
+def _parse_mood_tense(value: str) -> tuple[str, str]:
+    mood, _, tense = value.partition(":")
+    if not tense:
+        raise argparse.ArgumentTypeError(f"Expected <mood>:<tense>, got '{value}'")
+    return mood, tense
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a conjugation table")
+    parser.add_argument("output_dir", type=Path, help="Directory to write to")
+    parser.add_argument("language", help="Language code, e.g. it")
+    parser.add_argument("frequency_list", type=Path, help="File with one verb per line")
+    parser.add_argument(
+        "--tenses",
+        nargs="+",
+        type=_parse_mood_tense,
+        default=[("indicative", "present")],
+        help="<mood>:<tense> pairs to conjugate (default: indicative:present)",
+    )
+    args = parser.parse_args()
+
+    lemmas = args.frequency_list.read_text(encoding="utf-8").splitlines()
+    path = build(args.output_dir, args.language, lemmas, args.tenses)
+    print(f"{args.language}: {path} ({path.stat().st_size / 1e3:.1f} kB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Process-wide registry of verbecc conjugators.
+
+Constructing a CompleteConjugator loads the trained model for its language,
+which takes far longer than conjugating a verb. This module constructs each
+conjugator once, on first use, and shares it for the lifetime of the process
+(i.e. across invocations of a warm Lambda).
+
+If the CONJUGATOR_SNAPSHOT_DIR environment variable is set, conjugators are
+loaded from the snapshots built into the image (see conjugator_snapshot),
+falling back to constructing them from the trained model archives.
+
+A loaded model takes 50-150 MB of memory. The number of loaded conjugators
+is bounded by the MAX_LOADED_CONJUGATORS environment variable (default: 3,
+0 for no bound); the least recently used conjugator is dropped when another
+language is loaded.
+
+Models load outside the registry lock, so that a language that is loading
+does not block requests for languages that are already loaded. Concurrent
+requests for the same language wait for a single load.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import conjugator_snapshot
+from verbecc import CompleteConjugator, LangCodeISO639_1
+
+logger = logging.getLogger(__name__)
+
+# Three models fit into a 1024 MB Lambda with room for loading another one
+DEFAULT_MAX_LOADED = 3
+
+_conjugators: OrderedDict[LangCodeISO639_1, CompleteConjugator] = OrderedDict()
+# Guards _conjugators and _load_locks; held only briefly, never while a model loads
+_lock = threading.Lock()
+# Serializes the loading of each language
+_load_locks: dict[LangCodeISO639_1, threading.Lock] = {}
+_max_loaded: Optional[int] = (
+    int(os.getenv("MAX_LOADED_CONJUGATORS", DEFAULT_MAX_LOADED)) or None
+)
+_snapshot_dir: Optional[str] = os.getenv("CONJUGATOR_SNAPSHOT_DIR")
+
+
+def get_conjugator(language: LangCodeISO639_1) -> CompleteConjugator:
+    """
+    Get the conjugator for a language, constructing it on first use.
+
+    Args:
+        language: The language to conjugate verbs in.
+
+    Returns:
+        The shared CompleteConjugator for the language.
+    """
+    with _lock:
+        conjugator = _lookup(language)
+        if conjugator is not None:
+            return conjugator
+        load_lock = _load_locks.setdefault(language, threading.Lock())
+
+    with load_lock:
+        with _lock:
+            # Another thread may have loaded the language in the meantime
+            conjugator = _lookup(language)
+            if conjugator is not None:
+                return conjugator
+            # Make room first, so that the bound holds while the model loads
+            _evict(keep=(_max_loaded or 0) - 1)
+
+        conjugator = _load(language)
+
+        with _lock:
+            _conjugators[language] = conjugator
+            # Other languages may have loaded concurrently
+            _evict(keep=_max_loaded or 0)
+            return conjugator
+
+
+def _lookup(language: LangCodeISO639_1) -> Optional[CompleteConjugator]:
+    """Get a loaded conjugator and mark it as most recently used. Requires _lock."""
+    conjugator = _conjugators.get(language)
+    if conjugator is not None:
+        _conjugators.move_to_end(language)
+    return conjugator
+
+
+def _load(language: LangCodeISO639_1) -> CompleteConjugator:
+    """Load a conjugator from its snapshot, or construct it if there is none."""
+    if _snapshot_dir:
+        conjugator = conjugator_snapshot.load(Path(_snapshot_dir), language)
+        if conjugator is not None:
+            logger.info(f"Loaded conjugator snapshot for language: {language}")
+            return conjugator
+
+    logger.info(f"Initializing conjugator for language: {language}")
+    return CompleteConjugator(language)
+
+
+def _evict(keep: int) -> None:
+    """Drop the least recently used conjugators until at most `keep` remain."""
+    while _max_loaded is not None and len(_conjugators) > keep:
+        language, _ = _conjugators.popitem(last=False)
+        logger.info(f"Dropping conjugator for language: {language}")
+
+
+def loaded_languages() -> list[LangCodeISO639_1]:
+    """List the languages with a constructed conjugator, least recently used first."""
+    return list(_conjugators)
+
+
+def is_loaded(language: LangCodeISO639_1) -> bool:
+    """Check whether the conjugator for a language has been constructed."""
+    return language in _conjugators
+
+
+def clear() -> None:
+    """Drop all conjugators, e.g. to measure construction cost."""
+    with _lock:
+        _conjugators.clear()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Pre-built snapshots of verbecc conjugators.
+
+Constructing a CompleteConjugator parses the verb and conjugation template
+XML and unpickles the trained model from its zip archive; most of that time
+is spent parsing XML. A snapshot is the fully constructed conjugator, pickled
+at image build time, which loads several times faster and with a lower
+memory peak.
+
+Snapshots are only valid for the verbecc and Python versions that wrote them
+and are loaded with pickle, so they must be built alongside the application
+(see the Dockerfile) and never come from untrusted sources.
+
+Usage:
+    python conjugator_snapshot.py <output_dir> <language> [<language> ...]
+"""
+
+import argparse
+import gc
+import logging
+import pickle
+import platform
+from importlib.metadata import version
+from pathlib import Path
+from typing import Optional
+
+from verbecc import CompleteConjugator, LangCodeISO639_1
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint() -> tuple[str, str]:
+    """Identify the library versions a snapshot is compatible with."""
+    return version("verbecc"), platform.python_version()
+
+
+def snapshot_path(directory: Path, language: LangCodeISO639_1) -> Path:
+    """Get the path of a language's snapshot within a directory."""
+    return Path(directory) / f"conjugator-{language.value}.pickle"
+
+
+def save(directory: Path, language: LangCodeISO639_1) -> Path:
+    """
+    Construct the conjugator for a language and write its snapshot.
+
+    Args:
+        directory: The directory to write the snapshot to.
+        language: The language of the conjugator.
+
+    Returns:
+        The path of the written snapshot.
+    """
+    path = snapshot_path(directory, language)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conjugator = CompleteConjugator(language)
+    with open(path, "wb") as f:
+        pickle.dump((_fingerprint(), conjugator), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    logger.info(f"Wrote conjugator snapshot for language {language} to {path}")
+    return path
+
+
+def load(directory: Path, language: LangCodeISO639_1) -> Optional[CompleteConjugator]:
+    """
+    Load the conjugator for a language from its snapshot.
+
+    Args:
+        directory: The directory containing the snapshots.
+        language: The language of the conjugator.
+
+    Returns:
+        The conjugator, or None if there is no readable snapshot for the
+        language or it was written by other library versions.
+    """
+    path = snapshot_path(directory, language)
+    if not path.is_file():
+        return None
+
+    # Unpickling allocates millions of objects; collecting garbage while
+    # doing so only slows it down, as none of them are garbage yet.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as f:
+            fingerprint, conjugator = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable conjugator snapshot {path}: {e}")
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    if fingerprint != _fingerprint():
+        logger.warning(
+            f"Ignoring conjugator snapshot {path}: written by verbecc/Python "
+            f"{fingerprint}, running {_fingerprint()}"
+        )
+        return None
+
+    return conjugator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write verbecc conjugator snapshots")
+    parser.add_argument("output_dir", type=Path, help="Directory to write to")
+    parser.add_argument(
+        "languages", nargs="+", type=LangCodeISO639_1, help="Language codes"
+    )
+    args = parser.parse_args()
+
+    for language in args.languages:
+        path = save(args.output_dir, language)
+        print(f"{language.value}: {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
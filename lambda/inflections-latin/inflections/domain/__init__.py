@@ -6,8 +6,8 @@ parts of speech, and inflection models.
 """
 
 from .feature import Case, Feature, Gender, Number, Person, Tense
-from .inflection import Inflection, Inflections
-from .inflection_request import InflectionRequest
+from .inflection import Inflection, Inflections, Paradigm, TenseInflections
+from .inflection_request import InflectionRequest, MoodTense
 from .part_of_speech import PartOfSpeech
 
 __all__ = [
@@ -19,6 +19,9 @@ __all__ = [
     "Tense",
     "Inflection",
     "Inflections",
+    "Paradigm",
+    "TenseInflections",
     "InflectionRequest",
+    "MoodTense",
     "PartOfSpeech",
 ]
@@ -55,3 +55,49 @@ class Inflections(BaseModel):
             "lemma": self.lemma,
             "inflections": [inflection.json() for inflection in self.inflections],
         }
+
+
+class TenseInflections(BaseModel):
+    """
+    All inflections of a word in a single mood and tense.
+
+    Attributes:
+        mood: The grammatical mood, e.g. "indicative".
+        tense: The tense, e.g. "present".
+        inflections: List of all inflected forms in this mood and tense.
+    """
+
+    mood: str
+    tense: str
+    inflections: list[Inflection]
+
+    def json(self, **kwargs) -> dict:
+        """Serialize the tense inflections to a JSON-compatible dictionary."""
+        return {
+            "mood": self.mood,
+            "tense": self.tense,
+            "inflections": [inflection.json() for inflection in self.inflections],
+        }
+
+
+class Paradigm(BaseModel):
+    """
+    Container for the inflections of a word in several moods and tenses.
+
+    Attributes:
+        part_of_speech: The part of speech of the word.
+        lemma: The dictionary/base form of the word.
+        tenses: The inflections per requested mood and tense, in request order.
+    """
+
+    part_of_speech: PartOfSpeech
+    lemma: str
+    tenses: list[TenseInflections]
+
+    def json(self, **kwargs) -> dict:
+        """Serialize the paradigm to a JSON-compatible dictionary."""
+        return {
+            "partOfSpeech": self.part_of_speech.name,
+            "lemma": self.lemma,
+            "tenses": [tense.json() for tense in self.tenses],
+        }
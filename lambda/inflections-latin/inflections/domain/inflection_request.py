@@ -2,11 +2,26 @@
 Request models for the inflection API.
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from .part_of_speech import PartOfSpeech
 
 
+class MoodTense(BaseModel):
+    """
+    A mood/tense combination to conjugate a verb in.
+
+    Attributes:
+        mood: The grammatical mood in English, e.g. "indicative".
+        tense: The tense in English, e.g. "present".
+    """
+
+    mood: str
+    tense: str
+
+
 class InflectionRequest(BaseModel):
     """
     Request model for inflection operations.
@@ -14,7 +29,10 @@ class InflectionRequest(BaseModel):
     Attributes:
         lemma: The base form of the word to inflect.
         part_of_speech: The part of speech of the word (aliased as 'pos' in JSON).
+        tenses: Optional mood/tense combinations to conjugate the verb in.
+                If omitted, the indicative present is returned.
     """
 
     lemma: str
     part_of_speech: PartOfSpeech = Field(..., alias="pos")
+    tenses: Optional[list[MoodTense]] = Field(default=None, min_length=1)
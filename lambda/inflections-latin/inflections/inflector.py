@@ -5,19 +5,35 @@ This module provides functionality to conjugate verbs in Romance languages
 (Italian, French, Spanish, Portuguese, Romanian) using the verbecc library.
 """
 
+import functools
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
-from conjugation_mapper import map_conjugation
-from domain.feature import Number, Person
-from domain.inflection import Inflection
+import conjugation_cache
+import conjugator_registry
+from conjugation_mapper import map_tense_conjugation
+from domain.inflection import Inflection, TenseInflections
 from domain.language import LanguageCode
-from verbecc import CompleteConjugator, LangCodeISO639_1, TenseConjugation, localization
+from verbecc import (
+    InvalidMoodError,
+    InvalidTenseError,
+    LangCodeISO639_1,
+    Mood,
+    MoodsConjugation,
+    Tense,
+    TenseConjugation,
+    localization,
+)
 
 # Default mood and tense for conjugation
 DEFAULT_MOOD = "indicative"
 DEFAULT_TENSE = "present"
 
+# Minimum number of requested mood/tense combinations for which a single
+# complete conjugation (all moods and tenses) is cheaper than conjugating each
+# combination separately. Both cost about the same for a full verb table.
+COMPLETE_CONJUGATION_MIN_TENSES = 12
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,11 +73,16 @@ class Inflector:
 
     This class provides functionality to conjugate verbs in Romance languages
     (Italian, French, Spanish, Portuguese, Romanian) based on mood and tense.
+    The underlying verbecc conjugator is shared process-wide per language
+    (see conjugator_registry), so constructing an Inflector is cheap.
+    Conjugation results and failures are cached process-wide as well
+    (see conjugation_cache).
 
     Attributes:
         language: The ISO 639-1 language code for conjugation.
         mood: The grammatical mood for conjugation (default: indicative).
         tense: The tense for conjugation (default: present).
+        cache_stats: Cache hits, misses and failure hits of this Inflector.
     """
 
     def __init__(
@@ -98,8 +119,9 @@ class Inflector:
         self.mood = mood
         self.tense = tense
 
-        logger.info(f"Initializing conjugator for language: {self.language}")
-        self._conjugator = CompleteConjugator(self.language)
+        self._conjugator = conjugator_registry.get_conjugator(self.language)
+        self._cache = conjugation_cache.get_cache()
+        self.cache_stats = {"hits": 0, "misses": 0, "failure_hits": 0}
 
     def inflect(self, lemma: str) -> list[Inflection]:
         """
@@ -117,128 +139,148 @@ class Inflector:
         Raises:
             ConjugationError: If the verb cannot be conjugated.
         """
-        if not lemma or not lemma.strip():
-            raise ConjugationError(lemma, self.language, "Lemma cannot be empty")
+        lemma = self._validate_lemma(lemma)
+
+        cached = self._lookup(lemma, self.mood, self.tense)
+        if cached is not None:
+            return cached
+
+        return self._remember(
+            lemma, self.mood, self.tense, lambda: self._conjugate(lemma)
+        )
+
+    def inflect_tenses(
+        self, lemma: str, mood_tenses: list[tuple[str, str]]
+    ) -> list[TenseInflections]:
+        """
+        Conjugate a verb in several moods and tenses at once.
+
+        If at least COMPLETE_CONJUGATION_MIN_TENSES combinations are not cached
+        yet, they are answered from a single complete conjugation of the verb;
+        otherwise each missing mood/tense combination is conjugated on its own.
+
+        Args:
+            lemma: The infinitive form of the verb to conjugate.
+            mood_tenses: (mood, tense) pairs in English, e.g. ("indicative", "future").
+
+        Returns:
+            A TenseInflections object per requested mood/tense, in request order.
 
-        lemma = lemma.strip()
+        Raises:
+            ConjugationError: If the verb cannot be conjugated in any of the
+                              requested moods and tenses.
+        """
+        lemma = self._validate_lemma(lemma)
+
+        results: dict[tuple[str, str], list[Inflection]] = {}
+        missing = []
+        for mood, tense in dict.fromkeys(mood_tenses):
+            cached = self._lookup(lemma, mood, tense)
+            if cached is None:
+                missing.append((mood, tense))
+            else:
+                results[(mood, tense)] = cached
 
-        # Perform the conjugation
-        tense_conjugation = self._conjugate(lemma)
+        if len(missing) >= COMPLETE_CONJUGATION_MIN_TENSES:
+            moods = self._conjugate_complete(lemma)
+            for mood, tense in missing:
+                results[(mood, tense)] = self._remember(
+                    lemma,
+                    mood,
+                    tense,
+                    lambda: self._select_mood_tense(lemma, moods, mood, tense),
+                )
+        else:
+            for mood, tense in missing:
+                results[(mood, tense)] = self._remember(
+                    lemma,
+                    mood,
+                    tense,
+                    lambda: self._conjugate_mood_tense(lemma, mood, tense),
+                )
 
-        # Map verbecc Conjugation objects to domain Inflection objects
-        inflections = [
-            map_conjugation(conjugation, lemma) for conjugation in tense_conjugation
+        return [
+            TenseInflections(
+                mood=mood, tense=tense, inflections=list(results[(mood, tense)])
+            )
+            for mood, tense in mood_tenses
         ]
 
-        # Merge inflections that differ only in gender (same person/number)
-        merged_inflections = self._merge_by_person_number(inflections)
+    def _lookup(self, lemma: str, mood: str, tense: str) -> Optional[list[Inflection]]:
+        """
+        Look up the cached inflections of a verb in a mood and tense.
 
-        return merged_inflections
+        Returns:
+            The cached inflections, or None if the conjugation is not cached.
 
-    @staticmethod
-    def _merge_by_person_number(inflections: list[Inflection]) -> list[Inflection]:
+        Raises:
+            ConjugationError: If a recent failure of the conjugation is cached.
         """
-        Merge inflections that have the same person/number but different genders.
+        cached = self._cache.get((self.language, lemma, mood, tense))
+
+        if cached is None:
+            self.cache_stats["misses"] += 1
+            return None
+
+        if isinstance(cached, conjugation_cache.Failure):
+            self.cache_stats["failure_hits"] += 1
+            raise ConjugationError(lemma, self.language, cached.reason)
+
+        self.cache_stats["hits"] += 1
+        return cached
 
-        In Romance languages, third-person conjugations may have separate forms
-        for masculine (lui è) and feminine (lei è) pronouns, but the verb form
-        is the same. This method merges such inflections by combining their
-        inflected forms with a "/" separator.
+    def _remember(
+        self,
+        lemma: str,
+        mood: str,
+        tense: str,
+        conjugate: Callable[[], TenseConjugation],
+    ) -> list[Inflection]:
+        """
+        Conjugate a verb in a mood and tense and cache the result or failure.
 
         Args:
-            inflections: List of Inflection objects to merge.
+            lemma: The infinitive form of the verb to conjugate.
+            mood: The mood in English, e.g. "indicative".
+            tense: The tense in English, e.g. "present".
+            conjugate: Performs the conjugation of the mood and tense.
 
         Returns:
-            List of merged Inflection objects, grouped by person/number.
+            A list of Inflection objects, one for each person/number combination.
+
+        Raises:
+            ConjugationError: If the conjugation fails.
         """
-        if not inflections:
-            return inflections
+        key = (self.language, lemma, mood, tense)
 
-        # Group inflections by (person, number) key
-        grouped: dict[tuple[Optional[Person], Optional[Number]], list[Inflection]] = {}
+        try:
+            inflections = map_tense_conjugation(conjugate(), lemma)
+        except ConjugationError as e:
+            self._cache.put_failure(key, e.reason)
+            raise
 
-        for inflection in inflections:
-            # Extract person and number from features
-            person = next(
-                (f for f in inflection.features if isinstance(f, Person)), None
-            )
-            number = next(
-                (f for f in inflection.features if isinstance(f, Number)), None
-            )
-            key = (person, number)
-
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(inflection)
-
-        # Merge each group
-        merged: list[Inflection] = []
-        for (person, number), group in grouped.items():
-            if len(group) == 1:
-                # No merging needed - just remove gender from features
-                inflection = group[0]
-                features = {
-                    f for f in inflection.features if isinstance(f, (Person, Number))
-                }
-                merged.append(
-                    Inflection(
-                        lemma=inflection.lemma,
-                        inflected=inflection.inflected,
-                        features=features,
-                    )
-                )
-            else:
-                # Multiple inflections for same person/number - merge them
-                # Combine unique inflected forms with "/"
-                unique_forms: list[str] = []
-                for inf in group:
-                    # Extract pronoun and verb parts
-                    parts = inf.inflected.split(" ", 1)
-                    if len(parts) == 2:
-                        pronoun, verb = parts
-                        # Check if we already have this verb with a different pronoun
-                        existing_idx = None
-                        for idx, form in enumerate(unique_forms):
-                            form_parts = form.split(" ", 1)
-                            if len(form_parts) == 2 and form_parts[1] == verb:
-                                existing_idx = idx
-                                break
-                        if existing_idx is not None:
-                            # Merge pronouns
-                            existing_parts = unique_forms[existing_idx].split(" ", 1)
-                            merged_pronoun = f"{existing_parts[0]}/{pronoun}"
-                            unique_forms[existing_idx] = f"{merged_pronoun} {verb}"
-                        else:
-                            unique_forms.append(inf.inflected)
-                    else:
-                        # No pronoun structure, just add if not duplicate
-                        if inf.inflected not in unique_forms:
-                            unique_forms.append(inf.inflected)
-
-                # Build merged features (only person and number)
-                features: set = set()
-                if person is not None:
-                    features.add(person)
-                if number is not None:
-                    features.add(number)
-
-                # Use first unique form (or merged form)
-                merged.append(
-                    Inflection(
-                        lemma=group[0].lemma,
-                        inflected=(
-                            unique_forms[0] if unique_forms else group[0].inflected
-                        ),
-                        features=features,
-                    )
-                )
+        self._cache.put(key, inflections)
+        return inflections
 
-        return merged
+    def _validate_lemma(self, lemma: str) -> str:
+        """
+        Strip a lemma and make sure it is not empty.
+
+        Raises:
+            ConjugationError: If the lemma is empty.
+        """
+        if not lemma or not lemma.strip():
+            raise ConjugationError(lemma, self.language, "Lemma cannot be empty")
+
+        return lemma.strip()
 
     def _conjugate(self, lemma: str) -> TenseConjugation:
         """
         Perform the actual verb conjugation using verbecc.
 
+        Only the configured mood and tense are computed, rather than every
+        mood and tense of the verb.
+
         Args:
             lemma: The infinitive form of the verb to conjugate.
 
@@ -248,37 +290,136 @@ class Inflector:
         Raises:
             ConjugationError: If the conjugation fails.
         """
-        try:
-            conjugation_result = self._conjugator.conjugate(lemma)
+        return self._conjugate_mood_tense(lemma, self.mood, self.tense)
 
-            # Navigate to the correct mood and tense in the conjugation result
-            localized_mood = localization.xmood(self.language, self.mood)
-            localized_tense = localization.xtense(self.language, self.tense)
+    def _conjugate_mood_tense(
+        self, lemma: str, mood: str, tense: str
+    ) -> TenseConjugation:
+        """
+        Conjugate a verb in a single mood and tense.
 
-            moods = conjugation_result.get_moods()
+        Args:
+            lemma: The infinitive form of the verb to conjugate.
+            mood: The mood in English, e.g. "indicative".
+            tense: The tense in English, e.g. "present".
 
-            if localized_mood not in moods:
-                raise ConjugationError(
-                    lemma,
-                    self.language,
-                    f"Mood '{self.mood}' ({localized_mood}) not available",
-                )
+        Returns:
+            A list of conjugated forms for each person/number combination.
 
-            tenses = moods[localized_mood]
+        Raises:
+            ConjugationError: If the conjugation fails.
+        """
+        localized_mood, localized_tense = self._localize(lemma, mood, tense)
 
-            if localized_tense not in tenses:
-                raise ConjugationError(
-                    lemma,
-                    self.language,
-                    f"Tense '{self.tense}' ({localized_tense}) not available "
-                    f"for mood '{self.mood}'",
-                )
+        try:
+            return self._conjugator.conjugate_mood_tense(
+                lemma, localized_mood, localized_tense
+            )
+        except (InvalidMoodError, KeyError) as e:
+            # Raised when the verb's conjugation template lacks the mood
+            raise self._mood_not_available(lemma, mood, localized_mood) from e
+        except InvalidTenseError as e:
+            raise self._tense_not_available(lemma, mood, tense, localized_tense) from e
+        except Exception as e:
+            # Wrap any other errors from verbecc
+            raise ConjugationError(lemma, self.language, str(e)) from e
 
-            return tenses[localized_tense]
+    def _conjugate_complete(self, lemma: str) -> MoodsConjugation:
+        """
+        Conjugate a verb in every mood and tense.
 
-        except ConjugationError:
-            # Re-raise our own errors
-            raise
+        Args:
+            lemma: The infinitive form of the verb to conjugate.
+
+        Returns:
+            The conjugations of the verb, keyed by localized mood and tense.
+
+        Raises:
+            ConjugationError: If the conjugation fails.
+        """
+        try:
+            return self._conjugator.conjugate(lemma).get_moods()
         except Exception as e:
-            # Wrap any other errors from verbecc
+            # Wrap any errors from verbecc
+            raise ConjugationError(lemma, self.language, str(e)) from e
+
+    def _select_mood_tense(
+        self, lemma: str, moods: MoodsConjugation, mood: str, tense: str
+    ) -> TenseConjugation:
+        """
+        Select a single mood and tense from a complete conjugation.
+
+        Args:
+            lemma: The infinitive form of the conjugated verb.
+            moods: The complete conjugation of the verb.
+            mood: The mood in English, e.g. "indicative".
+            tense: The tense in English, e.g. "present".
+
+        Returns:
+            A list of conjugated forms for each person/number combination.
+
+        Raises:
+            ConjugationError: If the mood or tense is not available.
+        """
+        localized_mood, localized_tense = self._localize(lemma, mood, tense)
+
+        if localized_mood not in moods:
+            raise self._mood_not_available(lemma, mood, localized_mood)
+
+        tenses = moods[localized_mood]
+
+        if localized_tense not in tenses:
+            raise self._tense_not_available(lemma, mood, tense, localized_tense)
+
+        return tenses[localized_tense]
+
+    def _localize(self, lemma: str, mood: str, tense: str) -> tuple[Mood, Tense]:
+        """
+        Translate a mood and tense into this inflector's language.
+
+        Raises:
+            ConjugationError: If the mood or tense is unknown.
+        """
+        try:
+            return _localize(self.language, mood, tense)
+        except KeyError as e:
             raise ConjugationError(lemma, self.language, str(e)) from e
+
+    def _mood_not_available(
+        self, lemma: str, mood: str, localized_mood: Mood
+    ) -> ConjugationError:
+        """Create the error for a mood that is not available for a verb."""
+        return ConjugationError(
+            lemma,
+            self.language,
+            f"Mood '{mood}' ({localized_mood}) not available",
+        )
+
+    def _tense_not_available(
+        self, lemma: str, mood: str, tense: str, localized_tense: Tense
+    ) -> ConjugationError:
+        """Create the error for a tense that is not available for a verb."""
+        return ConjugationError(
+            lemma,
+            self.language,
+            f"Tense '{tense}' ({localized_tense}) not available for mood '{mood}'",
+        )
+
+
+@functools.cache
+def _localize(language: LangCodeISO639_1, mood: str, tense: str) -> tuple[Mood, Tense]:
+    """
+    Translate an English mood and tense name into the language's verbecc names.
+
+    Args:
+        language: The language to translate into.
+        mood: The English mood name, e.g. "indicative".
+        tense: The English tense name, e.g. "present".
+
+    Returns:
+        The localized mood and tense.
+
+    Raises:
+        KeyError: If the mood or tense is unknown.
+    """
+    return localization.xmood(language, mood), localization.xtense(language, tense)
@@ -8,25 +8,58 @@ Spanish, Portuguese, Romanian).
 
 import json
 import logging
+import os
 
+import conjugation_cache
+import conjugation_response
+import conjugation_tables
 import feature_retriever
 import lambda_util
-from domain.inflection import Inflections
 from domain.inflection_request import InflectionRequest
-from inflector import InflectionError, Inflector
-from pydantic.v1 import ValidationError
+from inflector import DEFAULT_MOOD, DEFAULT_TENSE, InflectionError, Inflector
+from pydantic import ValidationError
 
 logger = logging.getLogger("root")
 logger.setLevel(logging.INFO)
 logging.getLogger("verbecc").setLevel(logging.WARNING)
 
 
+# LANGUAGE_CODE of images that contain the models of all languages
+ALL_LANGUAGES = "all"
+
+# Maximum number of items in a batch request
+MAX_BATCH_SIZE = 100
+
+
+def _prewarm(language: str | None) -> None:
+    """
+    Load the conjugator for the image's language during the Lambda init phase.
+
+    Images built for all languages load each conjugator on demand instead,
+    when the first request for its language arrives.
+
+    Args:
+        language: The LANGUAGE_CODE the image was built for, if any.
+    """
+    if not language or language == ALL_LANGUAGES:
+        return
+    try:
+        Inflector(language)
+    except InflectionError as e:
+        logger.warning(json.dumps({"success": False, "error": str(e)}))
+
+
+_prewarm(os.getenv("LANGUAGE_CODE"))
+
+
 def handler(event, _):
     """
     AWS Lambda handler function for verb conjugation requests.
 
     Processes incoming API Gateway events to conjugate Romance language verbs
-    in their configured mood and tense.
+    in their configured mood and tense, or in every mood and tense listed in
+    the request's "tenses" field. A body containing an array of requests is
+    processed as a batch (see _handle_batch).
 
     Args:
         event: AWS Lambda event object containing the HTTP request.
@@ -41,6 +74,10 @@ def handler(event, _):
             return keep_warm_response
 
         body = json.loads(event.get("body", {}))
+
+        if isinstance(body, list):
+            return _handle_batch(body, extract_language(event))
+
         try:
             request = InflectionRequest(**body)
         except ValidationError as e:
@@ -71,15 +108,16 @@ def handler(event, _):
 
         language = extract_language(event)
 
-        inflector = Inflector(language)
-        inflections = inflector.inflect(lemma=request.lemma)
+        # Frequent verbs are served from precomputed tables, without verbecc
+        if precomputed := _serve_precomputed(request, language):
+            logger.info(json.dumps({"language": language, "source": "precomputed"}))
+            return lambda_util.ok(precomputed)
 
-        inflections_container = Inflections(
-            part_of_speech=request.part_of_speech,
-            lemma=request.lemma,
-            inflections=inflections,
-        )
-        return lambda_util.ok(inflections_container.json())
+        inflector = Inflector(language)
+        try:
+            return lambda_util.ok(conjugation_response.conjugate(request, inflector))
+        finally:
+            _log_cache_stats(inflector)
 
     except InflectionError as e:
         # Handle expected inflection errors (unsupported language, conjugation failures)
@@ -95,6 +133,145 @@ def handler(event, _):
         return lambda_util.fail(500, "Encountered unexpected error")
 
 
+def _handle_batch(items: list, language: str) -> dict:
+    """
+    Conjugate a batch of verbs, e.g. all verbs of a sentence, in one invocation.
+
+    Items that are invalid or not verbs are answered with an error without
+    conjugating them, and duplicate items are conjugated only once. All
+    other items are conjugated with the language's shared conjugator.
+
+    Args:
+        items: The request items, each in the format of an InflectionRequest.
+        language: The language extracted from the request path.
+
+    Returns:
+        HTTP response with one result per item, in request order. Items that
+        could not be conjugated yield an object with an "error" message.
+    """
+    if len(items) > MAX_BATCH_SIZE:
+        logger.warning(
+            json.dumps(
+                {
+                    "success": False,
+                    "error": f"Batch of {len(items)} items exceeds {MAX_BATCH_SIZE}",
+                }
+            )
+        )
+        return lambda_util.fail(400, f"Batches are limited to {MAX_BATCH_SIZE} items")
+
+    results: dict[tuple, dict] = {}
+    response = []
+    inflector = None
+    precomputed_count = 0
+
+    for item in items:
+        try:
+            request = InflectionRequest(**item)
+        except (TypeError, ValidationError):
+            response.append({"error": "Invalid request item"})
+            continue
+
+        key = (
+            request.lemma.strip(),
+            request.part_of_speech,
+            tuple((t.mood, t.tense) for t in request.tenses or ()),
+        )
+        if key in results:
+            response.append(results[key])
+            continue
+
+        if not feature_retriever.is_word_inflectable(request.part_of_speech.value):
+            result = conjugation_response.item_error(
+                request,
+                f"Part of speech '{request.part_of_speech.value}' cannot be conjugated",
+            )
+        elif precomputed := _serve_precomputed(request, language):
+            precomputed_count += 1
+            result = precomputed
+        else:
+            try:
+                if inflector is None:
+                    inflector = Inflector(language)
+                result = conjugation_response.conjugate(request, inflector)
+            except InflectionError as e:
+                result = conjugation_response.item_error(request, str(e))
+
+        results[key] = result
+        response.append(result)
+
+    logger.info(
+        json.dumps(
+            {
+                "language": language,
+                "batch_size": len(items),
+                "unique_items": len(results),
+                "precomputed": precomputed_count,
+            }
+        )
+    )
+    if inflector is not None:
+        _log_cache_stats(inflector)
+
+    return lambda_util.ok(response)
+
+
+def _serve_precomputed(request: InflectionRequest, language: str) -> dict | None:
+    """
+    Build the response body from the precomputed conjugation tables.
+
+    Args:
+        request: The inflection request.
+        language: The language extracted from the request path.
+
+    Returns:
+        The response body, or None unless the tables contain every
+        requested mood and tense of the verb.
+    """
+    tables = conjugation_tables.get_tables()
+    lemma = request.lemma.strip()
+    mood_tenses = (
+        [(t.mood, t.tense) for t in request.tenses]
+        if request.tenses
+        else [(DEFAULT_MOOD, DEFAULT_TENSE)]
+    )
+
+    rows = []
+    for mood, tense in mood_tenses:
+        inflections = tables.get(language, lemma, mood, tense)
+        if inflections is None:
+            return None
+        rows.append(inflections)
+
+    body = {"partOfSpeech": request.part_of_speech.name, "lemma": request.lemma}
+    if not request.tenses:
+        return body | {"inflections": rows[0]}
+    return body | {
+        "tenses": [
+            {"mood": mood, "tense": tense, "inflections": inflections}
+            for (mood, tense), inflections in zip(mood_tenses, rows)
+        ]
+    }
+
+
+def _log_cache_stats(inflector: Inflector) -> None:
+    """
+    Log the conjugation cache hits and misses of a request.
+
+    Args:
+        inflector: The Inflector that served the request.
+    """
+    logger.info(
+        json.dumps(
+            {
+                "language": inflector.language.value,
+                "cache": inflector.cache_stats,
+                "cache_size": len(conjugation_cache.get_cache()),
+            }
+        )
+    )
+
+
 # todo: maybe doing this via environment variables is smarter
 def extract_language(event: dict):
     """
@@ -57,6 +57,6 @@ def check_keep_warm(event: dict[str, str]) -> Optional[dict]:
         A success response if this is a keep-warm request, None otherwise.
     """
     body = json.loads(event.get("body", "{}"))
-    if body.get("keep-warm") is not None:
+    if isinstance(body, dict) and body.get("keep-warm") is not None:
         return ok({"keep-warm": "success"})
     return None
@@ -5,8 +5,13 @@ CLI entry point for the Romance language verb conjugation service.
 This module provides a command-line interface that emulates the Lambda handler
 for local development and testing. Input is provided via a JSON file.
 
+It also provides bulk conjugation of lemma lists or NDJSON requests across a
+process pool, and parallel generation of the pre-trained models.
+
 Usage:
     python main.py <input.json>
+    python main.py bulk [<language>:]<input> [...] [--output results.ndjson]
+    python main.py generate-models [<language> ...]
 
 Example input.json:
     {
@@ -16,25 +21,36 @@ Example input.json:
 
 import argparse
 import json
+import logging
 import sys
+import time
+from pathlib import Path
 
-import lambda_handler
-from inflector import Inflector
+import bulk
 
 
 def main():
     """
     Main entry point for CLI execution.
 
-    Reads a JSON file containing a Lambda event and processes it
-    through the lambda_handler, printing the response.
+    Dispatches to the bulk and generate-models commands; otherwise reads a
+    JSON file containing a Lambda event and processes it through the
+    lambda_handler, printing the response.
     """
+    commands = {"bulk": bulk_main, "generate-models": generate_models}
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        command = sys.argv.pop(1)
+        commands[command]()
+        return
+
     parser = argparse.ArgumentParser(
         description="Romance language verb conjugation CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Example usage:
     python main.py event.json
+    python main.py bulk it:verbs.txt requests.ndjson --output results.ndjson
+    python main.py generate-models fr es
 
 Example event.json:
     {
@@ -66,6 +82,9 @@ Example event.json:
         print(f"Error: Invalid JSON in {args.input_file}: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Imported here, as it loads a conjugator on import
+    import lambda_handler
+
     # Invoke the Lambda handler with the event
     response = lambda_handler.handler(event, None)
 
@@ -80,11 +99,90 @@ Example event.json:
         sys.exit(1)
 
 
+def parse_input(value: str) -> tuple[str | None, Path]:
+    """
+    Parse a bulk input argument of the form [<language>:]<path>.
+
+    Raises:
+        argparse.ArgumentTypeError: If the language is not a language code.
+    """
+    language, separator, path = value.partition(":")
+    if not separator:
+        return None, Path(value)
+    if not language.isalpha():
+        raise argparse.ArgumentTypeError(f"Invalid language in '{value}'")
+    return language, Path(path)
+
+
+def bulk_main():
+    """
+    Conjugate lemma lists or NDJSON requests and write the results as NDJSON.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py bulk",
+        description="Conjugate many verbs in parallel, one conjugator per worker",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=parse_input,
+        help="[<language>:]<path> of a lemma list with one verb per line, or of "
+        "NDJSON requests; requests without a 'language' use the prefix",
+    )
+    parser.add_argument(
+        "--output", "-o", type=Path, help="File to write to (default: stdout)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes per language (default: CPUs)"
+    )
+    args = parser.parse_args()
+
+    items = []
+    for language, path in args.inputs:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items.extend(bulk.read_requests(f, language))
+        except FileNotFoundError:
+            print(f"Error: File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # verbecc logs to stdout, which may carry the results
+    logging.disable(logging.INFO)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for result in bulk.conjugate_bulk(items, max_workers=args.workers):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
 def generate_models():
-    # Use this to generate the pre-trained model archives
-    for lang in ["fr", "es", "it", "pt"]:
-        inflector = Inflector(lang)
-        print("Initialized inflector, model generated")
+    """
+    Generate the pre-trained model archives of several languages in parallel.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py generate-models",
+        description="Generate the pre-trained model archives in parallel",
+    )
+    parser.add_argument(
+        "languages",
+        nargs="*",
+        default=bulk.MODEL_LANGUAGES,
+        help=f"Language codes (default: {' '.join(bulk.MODEL_LANGUAGES)})",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPUs)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    durations = bulk.generate_models(args.languages, max_workers=args.workers)
+    for language, seconds in durations.items():
+        print(f"{language}: model generated in {seconds:.1f}s")
+    print(f"Generated {len(durations)} models in {time.perf_counter() - start:.1f}s")
 
 
 if __name__ == "__main__":
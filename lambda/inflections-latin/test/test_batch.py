@@ -0,0 +1,126 @@
+"""
+Tests for batch requests to the Lambda handler.
+
+These tests verify that an array of requests is conjugated in one invocation,
+with one result or error per item.
+"""
+
+import json
+from unittest.mock import patch
+
+import conjugation_response
+import lambda_handler
+import pytest
+
+
+def _event(body) -> dict:
+    return {"body": json.dumps(body), "path": "/dev/inflections/it"}
+
+
+def _handle(items: list) -> list:
+    response = lambda_handler.handler(_event(items), None)
+    assert response["statusCode"] == 200, response
+    return json.loads(response["body"])
+
+
+class TestBatch:
+    """Tests for conjugating several verbs in one invocation."""
+
+    def test_returns_result_per_item_in_order(self):
+        """Test that every item yields its own inflections."""
+        results = _handle(
+            [{"lemma": "essere", "pos": "VERB"}, {"lemma": "avere", "pos": "AUX"}]
+        )
+
+        assert [r["lemma"] for r in results] == ["essere", "avere"]
+        assert [r["partOfSpeech"] for r in results] == ["VERB", "AUX"]
+        assert all(len(r["inflections"]) == 6 for r in results)
+
+    def test_matches_single_requests(self):
+        """Test that batch results equal the results of single requests."""
+        items = [
+            {"lemma": "parlare", "pos": "VERB"},
+            {
+                "lemma": "essere",
+                "pos": "VERB",
+                "tenses": [{"mood": "indicative", "tense": "future"}],
+            },
+        ]
+
+        results = _handle(items)
+
+        for item, result in zip(items, results):
+            single = lambda_handler.handler(_event(item), None)
+            assert result == json.loads(single["body"])
+
+    def test_conjugates_duplicates_once(self):
+        """Test that duplicate items share a single conjugation."""
+        items = [
+            {"lemma": "essere", "pos": "VERB"},
+            {"lemma": " essere ", "pos": "VERB"},
+            {"lemma": "essere", "pos": "VERB"},
+        ]
+
+        with patch.object(
+            conjugation_response, "conjugate", wraps=conjugation_response.conjugate
+        ) as conjugate:
+            results = _handle(items)
+
+        conjugate.assert_called_once()
+        assert len(results) == 3
+        assert results[0]["inflections"] == results[2]["inflections"]
+
+    def test_rejects_items_that_are_not_verbs_without_conjugating(self):
+        """Test that nouns are answered with an error before conjugation."""
+        with patch.object(
+            conjugation_response, "conjugate", wraps=conjugation_response.conjugate
+        ) as conjugate:
+            results = _handle(
+                [{"lemma": "casa", "pos": "NOUN"}, {"lemma": "essere", "pos": "VERB"}]
+            )
+
+        assert conjugate.call_count == 1
+        assert results[0] == {
+            "partOfSpeech": "NOUN",
+            "lemma": "casa",
+            "error": "Part of speech 'NOUN' cannot be conjugated",
+        }
+        assert "inflections" in results[1]
+
+    @pytest.mark.parametrize("item", [{"lemma": "essere"}, "essere", None])
+    def test_reports_invalid_items(self, item):
+        """Test that malformed items yield an error without failing the batch."""
+        results = _handle([item, {"lemma": "essere", "pos": "VERB"}])
+
+        assert results[0] == {"error": "Invalid request item"}
+        assert "inflections" in results[1]
+
+    def test_reports_conjugation_errors_per_item(self):
+        """Test that a failed conjugation does not fail the other items."""
+        results = _handle(
+            [
+                {
+                    "lemma": "essere",
+                    "pos": "VERB",
+                    "tenses": [{"mood": "indicative", "tense": "nonexistent"}],
+                },
+                {"lemma": "essere", "pos": "VERB"},
+            ]
+        )
+
+        assert "nonexistent" in results[0]["error"]
+        assert "inflections" in results[1]
+
+    def test_returns_empty_list_for_empty_batch(self):
+        """Test that an empty batch is answered with no results."""
+        assert _handle([]) == []
+
+    def test_rejects_batches_above_limit(self):
+        """Test that oversized batches are rejected."""
+        items = [{"lemma": "essere", "pos": "VERB"}] * (
+            lambda_handler.MAX_BATCH_SIZE + 1
+        )
+
+        response = lambda_handler.handler(_event(items), None)
+
+        assert response["statusCode"] == 400
@@ -0,0 +1,110 @@
+"""
+Tests for the bulk module.
+
+These tests verify that lemma lists and NDJSON requests are read per
+language, and that bulk conjugation keeps the input order within each
+language and reports failures per item.
+"""
+
+import pytest
+from bulk import conjugate_bulk, read_requests
+
+
+class TestReadRequests:
+    """Tests for the read_requests function."""
+
+    def test_reads_lemma_list(self):
+        """Test that every non-blank line of a lemma list is a verb request."""
+        items = list(read_requests(["essere\n", "\n", " avere \n"], "it"))
+
+        assert items == [
+            ("it", {"lemma": "essere", "pos": "VERB"}),
+            ("it", {"lemma": "avere", "pos": "VERB"}),
+        ]
+
+    def test_reads_ndjson_requests(self):
+        """Test that NDJSON requests may override the default language."""
+        lines = [
+            '{"lemma": "essere", "pos": "VERB"}',
+            '{"lemma": "ser", "pos": "VERB", "language": "es"}',
+        ]
+
+        items = list(read_requests(lines, "it"))
+
+        assert items == [
+            ("it", {"lemma": "essere", "pos": "VERB"}),
+            ("es", {"lemma": "ser", "pos": "VERB"}),
+        ]
+
+    def test_raises_without_language(self):
+        """Test that a lemma without a language is rejected."""
+        with pytest.raises(ValueError, match="No language"):
+            list(read_requests(["essere"]))
+
+
+class TestConjugateBulk:
+    """Tests for the conjugate_bulk function."""
+
+    def test_results_are_grouped_by_language_in_input_order(self):
+        """Test that each language keeps the order of its items."""
+        items = [
+            ("it", {"lemma": "essere", "pos": "VERB"}),
+            ("es", {"lemma": "ser", "pos": "VERB"}),
+            ("it", {"lemma": "avere", "pos": "VERB"}),
+        ]
+
+        results = list(conjugate_bulk(items, max_workers=2))
+
+        assert [(r["language"], r["lemma"]) for r in results] == [
+            ("it", "essere"),
+            ("it", "avere"),
+            ("es", "ser"),
+        ]
+        assert all(len(r["inflections"]) == 6 for r in results)
+
+    def test_failed_items_are_reported_individually(self):
+        """Test that an error only affects its own item."""
+        items = [
+            ("it", {"lemma": "casa", "pos": "NOUN"}),
+            ("it", {"lemma": "", "pos": "VERB"}),
+            ("it", {"lemma": "essere"}),
+            ("it", {"lemma": "avere", "pos": "VERB"}),
+        ]
+
+        results = list(conjugate_bulk(items, max_workers=1))
+
+        assert results[0]["error"] == "Part of speech 'NOUN' cannot be conjugated"
+        assert "error" in results[1]
+        assert results[2]["error"] == "Invalid request item"
+        assert "error" not in results[3]
+
+    def test_reports_unsupported_language_per_item(self):
+        """Test that items of an unknown language fail without raising."""
+        results = list(conjugate_bulk([("xx", {"lemma": "a", "pos": "VERB"})], 1))
+
+        assert results == [
+            {
+                "language": "xx",
+                "partOfSpeech": "VERB",
+                "lemma": "a",
+                "error": "Unsupported language",
+            }
+        ]
+
+    def test_conjugates_requested_tenses(self):
+        """Test that requests with tenses yield a paradigm."""
+        items = [
+            (
+                "it",
+                {
+                    "lemma": "essere",
+                    "pos": "VERB",
+                    "tenses": [{"mood": "indicative", "tense": "present"}],
+                },
+            )
+        ]
+
+        [result] = conjugate_bulk(items, max_workers=1)
+
+        assert result["tenses"][0]["tense"] == "present"
+        assert len(result["tenses"][0]["inflections"]) == 6
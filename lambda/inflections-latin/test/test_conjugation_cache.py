@@ -0,0 +1,99 @@
+"""
+Tests for the process-wide conjugation cache.
+"""
+
+import pytest
+from conjugation_cache import ConjugationCache, Failure
+from domain.feature import Number, Person
+from domain.inflection import Inflection
+
+KEY = ("it", "essere", "indicative", "present")
+
+
+class FakeClock:
+    """Manually advanced clock for testing failure expiry."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _inflections(form: str) -> list[Inflection]:
+    return [
+        Inflection(lemma="essere", inflected=form, features={Person.FIRST, Number.SING})
+    ]
+
+
+class TestConjugationCache:
+    """Tests for the ConjugationCache class."""
+
+    def test_get_returns_none_for_unknown_key(self):
+        """Test that an empty cache has no results."""
+        assert ConjugationCache().get(KEY) is None
+
+    def test_get_returns_copy_of_cached_inflections(self):
+        """Test that cached inflections are returned as a new list."""
+        cache = ConjugationCache()
+        inflections = _inflections("io sono")
+        cache.put(KEY, inflections)
+
+        cached = cache.get(KEY)
+        cached.clear()
+
+        assert cache.get(KEY) == inflections
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that the cache does not grow beyond its maximum size."""
+        cache = ConjugationCache(max_size=2)
+        other = ("it", "avere", "indicative", "present")
+        third = ("it", "fare", "indicative", "present")
+        cache.put(KEY, _inflections("io sono"))
+        cache.put(other, _inflections("io ho"))
+
+        cache.get(KEY)
+        cache.put(third, _inflections("io faccio"))
+
+        assert len(cache) == 2
+        assert cache.get(KEY) is not None
+        assert cache.get(other) is None
+        assert cache.get(third) is not None
+
+    def test_failure_expires_after_ttl(self):
+        """Test that failures are only cached for the failure TTL."""
+        clock = FakeClock()
+        cache = ConjugationCache(failure_ttl=10, clock=clock)
+        cache.put_failure(KEY, "Unknown verb")
+
+        clock.now = 9.9
+        failure = cache.get(KEY)
+        assert isinstance(failure, Failure)
+        assert failure.reason == "Unknown verb"
+
+        clock.now = 10
+        assert cache.get(KEY) is None
+        assert len(cache) == 0
+
+    def test_successful_result_replaces_failure(self):
+        """Test that a later success overwrites a cached failure."""
+        cache = ConjugationCache()
+        cache.put_failure(KEY, "Unknown verb")
+        cache.put(KEY, _inflections("io sono"))
+
+        assert cache.get(KEY) == _inflections("io sono")
+
+    def test_clear_drops_all_entries(self):
+        """Test that clearing the cache drops results and failures."""
+        cache = ConjugationCache()
+        cache.put(KEY, _inflections("io sono"))
+        cache.put_failure(("it", "xyz", "indicative", "present"), "Unknown verb")
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_rejects_invalid_size(self):
+        """Test that a cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            ConjugationCache(max_size=0)
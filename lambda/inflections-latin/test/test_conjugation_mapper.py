@@ -11,8 +11,10 @@ from verbecc.src.defs.types.person import Person as VerbeccPerson
 from verbecc.src.defs.types.number import Number as VerbeccNumber
 from verbecc.src.defs.types.gender import Gender as VerbeccGender
 
+import conjugator_registry
 from conjugation_mapper import (
     map_conjugation,
+    map_tense_conjugation,
     ConjugationMappingError,
     _map_person,
     _map_number,
@@ -20,6 +22,7 @@ from conjugation_mapper import (
 )
 from domain.feature import Person, Number, Gender
 from domain.inflection import Inflection
+from verbecc import LangCodeISO639_1
 
 
 class TestMapPerson:
@@ -297,3 +300,89 @@ class TestMapConjugationIntegration:
         result = map_conjugation(conjugation, "test_lemma")
 
         assert expected_gender in result.features
+
+
+class TestMapTenseConjugation:
+    """Tests for the single-pass mapping and merging of a tense."""
+
+    def test_merges_forms_that_differ_only_in_gender(self):
+        """Test that pronouns of the same verb form are combined."""
+        tense_conjugation = [
+            Conjugation(
+                person=VerbeccPerson.Third,
+                number=VerbeccNumber.Singular,
+                gender=VerbeccGender.m,
+                conjugations=["lui è"],
+            ),
+            Conjugation(
+                person=VerbeccPerson.Third,
+                number=VerbeccNumber.Singular,
+                gender=VerbeccGender.f,
+                conjugations=["lei è"],
+            ),
+        ]
+
+        result = map_tense_conjugation(tense_conjugation, "essere")
+
+        assert result == [
+            Inflection(
+                lemma="essere",
+                inflected="lui/lei è",
+                features={Person.THIRD, Number.SING},
+            )
+        ]
+
+    @pytest.mark.parametrize(
+        "forms,expected",
+        [
+            (["lui è", "lei è", "esso è"], "lui/lei/esso è"),
+            (["il est", "elle a"], "il est"),
+            (["venu", "venue"], "venu"),
+            (["venu", "venu"], "venu"),
+            (["venu", "il est"], "venu"),
+            (["il est", "venu", "elle est"], "il/elle est"),
+        ],
+    )
+    def test_merges_forms_of_same_person_number(self, forms, expected):
+        """Test that the first form wins, with the pronouns of the same verb combined."""
+        tense_conjugation = [
+            Conjugation(
+                person=VerbeccPerson.Third,
+                number=VerbeccNumber.Singular,
+                conjugations=[form],
+            )
+            for form in forms
+        ]
+
+        assert map_tense_conjugation(tense_conjugation, "lemma") == [
+            Inflection(
+                lemma="lemma",
+                inflected=expected,
+                features={Person.THIRD, Number.SING},
+            )
+        ]
+
+    def test_strips_lemma_whitespace(self):
+        """Test that the lemma of every inflection is stripped."""
+        tense_conjugation = [Conjugation(conjugations=["essere"])]
+
+        result = map_tense_conjugation(tense_conjugation, "  essere  ")
+
+        assert result[0].lemma == "essere"
+
+    def test_raises_on_empty_lemma(self):
+        """Test that an empty lemma raises ConjugationMappingError."""
+        with pytest.raises(ConjugationMappingError, match="Lemma cannot be empty"):
+            map_tense_conjugation([Conjugation(conjugations=["è"])], " ")
+
+    def test_raises_on_empty_conjugations(self):
+        """Test that a conjugation without forms raises ConjugationMappingError."""
+        with pytest.raises(ConjugationMappingError, match="no inflected forms"):
+            map_tense_conjugation([Conjugation(conjugations=[])], "essere")
+
+    def test_raises_on_unknown_feature_value(self):
+        """Test that unrecognized feature values raise ConjugationMappingError."""
+        conjugation = Conjugation(person="fourth", conjugations=["x"])
+
+        with pytest.raises(ConjugationMappingError, match="Unknown person value"):
+            map_tense_conjugation([conjugation], "essere")
@@ -0,0 +1,174 @@
+"""
+Tests for the conjugation_tables module.
+
+These tests verify that precomputed conjugation tables round-trip the
+inflections of the live Inflector and that the Lambda handler serves them.
+"""
+
+import json
+from unittest.mock import patch
+
+import conjugation_tables
+import lambda_handler
+import pytest
+from conjugation_tables import ConjugationTable, ConjugationTables
+from inflector import Inflector
+
+MOOD_TENSES = [("indicative", "present"), ("indicative", "future")]
+
+
+def _normalize(inflections: list[dict]) -> list[dict]:
+    """Sort the features of serialized inflections, which come from a set."""
+    return [
+        inflection
+        | {"features": sorted(inflection["features"], key=lambda f: f["type"])}
+        for inflection in inflections
+    ]
+
+
+def _event(lemma: str, tenses: list[dict] | None = None) -> dict:
+    body = {"lemma": lemma, "pos": "VERB"}
+    if tenses:
+        body["tenses"] = tenses
+    return {"body": json.dumps(body), "path": "/dev/inflections/it"}
+
+
+@pytest.fixture(scope="module")
+def tables_dir(tmp_path_factory):
+    """Directory containing an Italian conjugation table for a few verbs."""
+    directory = tmp_path_factory.mktemp("conjugations")
+    conjugation_tables.build(directory, "it", ["essere", "parlare", " "], MOOD_TENSES)
+    return directory
+
+
+class TestConjugationTable:
+    """Tests for writing and reading conjugation table files."""
+
+    def test_round_trips_entries(self, tmp_path):
+        """Test that written entries are read back unchanged."""
+        path = tmp_path / "table.bin"
+        entries = {
+            ("parlare", "indicative", "present"): [{"inflected": "io parlo"}],
+            ("être", "indicative", "present"): [{"inflected": "je suis"}],
+        }
+        conjugation_tables.write_table(path, entries)
+
+        table = ConjugationTable(path)
+
+        assert len(table) == 2
+        for (lemma, mood, tense), inflections in entries.items():
+            assert table.get(lemma, mood, tense) == inflections
+        assert table.get("parlare", "indicative", "future") is None
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the magic number is not read."""
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"not a table")
+
+        with pytest.raises(ValueError):
+            ConjugationTable(path)
+
+
+class TestBuild:
+    """Tests for building conjugation tables with the Inflector."""
+
+    @pytest.mark.parametrize("lemma", ["essere", "parlare"])
+    @pytest.mark.parametrize("mood,tense", MOOD_TENSES)
+    def test_matches_live_conjugation(self, tables_dir, lemma, mood, tense):
+        """Test that table entries equal the live Inflector's output."""
+        table = ConjugationTable(conjugation_tables.table_path(tables_dir, "it"))
+        live = Inflector("it", mood=mood, tense=tense).inflect(lemma)
+
+        assert _normalize(table.get(lemma, mood, tense)) == _normalize(
+            [inflection.json() for inflection in live]
+        )
+
+    def test_skips_empty_lemmas(self, tables_dir):
+        """Test that blank lines of the frequency list are ignored."""
+        table = ConjugationTable(conjugation_tables.table_path(tables_dir, "it"))
+
+        assert len(table) == 2 * len(MOOD_TENSES)
+
+
+class TestConjugationTables:
+    """Tests for looking up conjugations across languages."""
+
+    def test_returns_none_without_directory(self):
+        """Test that every lookup misses without a tables directory."""
+        assert (
+            ConjugationTables(None).get("it", "essere", "indicative", "present") is None
+        )
+
+    def test_returns_none_for_language_without_table(self, tables_dir):
+        """Test that a language without a table misses."""
+        tables = ConjugationTables(tables_dir)
+
+        assert tables.get("es", "ser", "indicative", "present") is None
+
+    def test_ignores_languages_that_are_not_codes(self, tables_dir):
+        """Test that path fragments are never used to locate tables."""
+        tables = ConjugationTables(tables_dir / "sub")
+
+        assert tables.get("../it", "essere", "indicative", "present") is None
+
+    def test_ignores_corrupt_table(self, tmp_path):
+        """Test that an unreadable table is treated as missing."""
+        conjugation_tables.table_path(tmp_path, "it").write_bytes(b"")
+
+        assert (
+            ConjugationTables(tmp_path).get("it", "essere", "indicative", "present")
+            is None
+        )
+
+
+class TestHandlerServesTables:
+    """Tests for serving precomputed conjugations from the Lambda handler."""
+
+    @pytest.fixture(autouse=True)
+    def tables(self, tables_dir):
+        with patch.object(conjugation_tables, "_tables", ConjugationTables(tables_dir)):
+            yield
+
+    def test_serves_hit_without_inflector(self):
+        """Test that a precomputed verb is served without conjugating it."""
+        live = lambda_handler.handler(_event("parlare"), None)
+
+        with patch.object(lambda_handler, "Inflector") as mock_inflector:
+            response = lambda_handler.handler(_event("parlare"), None)
+
+        mock_inflector.assert_not_called()
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["partOfSpeech"] == "VERB"
+        assert body["lemma"] == "parlare"
+        assert _normalize(body["inflections"]) == _normalize(
+            json.loads(live["body"])["inflections"]
+        )
+
+    def test_serves_multi_tense_hit(self):
+        """Test that a multi-tense request is served if every tense is precomputed."""
+        tenses = [{"mood": mood, "tense": tense} for mood, tense in MOOD_TENSES]
+
+        with patch.object(lambda_handler, "Inflector") as mock_inflector:
+            response = lambda_handler.handler(_event("essere", tenses), None)
+
+        mock_inflector.assert_not_called()
+        body = json.loads(response["body"])
+        assert [(t["mood"], t["tense"]) for t in body["tenses"]] == MOOD_TENSES
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            _event("cantare"),
+            _event("essere", [{"mood": "subjunctive", "tense": "present"}]),
+        ],
+    )
+    def test_falls_back_to_live_conjugation_on_miss(self, event):
+        """Test that verbs or tenses missing from the table are conjugated."""
+        with patch.object(
+            lambda_handler, "Inflector", wraps=lambda_handler.Inflector
+        ) as mock_inflector:
+            response = lambda_handler.handler(event, None)
+
+        mock_inflector.assert_called_once_with("it")
+        assert response["statusCode"] == 200
@@ -0,0 +1,166 @@
+"""
+Tests for the conjugator_registry module.
+
+These tests verify that conjugators are constructed once per language
+and shared between Inflector instances.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import conjugator_registry
+from inflector import Inflector
+from verbecc import LangCodeISO639_1
+
+
+class TestGetConjugator:
+    """Tests for the get_conjugator function."""
+
+    def test_returns_same_conjugator_for_same_language(self):
+        """Test that a language's conjugator is only constructed once."""
+        first = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+        second = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+        assert first is second
+
+    def test_returns_different_conjugators_for_different_languages(self):
+        """Test that conjugators are keyed by language."""
+        italian = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+        spanish = conjugator_registry.get_conjugator(LangCodeISO639_1.es)
+        assert italian is not spanish
+
+    def test_constructs_conjugator_lazily(self):
+        """Test that a conjugator is constructed on first use only."""
+        with patch.object(conjugator_registry, "_conjugators", OrderedDict()):
+            assert not conjugator_registry.is_loaded(LangCodeISO639_1.fr)
+            conjugator_registry.get_conjugator(LangCodeISO639_1.fr)
+            assert conjugator_registry.is_loaded(LangCodeISO639_1.fr)
+
+
+class TestBoundedRegistry:
+    """Tests for bounding the number of loaded conjugators."""
+
+    @staticmethod
+    def _bounded(max_loaded):
+        """Patch the registry to be empty, bounded, and construct mock conjugators."""
+        return (
+            patch.object(conjugator_registry, "_conjugators", OrderedDict()),
+            patch.object(conjugator_registry, "_max_loaded", max_loaded),
+            patch(
+                "conjugator_registry.CompleteConjugator",
+                side_effect=lambda language: MagicMock(language=language),
+            ),
+        )
+
+    def test_drops_least_recently_used_conjugator(self):
+        """Test that loading a language beyond the bound drops the oldest one."""
+        conjugators, max_loaded, constructor = self._bounded(2)
+        with conjugators, max_loaded, constructor:
+            conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+            conjugator_registry.get_conjugator(LangCodeISO639_1.es)
+            conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+            conjugator_registry.get_conjugator(LangCodeISO639_1.fr)
+
+            assert conjugator_registry.loaded_languages() == [
+                LangCodeISO639_1.it,
+                LangCodeISO639_1.fr,
+            ]
+
+    def test_reloads_dropped_conjugator_on_demand(self):
+        """Test that a dropped language is loaded again when requested."""
+        conjugators, max_loaded, constructor = self._bounded(1)
+        with conjugators, max_loaded, constructor as mock_conjugator:
+            conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+            conjugator_registry.get_conjugator(LangCodeISO639_1.es)
+            conjugator = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+
+            assert conjugator.language == LangCodeISO639_1.it
+            assert mock_conjugator.call_count == 3
+            assert not conjugator_registry.is_loaded(LangCodeISO639_1.es)
+
+    def test_unbounded_registry_keeps_all_conjugators(self):
+        """Test that no conjugator is dropped without a bound."""
+        conjugators, max_loaded, constructor = self._bounded(None)
+        with conjugators, max_loaded, constructor:
+            for language in ["it", "es", "fr", "pt"]:
+                conjugator_registry.get_conjugator(LangCodeISO639_1(language))
+
+            assert len(conjugator_registry.loaded_languages()) == 4
+
+
+class TestConcurrentLoading:
+    """Tests for loading conjugators while other threads use the registry."""
+
+    @staticmethod
+    def _slow_french(started, release):
+        """Construct mock conjugators, blocking French until released."""
+
+        def construct(language):
+            if language == LangCodeISO639_1.fr:
+                started.set()
+                release.wait(timeout=5)
+            return MagicMock(language=language)
+
+        return patch("conjugator_registry.CompleteConjugator", side_effect=construct)
+
+    def test_loading_does_not_block_loaded_languages(self):
+        """Test that a loaded language is served while another one loads."""
+        started, release = threading.Event(), threading.Event()
+        with (
+            patch.object(conjugator_registry, "_conjugators", OrderedDict()),
+            patch.object(conjugator_registry, "_max_loaded", None),
+            self._slow_french(started, release),
+        ):
+            italian = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+            loader = threading.Thread(
+                target=conjugator_registry.get_conjugator, args=(LangCodeISO639_1.fr,)
+            )
+            loader.start()
+            assert started.wait(timeout=5)
+
+            try:
+                assert (
+                    conjugator_registry.get_conjugator(LangCodeISO639_1.it) is italian
+                )
+                assert not conjugator_registry.is_loaded(LangCodeISO639_1.fr)
+            finally:
+                release.set()
+                loader.join(timeout=5)
+
+            assert conjugator_registry.is_loaded(LangCodeISO639_1.fr)
+
+    def test_concurrent_requests_load_language_once(self):
+        """Test that threads requesting a loading language share its conjugator."""
+        started, release = threading.Event(), threading.Event()
+        with (
+            patch.object(conjugator_registry, "_conjugators", OrderedDict()),
+            patch.object(conjugator_registry, "_max_loaded", None),
+            self._slow_french(started, release) as mock_conjugator,
+        ):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [
+                    pool.submit(conjugator_registry.get_conjugator, LangCodeISO639_1.fr)
+                    for _ in range(4)
+                ]
+                assert started.wait(timeout=5)
+                release.set()
+                conjugators = [future.result(timeout=5) for future in futures]
+
+            assert mock_conjugator.call_count == 1
+            assert all(c is conjugators[0] for c in conjugators)
+
+
+class TestInflectorUsesRegistry:
+    """Tests for sharing conjugators between Inflector instances."""
+
+    def test_inflectors_share_conjugator(self):
+        """Test that Inflectors for the same language share one conjugator."""
+        assert Inflector("it")._conjugator is Inflector("it")._conjugator
+
+    def test_inflector_does_not_construct_loaded_conjugator(self):
+        """Test that constructing an Inflector does not reload the model."""
+        conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+        with patch("conjugator_registry.CompleteConjugator") as mock_conjugator:
+            Inflector("it")
+        mock_conjugator.assert_not_called()
@@ -0,0 +1,87 @@
+"""
+Tests for the conjugator_snapshot module.
+
+These tests verify that conjugators can be written to and loaded from
+snapshots, and that unusable snapshots are ignored.
+"""
+
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import conjugator_registry
+import conjugator_snapshot
+import pytest
+from verbecc import LangCodeISO639_1, localization
+
+
+@pytest.fixture(scope="module")
+def snapshot_dir(tmp_path_factory):
+    """Directory containing a snapshot of the French conjugator."""
+    directory = tmp_path_factory.mktemp("snapshots")
+    conjugator_snapshot.save(directory, LangCodeISO639_1.fr)
+    return directory
+
+
+class TestLoad:
+    """Tests for loading conjugator snapshots."""
+
+    def test_loaded_conjugator_conjugates_like_constructed_one(self, snapshot_dir):
+        """Test that a snapshot yields the same conjugations as the zip model."""
+        loaded = conjugator_snapshot.load(snapshot_dir, LangCodeISO639_1.fr)
+        constructed = conjugator_registry.get_conjugator(LangCodeISO639_1.fr)
+        mood = localization.xmood(LangCodeISO639_1.fr, "indicative")
+        tense = localization.xtense(LangCodeISO639_1.fr, "present")
+
+        for lemma in ["être", "parler", "finir"]:
+            assert str(loaded.conjugate_mood_tense(lemma, mood, tense)) == str(
+                constructed.conjugate_mood_tense(lemma, mood, tense)
+            )
+
+    def test_returns_none_without_snapshot(self, snapshot_dir):
+        """Test that a language without a snapshot is not loaded."""
+        assert conjugator_snapshot.load(snapshot_dir, LangCodeISO639_1.it) is None
+
+    def test_ignores_snapshot_of_other_versions(self, snapshot_dir):
+        """Test that a snapshot written by other library versions is ignored."""
+        with patch.object(
+            conjugator_snapshot, "_fingerprint", return_value=("0.0.0", "3.0.0")
+        ):
+            assert conjugator_snapshot.load(snapshot_dir, LangCodeISO639_1.fr) is None
+
+    def test_ignores_unreadable_snapshot(self, tmp_path):
+        """Test that a corrupt snapshot is ignored."""
+        conjugator_snapshot.snapshot_path(tmp_path, LangCodeISO639_1.es).write_bytes(
+            b"not a pickle"
+        )
+
+        assert conjugator_snapshot.load(tmp_path, LangCodeISO639_1.es) is None
+
+
+class TestRegistryUsesSnapshots:
+    """Tests for loading conjugators from snapshots in the registry."""
+
+    def test_loads_conjugator_from_snapshot_directory(self, tmp_path):
+        """Test that the registry prefers a snapshot over constructing."""
+        snapshot = MagicMock()
+        with (
+            patch.object(conjugator_registry, "_conjugators", OrderedDict()),
+            patch.object(conjugator_registry, "_snapshot_dir", str(tmp_path)),
+            patch.object(conjugator_snapshot, "load", return_value=snapshot),
+            patch("conjugator_registry.CompleteConjugator") as mock_conjugator,
+        ):
+            conjugator = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+
+        assert conjugator is snapshot
+        mock_conjugator.assert_not_called()
+
+    def test_constructs_conjugator_without_snapshot(self, tmp_path):
+        """Test that the registry falls back to the model archive."""
+        with (
+            patch.object(conjugator_registry, "_conjugators", OrderedDict()),
+            patch.object(conjugator_registry, "_snapshot_dir", str(tmp_path)),
+            patch("conjugator_registry.CompleteConjugator") as mock_conjugator,
+        ):
+            conjugator = conjugator_registry.get_conjugator(LangCodeISO639_1.it)
+
+        assert conjugator is mock_conjugator.return_value
+        mock_conjugator.assert_called_once_with(LangCodeISO639_1.it)
@@ -8,18 +8,28 @@ including validation of language codes, mood/tense handling, and error cases.
 import os
 from unittest.mock import patch
 
+import conjugation_cache
 import pytest
+from conjugation_mapper import map_tense_conjugation
 from domain.feature import Number, Person
 from domain.language import LanguageCode
 from inflector import (
+    COMPLETE_CONJUGATION_MIN_TENSES,
     ConjugationError,
     Inflector,
     UnsupportedLanguageError,
     DEFAULT_MOOD,
     DEFAULT_TENSE,
+    _localize,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_conjugation_cache():
+    """Start every test with an empty process-wide conjugation cache."""
+    conjugation_cache.get_cache().clear()
+
+
 class TestInflectorInitialization:
     """Tests for Inflector initialization."""
 
@@ -159,6 +169,192 @@ class TestConjugateWithDifferentMoodsAndTenses:
             inflector.inflect("essere")
 
 
+class TestTargetedConjugation:
+    """Tests that conjugating a single mood/tense matches the complete conjugation."""
+
+    @staticmethod
+    def _inflect_from_complete_conjugation(inflector, lemma):
+        """Inflect by conjugating every mood and tense, then selecting one."""
+        moods = inflector._conjugator.conjugate(lemma).get_moods()
+        mood, tense = _localize(inflector.language, inflector.mood, inflector.tense)
+        return map_tense_conjugation(moods[mood][tense], lemma)
+
+    @pytest.mark.parametrize(
+        "language,lemma",
+        [
+            ("it", "essere"),
+            ("it", "parlare"),
+            ("fr", "être"),
+            ("fr", "aller"),
+            ("es", "ser"),
+            ("es", "hablar"),
+            ("pt", "ser"),
+            ("ro", "fi"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "mood,tense",
+        [
+            ("indicative", "present"),
+            ("indicative", "imperfect"),
+            ("indicative", "future"),
+            ("subjunctive", "present"),
+        ],
+    )
+    def test_matches_complete_conjugation(self, language, lemma, mood, tense):
+        """Test that the targeted path yields the same inflections or errors."""
+        inflector = Inflector(language=language, mood=mood, tense=tense)
+
+        try:
+            expected = self._inflect_from_complete_conjugation(inflector, lemma)
+        except KeyError:
+            # The mood or tense does not exist for this language or verb
+            with pytest.raises(ConjugationError):
+                inflector.inflect(lemma)
+            return
+
+        assert inflector.inflect(lemma) == expected
+
+
+class TestInflectTenses:
+    """Tests for conjugating a verb in several moods and tenses at once."""
+
+    MOOD_TENSES = [
+        ("indicative", "present"),
+        ("indicative", "imperfect"),
+        ("indicative", "future"),
+        ("subjunctive", "present"),
+    ]
+
+    @pytest.mark.parametrize(
+        "language,lemma",
+        [("it", "essere"), ("fr", "aller"), ("es", "hablar")],
+    )
+    def test_matches_single_tense_inflection(self, language, lemma):
+        """Test that each returned tense equals inflecting that tense alone."""
+        inflector = Inflector(language=language)
+
+        result = inflector.inflect_tenses(lemma, self.MOOD_TENSES)
+
+        assert [(t.mood, t.tense) for t in result] == self.MOOD_TENSES
+        for tense_inflections in result:
+            single = Inflector(
+                language=language,
+                mood=tense_inflections.mood,
+                tense=tense_inflections.tense,
+            )
+            assert tense_inflections.inflections == single.inflect(lemma)
+
+    def test_complete_conjugation_matches_targeted_conjugation(self):
+        """Test that large requests yield the same result as small ones."""
+        inflector = Inflector(language="es")
+        expected = inflector.inflect_tenses("hablar", self.MOOD_TENSES)
+        conjugation_cache.get_cache().clear()
+
+        with (
+            patch("inflector.COMPLETE_CONJUGATION_MIN_TENSES", len(self.MOOD_TENSES)),
+            patch.object(
+                inflector._conjugator,
+                "conjugate",
+                wraps=inflector._conjugator.conjugate,
+            ) as conjugate,
+        ):
+            result = inflector.inflect_tenses("hablar", self.MOOD_TENSES)
+
+        conjugate.assert_called_once_with("hablar")
+        assert result == expected
+
+    def test_repeated_tenses_are_returned_in_request_order(self):
+        """Test that a mood/tense requested twice is returned twice."""
+        inflector = Inflector(language="it")
+        mood_tenses = [
+            ("indicative", "present"),
+            ("indicative", "future"),
+            ("indicative", "present"),
+        ]
+
+        result = inflector.inflect_tenses("essere", mood_tenses)
+
+        assert [(t.mood, t.tense) for t in result] == mood_tenses
+        assert result[0].inflections == result[2].inflections
+
+    @pytest.mark.parametrize("min_tenses", [1, COMPLETE_CONJUGATION_MIN_TENSES])
+    def test_raises_error_for_invalid_tense(self, min_tenses):
+        """Test that an unavailable tense fails in both conjugation paths."""
+        inflector = Inflector(language="it")
+
+        with (
+            patch("inflector.COMPLETE_CONJUGATION_MIN_TENSES", min_tenses),
+            pytest.raises(ConjugationError, match="nonexistent"),
+        ):
+            inflector.inflect_tenses("essere", [("indicative", "nonexistent")])
+
+    def test_raises_error_for_empty_lemma(self):
+        """Test that an empty lemma raises ConjugationError."""
+        inflector = Inflector(language="it")
+
+        with pytest.raises(ConjugationError, match="Lemma cannot be empty"):
+            inflector.inflect_tenses("  ", self.MOOD_TENSES)
+
+
+class TestConjugationCaching:
+    """Tests for caching conjugation results and failures."""
+
+    def test_repeated_inflection_is_served_from_cache(self):
+        """Test that a verb is conjugated only once across Inflectors."""
+        first = Inflector(language="it")
+        expected = first.inflect("essere")
+        second = Inflector(language="it")
+
+        with patch.object(second._conjugator, "conjugate_mood_tense") as conjugate:
+            assert second.inflect("essere") == expected
+
+        conjugate.assert_not_called()
+        assert first.cache_stats == {"hits": 0, "misses": 1, "failure_hits": 0}
+        assert second.cache_stats == {"hits": 1, "misses": 0, "failure_hits": 0}
+
+    def test_cache_is_keyed_by_mood_and_tense(self):
+        """Test that a different tense of a cached verb is conjugated."""
+        present = Inflector(language="it").inflect("essere")
+        future = Inflector(language="it", tense="future").inflect("essere")
+
+        assert present != future
+
+    def test_cached_result_cannot_be_modified_by_callers(self):
+        """Test that mutating a returned list does not affect the cache."""
+        inflector = Inflector(language="it")
+        inflector.inflect("essere").clear()
+
+        assert len(inflector.inflect("essere")) == 6
+
+    def test_failure_is_served_from_cache(self):
+        """Test that a failed conjugation is not retried while cached."""
+        first = Inflector(language="it", tense="nonexistent")
+        with pytest.raises(ConjugationError):
+            first.inflect("essere")
+        second = Inflector(language="it", tense="nonexistent")
+
+        with (
+            patch.object(second._conjugator, "conjugate_mood_tense") as conjugate,
+            pytest.raises(ConjugationError, match="nonexistent"),
+        ):
+            second.inflect("essere")
+
+        conjugate.assert_not_called()
+        assert second.cache_stats == {"hits": 0, "misses": 0, "failure_hits": 1}
+
+    def test_inflect_tenses_uses_cached_tenses(self):
+        """Test that only uncached tenses of a multi-tense request are conjugated."""
+        Inflector(language="it").inflect("essere")
+        inflector = Inflector(language="it")
+
+        inflector.inflect_tenses(
+            "essere", [("indicative", "present"), ("indicative", "future")]
+        )
+
+        assert inflector.cache_stats == {"hits": 1, "misses": 1, "failure_hits": 0}
+
+
 class TestExceptionClasses:
     """Tests for custom exception classes."""
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Cold-start and per-request benchmark for the inflections-ru Lambda.
+
+Measures, each in a fresh interpreter so that nothing is cached:
+1. Construction time and RSS of pymorphy3.MorphAnalyzer()
+2. Import time and RSS of lambda_handler (which builds the singleton Inflector)
+
+and then, in-process, the latency of lambda_handler.handler for the noun,
+adjective and verb lemmas from preprocessing/data/in/ru.csv.
+
+The report is printed as JSON. Pass --output to append it to an NDJSON file,
+which makes results comparable across versions and Lambda memory sizes.
+
+Usage:
+    python benchmark/benchmark_handler.py [--cold-runs N] [--memory-size MB]
+                                          [--output results.ndjson]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from corpus import SERVICE_ROOT, load_lemmas
+from report import emit, metadata, summarize
+
+# Each snippet prints a JSON object with the elapsed seconds and the peak RSS
+# (ru_maxrss, kilobytes on Linux) before and after the measured statement.
+_ANALYZER_SNIPPET = """
+import json, resource, time
+import pymorphy3
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+pymorphy3.MorphAnalyzer()
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "rss_before_kb": rss_before, "rss_after_kb": rss_after}))
+"""
+
+_IMPORT_SNIPPET = """
+import json, resource, sys, time
+sys.path.insert(0, {path!r})
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import lambda_handler
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "rss_before_kb": rss_before, "rss_after_kb": rss_after}}))
+"""
+
+
+def measure_cold(snippet: str, runs: int) -> dict:
+    """
+    Run a measurement snippet in `runs` fresh interpreters.
+
+    Args:
+        snippet: Python source that prints a JSON measurement.
+        runs: Number of interpreters to start.
+
+    Returns:
+        Mean and per-run durations in milliseconds and the peak RSS in kilobytes.
+    """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", snippet],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=SERVICE_ROOT,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    durations = [round(s["seconds"] * 1e3, 1) for s in samples]
+    return {
+        "runs_ms": durations,
+        "mean_ms": round(statistics.fmean(durations), 1),
+        "rss_before_kb": max(s["rss_before_kb"] for s in samples),
+        "rss_after_kb": max(s["rss_after_kb"] for s in samples),
+    }
+
+
+def measure_requests(lemmas: dict, rounds: int) -> dict:
+    """
+    Invoke the handler with API Gateway events for every lemma.
+
+    Args:
+        lemmas: Lemmas grouped by part of speech.
+        rounds: Number of passes over the corpus.
+
+    Returns:
+        Latency statistics and status code counts per part of speech.
+    """
+    import lambda_handler
+
+    results = {}
+    for pos, words in lemmas.items():
+        events = [
+            {"body": json.dumps({"lemma": word, "pos": pos.value})} for word in words
+        ]
+        timings: list[float] = []
+        statuses: dict[int, int] = {}
+        for _ in range(rounds):
+            for event in events:
+                start = time.perf_counter()
+                response = lambda_handler.handler(event, None)
+                timings.append(time.perf_counter() - start)
+                status = response["statusCode"]
+                statuses[status] = statuses.get(status, 0) + 1
+        results[pos.name] = {**summarize(timings), "status_codes": statuses}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--cold-runs", type=int, default=5, help="Fresh interpreters per cold metric"
+    )
+    parser.add_argument("--rounds", type=int, default=1, help="Passes over the corpus")
+    parser.add_argument("--memory-size", type=int, help="Lambda memory size in MB")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    inflections_path = str(SERVICE_ROOT / "inflections")
+    report = {
+        "benchmark": "handler",
+        "meta": metadata(args.memory_size),
+        "cold_start": {
+            "morph_analyzer_init": measure_cold(_ANALYZER_SNIPPET, args.cold_runs),
+            "lambda_handler_import": measure_cold(
+                _IMPORT_SNIPPET.format(path=inflections_path), args.cold_runs
+            ),
+        },
+        "requests": measure_requests(load_lemmas(), args.rounds),
+    }
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
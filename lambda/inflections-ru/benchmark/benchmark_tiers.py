@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark the default and tiered parsing modes of the Inflector.
+
+Parses and inflects every noun, adjective and verb lemma from
+preprocessing/data/in/ru.csv with both modes and prints per-lemma latency
+statistics and tier counts as JSON.
+
+Usage:
+    python benchmark/benchmark_tiers.py [--rounds N] [--output results.ndjson]
+"""
+
+import argparse
+import time
+
+# corpus puts the Lambda modules on sys.path, so it has to be imported first
+from corpus import load_lemmas
+from report import emit, metadata, summarize
+
+# isort: split
+import feature_retriever
+from inflector import InflectionError, Inflector
+
+
+def run(inflector: Inflector, lemmas: dict, rounds: int) -> dict:
+    """
+    Parse and inflect all lemmas `rounds` times and collect latency statistics.
+
+    Args:
+        inflector: The Inflector to benchmark.
+        lemmas: Lemmas grouped by part of speech.
+        rounds: Number of passes over the corpus.
+
+    Returns:
+        Parse and inflect latency statistics, error count and tier counts.
+    """
+    parse_timings: list[float] = []
+    inflect_timings: list[float] = []
+    errors = 0
+
+    for _ in range(rounds):
+        for words in lemmas.values():
+            for word in words:
+                start = time.perf_counter()
+                inflector._parse_word(word)
+                parse_timings.append(time.perf_counter() - start)
+
+    for _ in range(rounds):
+        for pos, words in lemmas.items():
+            features = feature_retriever.derive_features(pos)
+            for word in words:
+                start = time.perf_counter()
+                try:
+                    inflector.inflect(word, features, pos)
+                except InflectionError:
+                    errors += 1
+                inflect_timings.append(time.perf_counter() - start)
+
+    return {
+        "parse": summarize(parse_timings),
+        "inflect": summarize(inflect_timings),
+        "errors": errors,
+        "tier_counts": dict(inflector.tier_counts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the corpus")
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    lemmas = load_lemmas()
+    report = {
+        "benchmark": "parse_tiers",
+        "meta": metadata(),
+        "lemmas": {pos.name: len(words) for pos, words in lemmas.items()},
+        "default": run(Inflector(), lemmas, args.rounds),
+        "tiered": run(Inflector(tiered=True), lemmas, args.rounds),
+    }
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
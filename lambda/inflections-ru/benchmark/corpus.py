@@ -0,0 +1,56 @@
+"""
+Lemma corpus for the inflections-ru benchmarks.
+
+Extracts lemmas from the phrase/translation CSV files used by the preprocessing
+Lambda (preprocessing/data/in/ru.csv) and groups them by part of speech.
+"""
+
+import csv
+import re
+import sys
+from pathlib import Path
+
+import pymorphy3
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+CORPUS_PATH = SERVICE_ROOT.parent / "preprocessing" / "data" / "in" / "ru.csv"
+
+# Make the Lambda modules importable the same way pytest.ini does
+sys.path.insert(0, str(SERVICE_ROOT / "inflections"))
+
+from domain.part_of_speech import PartOfSpeech  # noqa: E402
+
+_WORD_PATTERN = re.compile(r"[а-яё]+(?:-[а-яё]+)*", re.IGNORECASE)
+
+# Mapping from pymorphy3 POS tags of lemmas to the POS sent by API clients
+_LEMMA_POS_MAP = {
+    "NOUN": PartOfSpeech.NOUN,
+    "ADJF": PartOfSpeech.ADJ,
+    "INFN": PartOfSpeech.VERB,
+}
+
+
+def load_lemmas(path: Path = CORPUS_PATH) -> dict[PartOfSpeech, list[str]]:
+    """
+    Extract unique noun, adjective and verb lemmas from a phrase CSV file.
+
+    Args:
+        path: Path to a pipe-separated phrase|translation CSV file.
+
+    Returns:
+        Lemmas in order of first occurrence, grouped by part of speech.
+    """
+    morph = pymorphy3.MorphAnalyzer()
+    lemmas: dict[PartOfSpeech, dict[str, None]] = {pos: {} for pos in PartOfSpeech}
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in csv.reader(f, delimiter="|"):
+            if not line:
+                continue
+            for word in _WORD_PATTERN.findall(line[0]):
+                normal = morph.parse(word)[0].normalized
+                pos = _LEMMA_POS_MAP.get(normal.tag.POS)
+                if pos is not None:
+                    lemmas[pos][normal.word] = None
+
+    return {pos: list(words) for pos, words in lemmas.items() if words}
@@ -0,0 +1,70 @@
+"""
+Helpers for reporting benchmark results in a machine-readable form.
+
+Every report carries enough metadata (service version, Python version, Lambda
+memory size) to compare results across releases and Lambda configurations.
+"""
+
+import datetime
+import json
+import os
+import platform
+import statistics
+import tomllib
+from pathlib import Path
+from typing import Optional
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def summarize(timings: list[float]) -> dict:
+    """Reduce a list of latencies in seconds to statistics in microseconds."""
+    timings = sorted(t * 1e6 for t in timings)
+    return {
+        "count": len(timings),
+        "mean_us": round(statistics.fmean(timings), 1),
+        "p50_us": round(timings[len(timings) // 2], 1),
+        "p95_us": round(timings[int(len(timings) * 0.95)], 1),
+        "p99_us": round(timings[int(len(timings) * 0.99)], 1),
+    }
+
+
+def metadata(memory_size: Optional[int] = None) -> dict:
+    """
+    Describe the environment a benchmark ran in.
+
+    Args:
+        memory_size: Lambda memory size in MB. Defaults to the value of
+                     AWS_LAMBDA_FUNCTION_MEMORY_SIZE, if set.
+
+    Returns:
+        A JSON-compatible dictionary of run metadata.
+    """
+    with open(SERVICE_ROOT / "pyproject.toml", "rb") as f:
+        project = tomllib.load(f)["project"]
+
+    if memory_size is None and "AWS_LAMBDA_FUNCTION_MEMORY_SIZE" in os.environ:
+        memory_size = int(os.environ["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"])
+
+    return {
+        "service": project["name"],
+        "version": project["version"],
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "memory_size_mb": memory_size,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def emit(report: dict, output: Optional[str] = None) -> None:
+    """
+    Print a report as JSON and optionally append it to an NDJSON file.
+
+    Args:
+        report: The report to emit.
+        output: Path of an NDJSON file that collects reports across runs.
+    """
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if output:
+        with open(output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report, ensure_ascii=False) + "\n")
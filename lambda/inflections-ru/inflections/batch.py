@@ -0,0 +1,150 @@
+"""
+Batch inflection module for large inflection jobs.
+
+This module generates paradigms for many words in parallel, either in a thread
+pool that shares a single Inflector or in a process pool with one Inflector per
+worker process. pymorphy3 is pure Python, so only the process pool scales with
+the number of cores; the thread pool suits hosts where forking is not an option.
+
+Usage:
+    python batch.py requests.ndjson [--executor process] [--workers N] [--output out.ndjson]
+
+Each input line is an inflection request, e.g. {"lemma": "слово", "pos": "NOUN"}.
+Results are written as NDJSON in input order.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+import feature_retriever
+from domain.inflection_request import InflectionRequest
+from inflector import DEFAULT_CONFIDENCE_THRESHOLD, InflectionError, Inflector
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+# Inflector of the current worker process, created by _init_worker
+_worker_inflector: Optional[Inflector] = None
+
+
+def inflect_batch(
+    requests: Iterable[InflectionRequest],
+    executor: str = THREAD_EXECUTOR,
+    max_workers: Optional[int] = None,
+    confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+    tiered: bool = False,
+) -> Iterator[dict]:
+    """
+    Inflect a batch of words in parallel.
+
+    Args:
+        requests: The inflection requests to process.
+        executor: THREAD_EXECUTOR to share one Inflector between threads, or
+                  PROCESS_EXECUTOR to create one Inflector per worker process.
+        max_workers: Maximum number of workers. Defaults to the executor's default.
+        confidence_threshold: Minimum confidence score for parse validation.
+        tiered: Whether the Inflectors use tiered parsing.
+
+    Returns:
+        An iterator of serialized results in request order. Failed requests
+        yield an object with the lemma, part of speech and an "error" message.
+
+    Raises:
+        ValueError: If an unknown executor is requested.
+    """
+    if executor not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+        raise ValueError(f"Unsupported executor: {executor}")
+
+    items = [(r.lemma, r.part_of_speech) for r in requests]
+    return _run(items, executor, max_workers, confidence_threshold, tiered)
+
+
+def _run(
+    items: list[tuple],
+    executor: str,
+    max_workers: Optional[int],
+    confidence_threshold: float,
+    tiered: bool,
+) -> Iterator[dict]:
+    """Distribute (lemma, part of speech) items over the requested executor."""
+    if executor == THREAD_EXECUTOR:
+        inflector = Inflector(confidence_threshold, tiered)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from pool.map(lambda item: _inflect(inflector, *item), items)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(confidence_threshold, tiered),
+        ) as pool:
+            yield from pool.map(_inflect_in_worker, items, chunksize=32)
+
+
+def _init_worker(confidence_threshold: float, tiered: bool) -> None:
+    """Create the Inflector of a worker process."""
+    global _worker_inflector
+    _worker_inflector = Inflector(confidence_threshold, tiered)
+
+
+def _inflect_in_worker(item: tuple) -> dict:
+    """Inflect a single (lemma, part of speech) item with the worker's Inflector."""
+    return _inflect(_worker_inflector, *item)
+
+
+def _inflect(inflector: Inflector, lemma: str, part_of_speech) -> dict:
+    """
+    Inflect a single word and serialize the result.
+
+    Args:
+        inflector: The Inflector to use.
+        lemma: The word to inflect.
+        part_of_speech: The expected part of speech.
+
+    Returns:
+        The serialized inflections, or an error object if inflection failed.
+    """
+    try:
+        features = feature_retriever.derive_features(part_of_speech)
+        return inflector.inflect(lemma, features, part_of_speech).json()
+    except InflectionError as e:
+        return {
+            "partOfSpeech": part_of_speech.name,
+            "lemma": lemma,
+            "error": str(e),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inflect a batch of Russian words in parallel"
+    )
+    parser.add_argument("input_file", help="NDJSON file with one request per line")
+    parser.add_argument(
+        "--executor",
+        choices=(THREAD_EXECUTOR, PROCESS_EXECUTOR),
+        default=PROCESS_EXECUTOR,
+    )
+    parser.add_argument("--workers", type=int, help="Number of workers")
+    parser.add_argument("--tiered", action="store_true", help="Use tiered parsing")
+    parser.add_argument("--output", help="Output NDJSON file. Defaults to stdout")
+    args = parser.parse_args()
+
+    with open(args.input_file, "r", encoding="utf-8") as f:
+        requests = [InflectionRequest(**json.loads(line)) for line in f if line.strip()]
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for result in inflect_batch(
+            requests, args.executor, args.workers, tiered=args.tiered
+        ):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
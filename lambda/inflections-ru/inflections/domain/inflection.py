@@ -5,7 +5,7 @@ This module defines the data structures for representing inflected words
 and collections of inflections.
 """
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pymorphy3.analyzer import Parse
 
 from .feature import Feature
@@ -39,17 +39,53 @@ class Inflections(BaseModel):
     """
     Container for all inflections of a word.
 
+    Instances are immutable, so a result can be handed across threads safely.
+    Use from_parse() to create an instance that carries the underlying parse.
+
     Attributes:
         part_of_speech: The part of speech of the word.
         lemma: The dictionary/base form of the word.
         inflections: List of all inflected forms.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     part_of_speech: PartOfSpeech
     lemma: str
     inflections: list[Inflection]
     _parse: Parse = PrivateAttr()
 
+    @classmethod
+    def from_parse(
+        cls,
+        parse: Parse,
+        part_of_speech: PartOfSpeech,
+        inflections: list[Inflection],
+    ) -> "Inflections":
+        """
+        Create the inflections container for a pymorphy3 parse.
+
+        Args:
+            parse: The validated parse the inflections were generated from.
+            part_of_speech: The part of speech of the word.
+            inflections: List of all inflected forms.
+
+        Returns:
+            An Inflections object whose lemma is the parse's normal form.
+        """
+        result = cls(
+            part_of_speech=part_of_speech,
+            lemma=parse.normal_form,
+            inflections=inflections,
+        )
+        result._parse = parse
+        return result
+
+    @property
+    def parse(self) -> Parse:
+        """The pymorphy3 parse the inflections were generated from."""
+        return self._parse
+
     def json(self, **kwargs) -> dict:
         """Serialize the inflections container to a JSON-compatible dictionary."""
         return {
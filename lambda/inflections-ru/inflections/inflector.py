@@ -6,16 +6,22 @@ grammatical features using pymorphy3.
 """
 
 import logging
+import threading
 
 import feature_retriever
 import pymorphy3
 from domain.inflection import Inflection, Inflections
 from domain.part_of_speech import PartOfSpeech
 from pymorphy3.analyzer import Parse
+from pymorphy3.units import DictionaryAnalyzer
 
 # Default minimum confidence score required for a parse to be considered valid
 DEFAULT_CONFIDENCE_THRESHOLD = 0.5
 
+# Names of the analyzer tiers used in tiered parsing mode
+DICTIONARY_TIER = "dictionary"
+PREDICTOR_TIER = "predictor"
+
 # Mapping from pymorphy3 POS tags to our standardized PartOfSpeech enum
 _PYMORPHY_POS_MAP = {
     "NOUN": PartOfSpeech.NOUN,
@@ -31,6 +37,26 @@ _PYMORPHY_POS_MAP = {
 logger = logging.getLogger(__name__)
 
 
+def _dictionary_only(morph: pymorphy3.MorphAnalyzer) -> pymorphy3.MorphAnalyzer:
+    """
+    Create a dictionary-only analyzer that shares the dictionary of another analyzer.
+
+    Constructing a MorphAnalyzer loads its own copy of the dictionary, so the
+    analyzer is cloned instead and only its units are replaced. Its parses are
+    bound to `morph`, so that they inflect exactly like parses of `morph`.
+
+    Args:
+        morph: The full analyzer whose dictionary is reused.
+
+    Returns:
+        An analyzer that only consults the dictionary.
+    """
+    dictionary_morph = object.__new__(pymorphy3.MorphAnalyzer)
+    dictionary_morph.__dict__.update(morph.__dict__)
+    dictionary_morph._init_units([DictionaryAnalyzer()])
+    return dictionary_morph
+
+
 class InflectionError(Exception):
     """Base exception for inflection-related errors."""
 
@@ -81,21 +107,47 @@ class Inflector:
     grammatical features, with configurable confidence thresholds for
     parse validation.
 
+    In tiered mode, words are first parsed by a dictionary-only analyzer.
+    The full analyzer, which includes the suffix/prefix predictor units,
+    is only consulted for words that are not in the dictionary.
+
+    An Inflector is safe to share between threads: the analyzers are built
+    once in __init__ and only read afterwards, every call creates its own
+    result object, and the tier counters are updated under a lock.
+
     Attributes:
         confidence_threshold: Minimum confidence score required for a parse
                               to be considered valid.
+        tiered: Whether the dictionary-only analyzer is tried first.
+        tier_counts: Number of parses served by each analyzer tier in tiered mode.
     """
 
-    def __init__(self, confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD):
+    def __init__(
+        self,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        tiered: bool = False,
+    ):
         """
         Initialize the Inflector.
 
         Args:
             confidence_threshold: Minimum confidence score for parse validation.
                                   Defaults to DEFAULT_CONFIDENCE_THRESHOLD (0.2).
+            tiered: Try a dictionary-only analyzer before the full analyzer.
+                    Defaults to False.
         """
         self.confidence_threshold = confidence_threshold
+        self.tiered = tiered
+        self._tier_counts = {DICTIONARY_TIER: 0, PREDICTOR_TIER: 0}
+        self._tier_counts_lock = threading.Lock()
         self._morph = pymorphy3.MorphAnalyzer()
+        self._dictionary_morph = _dictionary_only(self._morph) if tiered else None
+
+    @property
+    def tier_counts(self) -> dict[str, int]:
+        """Snapshot of the number of parses served by each analyzer tier."""
+        with self._tier_counts_lock:
+            return dict(self._tier_counts)
 
     def inflect(
         self,
@@ -124,13 +176,7 @@ class Inflector:
         inflections = [
             self._create_inflection(parse, feature_set) for feature_set in features
         ]
-        result = Inflections(
-            part_of_speech=expected_pos,
-            lemma=parse.normal_form,
-            inflections=inflections,
-        )
-        result._parse = parse
-        return result
+        return Inflections.from_parse(parse, expected_pos, inflections)
 
     def _get_validated_parse(
         self,
@@ -155,7 +201,7 @@ class Inflector:
             LowConfidenceError: If the best parse has a score below the threshold.
             POSMismatchError: If the parsed POS doesn't match the expected POS.
         """
-        parses = self._morph.parse(word)
+        parses = self._parse_word(word)
 
         # Select the parse with the highest confidence score
         best_parse = max(parses, key=lambda p: p.score)
@@ -175,6 +221,37 @@ class Inflector:
 
         return best_parse
 
+    def _parse_word(self, word: str) -> list[Parse]:
+        """
+        Parse a word, using the dictionary-only analyzer first in tiered mode.
+
+        Falls back to the full analyzer (including predictor units) only if the
+        dictionary does not know the word. Low-scoring dictionary parses are kept:
+        the full analyzer stops after its dictionary units for known words, so
+        re-running it could not produce a more confident parse.
+
+        Args:
+            word: The word to parse.
+
+        Returns:
+            All parses for the word.
+        """
+        if self._dictionary_morph is None:
+            return self._morph.parse(word)
+
+        parses = self._dictionary_morph.parse(word)
+        if parses:
+            self._count_tier(DICTIONARY_TIER)
+            return parses
+
+        self._count_tier(PREDICTOR_TIER)
+        return self._morph.parse(word)
+
+    def _count_tier(self, tier: str) -> None:
+        """Increment the counter of an analyzer tier."""
+        with self._tier_counts_lock:
+            self._tier_counts[tier] += 1
+
     @staticmethod
     def _create_inflection(parsed: Parse, features: set[str]) -> Inflection:
         """
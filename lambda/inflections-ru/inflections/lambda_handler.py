@@ -7,6 +7,7 @@ inflection requests for Russian words.
 
 import json
 import logging
+import os
 
 import feature_retriever
 import lambda_util
@@ -17,8 +18,9 @@ from pydantic.v1 import ValidationError
 logger = logging.getLogger("root")
 logger.setLevel(logging.INFO)
 
-# Create a singleton inflector instance with default confidence threshold
-_inflector = Inflector()
+# Create a singleton inflector instance with default confidence threshold.
+# TIERED_PARSING=true tries a dictionary-only analyzer before the predictor units.
+_inflector = Inflector(tiered=os.getenv("TIERED_PARSING", "false").lower() == "true")
 
 
 def handler(event, _):
@@ -76,9 +78,10 @@ def handler(event, _):
                 "success": True,
                 "word": request.lemma,
                 "part_of_speech": request.part_of_speech.name,
-                "detected_part_of_speech": str(inflections._parse.tag.POS),
-                "confidence": inflections._parse.score,
+                "detected_part_of_speech": str(inflections.parse.tag.POS),
+                "confidence": inflections.parse.score,
                 "inflections_count": len(inflections.inflections),
+                "tier_counts": _inflector.tier_counts,
             },
         )
 
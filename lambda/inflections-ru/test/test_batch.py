@@ -0,0 +1,55 @@
+"""
+Tests for the batch module.
+
+These tests verify that batches of words are inflected in request order with
+both executors, and that failures are reported per item.
+"""
+
+import pytest
+from batch import PROCESS_EXECUTOR, THREAD_EXECUTOR, inflect_batch
+from domain.inflection_request import InflectionRequest
+
+
+def _requests(*items: tuple[str, str]) -> list[InflectionRequest]:
+    return [InflectionRequest(lemma=lemma, pos=pos) for lemma, pos in items]
+
+
+class TestInflectBatch:
+    """Tests for the inflect_batch function."""
+
+    @pytest.mark.parametrize("executor", [THREAD_EXECUTOR, PROCESS_EXECUTOR])
+    def test_results_are_in_request_order(self, executor):
+        """Test that results are returned in the order of the requests."""
+        requests = _requests(
+            ("слово", "NOUN"), ("бежать", "VERB"), ("дом", "NOUN"), ("книга", "NOUN")
+        )
+
+        results = list(inflect_batch(requests, executor=executor, max_workers=2))
+
+        assert [r["lemma"] for r in results] == ["слово", "бежать", "дом", "книга"]
+        assert [len(r["inflections"]) for r in results] == [12, 6, 12, 12]
+
+    def test_failed_items_are_reported_individually(self):
+        """Test that an inflection error only affects its own item."""
+        requests = _requests(("бежать", "NOUN"), ("слово", "NOUN"))
+
+        results = list(inflect_batch(requests, max_workers=2))
+
+        assert results[0]["lemma"] == "бежать"
+        assert results[0]["partOfSpeech"] == "NOUN"
+        assert "error" in results[0]
+        assert "error" not in results[1]
+
+    def test_matches_sequential_inflection(self):
+        """Test that parallel results equal sequentially generated paradigms."""
+        requests = _requests(*[("слово", "NOUN"), ("красивый", "ADJ")] * 20)
+
+        sequential = list(inflect_batch(requests, max_workers=1))
+        parallel = list(inflect_batch(requests, max_workers=8))
+
+        assert parallel == sequential
+
+    def test_raises_for_unknown_executor(self):
+        """Test that an unknown executor is rejected immediately."""
+        with pytest.raises(ValueError, match="Unsupported executor"):
+            inflect_batch(_requests(("слово", "NOUN")), executor="fiber")
@@ -5,13 +5,16 @@ These tests verify the Russian word inflection functionality including
 validation of confidence scores and part of speech matching.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 from domain.feature import Case, Number
 from domain.part_of_speech import PartOfSpeech
-from inflector import (DEFAULT_CONFIDENCE_THRESHOLD, Inflector,
-                       LowConfidenceError, POSMismatchError)
+from inflector import (DEFAULT_CONFIDENCE_THRESHOLD, DICTIONARY_TIER,
+                       PREDICTOR_TIER, Inflector, LowConfidenceError,
+                       POSMismatchError)
+from pydantic import ValidationError
 
 
 class TestInflect:
@@ -274,3 +277,95 @@ class TestInflectorConfiguration:
             expected_pos=PartOfSpeech.NOUN,
         ).inflections
         assert len(result) == 1
+
+
+class TestTieredParsing:
+    """Tests for the dictionary-first tiered parsing mode."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.inflector = Inflector(tiered=True)
+
+    def test_default_inflector_is_not_tiered(self):
+        """Test that tiered parsing is opt-in."""
+        inflector = Inflector()
+        assert inflector.tiered is False
+        inflector.inflect("слово", [{"sing", "nomn"}], PartOfSpeech.NOUN)
+        assert inflector.tier_counts == {DICTIONARY_TIER: 0, PREDICTOR_TIER: 0}
+
+    def test_tiers_share_one_dictionary(self):
+        """Test that tiered mode does not load a second dictionary."""
+        assert (
+            self.inflector._dictionary_morph.dictionary
+            is self.inflector._morph.dictionary
+        )
+
+    def test_dictionary_word_is_served_by_dictionary_tier(self):
+        """Test that known words do not reach the predictor units."""
+        with patch.object(self.inflector, "_morph") as mock_morph:
+            result = self.inflector.inflect(
+                "слово", [{"plur", "gent"}], PartOfSpeech.NOUN
+            )
+
+        mock_morph.parse.assert_not_called()
+        assert result.inflections[0].inflected == "слов"
+        assert self.inflector.tier_counts == {DICTIONARY_TIER: 1, PREDICTOR_TIER: 0}
+
+    def test_unknown_word_falls_back_to_predictor_tier(self):
+        """Test that words unknown to the dictionary use the full analyzer."""
+        result = self.inflector.inflect(
+            "гуглить", [{"1per", "sing"}], PartOfSpeech.VERB
+        )
+
+        assert result.parse.normal_form == "гуглить"
+        assert self.inflector.tier_counts == {DICTIONARY_TIER: 0, PREDICTOR_TIER: 1}
+
+    @pytest.mark.parametrize(
+        "word,pos",
+        [
+            ("дом", PartOfSpeech.NOUN),
+            ("красивый", PartOfSpeech.ADJ),
+            ("бежать", PartOfSpeech.VERB),
+        ],
+    )
+    def test_tiered_output_matches_default(self, word, pos):
+        """Test that tiered parsing yields the same inflections as the default mode."""
+        features = [{"sing", "gent"}, {"plur", "nomn"}]
+        if pos == PartOfSpeech.VERB:
+            features = [{"1per", "sing"}, {"3per", "plur"}]
+
+        expected = Inflector().inflect(word, features, pos)
+        actual = self.inflector.inflect(word, features, pos)
+
+        assert actual.json() == expected.json()
+        assert actual.parse.score == expected.parse.score
+
+
+class TestConcurrency:
+    """Tests for sharing an Inflector between threads."""
+
+    def test_concurrent_inflections_are_isolated(self):
+        """Test that concurrent calls neither mix up results nor lose tier counts."""
+        inflector = Inflector(tiered=True)
+        words = [("слово", PartOfSpeech.NOUN), ("бежать", PartOfSpeech.VERB)] * 50
+
+        def inflect(item):
+            word, pos = item
+            features = (
+                [{"plur", "gent"}] if pos == PartOfSpeech.NOUN else [{"1per", "sing"}]
+            )
+            return inflector.inflect(word, features, pos)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(inflect, words))
+
+        assert [r.parse.word for r in results] == [word for word, _ in words]
+        assert [r.inflections[0].inflected for r in results[:2]] == ["слов", "бегу"]
+        assert inflector.tier_counts[DICTIONARY_TIER] == len(words)
+
+    def test_inflections_are_immutable(self):
+        """Test that results cannot be modified after creation."""
+        result = Inflector().inflect("слово", [{"sing", "nomn"}], PartOfSpeech.NOUN)
+
+        with pytest.raises(ValidationError):
+            result.lemma = "дом"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark warm request latency with per-request vs. shared translation clients.
+
+Every engine is served by a local stand-in server, which delays each new
+connection to emulate a TLS handshake. "per_request" creates the translator,
+and so its client and connections, for every request, as the handler used to;
+"shared" reuses the translator and its pooled connections across requests.
+
+Usage:
+    python benchmark/benchmark_clients.py [--rounds 50] [--handshake-ms 30]
+                                          [--latency-ms 20] [--output results.ndjson]
+"""
+
+import argparse
+import logging
+import os
+import time
+
+# report puts the Lambda modules on sys.path, so it has to be imported first
+from report import emit, metadata, summarize
+
+# isort: split
+import metrics
+import translator
+from data import TranslationEngine
+from stand_in_server import StandInServer
+
+
+def run(engine: TranslationEngine, rounds: int, shared: bool) -> dict:
+    """
+    Translate a word `rounds` times with an engine.
+    :param engine: The engine to translate with
+    :param rounds: Number of requests
+    :param shared: Whether the translator is kept between requests
+    :return: Latency statistics of the requests
+    """
+    translator._translators.clear()
+    timings: list[float] = []
+    for _ in range(rounds):
+        if not shared:
+            translator._translators.clear()
+        start = time.perf_counter()
+        translator.get_translator(engine).translate("word", "en", "de", "context")
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=50, help="Requests per mode")
+    parser.add_argument(
+        "--handshake-ms", type=float, default=30, help="Delay of new connections"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20, help="Delay of every response"
+    )
+    parser.add_argument("--output", help="Append the report to this NDJSON file")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    # The report is written to stdout, too
+    metrics.ENABLED = False
+
+    results = {}
+    with StandInServer(
+        delay=args.latency_ms / 1e3, handshake_delay=args.handshake_ms / 1e3
+    ) as server:
+        os.environ.update(
+            {
+                "OPENAI_API_KEY": "stand-in",
+                "OPENAI_API_URL": server.url + "/v1/chat/completions",
+                "DEEPL_API_KEY": "stand-in:fx",
+                "DEEPL_SERVER_URL": server.url,
+                "AWS_ENDPOINT_URL": server.url,
+                "AWS_DEFAULT_REGION": "eu-central-1",
+                "AWS_ACCESS_KEY_ID": "stand-in",
+                "AWS_SECRET_ACCESS_KEY": "stand-in",
+            }
+        )
+        for engine in TranslationEngine:
+            results[engine.value] = {
+                "per_request": run(engine, args.rounds, shared=False),
+                "shared": run(engine, args.rounds, shared=True),
+            }
+
+    emit(
+        {
+            "benchmark": "clients",
+            "meta": metadata(),
+            "config": {
+                "handshake_ms": args.handshake_ms,
+                "latency_ms": args.latency_ms,
+            },
+            "results": results,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Helpers for reporting benchmark results in a machine-readable form.
+"""
+
+import datetime
+import json
+import platform
+import statistics
+import sys
+import tomllib
+from pathlib import Path
+from typing import Optional
+
+SERVICE_ROOT = Path(__file__).resolve().parent.parent
+
+# Make the Lambda modules importable
+sys.path.insert(0, str(SERVICE_ROOT))
+
+
+def summarize(timings: list[float]) -> dict:
+    """Reduce a list of latencies in seconds to statistics in milliseconds."""
+    timings = sorted(t * 1e3 for t in timings)
+    return {
+        "count": len(timings),
+        "mean_ms": round(statistics.fmean(timings), 2),
+        "p50_ms": round(timings[len(timings) // 2], 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95)], 2),
+        "p99_ms": round(timings[int(len(timings) * 0.99)], 2),
+    }
+
+
+def metadata() -> dict:
+    """Describe the environment a benchmark ran in."""
+    with open(SERVICE_ROOT / "pyproject.toml", "rb") as f:
+        project = tomllib.load(f)["project"]
+
+    return {
+        "service": project["name"],
+        "version": project["version"],
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def emit(report: dict, output: Optional[str] = None) -> None:
+    """
+    Print a report as JSON and optionally append it to an NDJSON file.
+    :param report: The report to emit
+    :param output: Path of an NDJSON file that collects reports across runs
+    """
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if output:
+        with open(output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report, ensure_ascii=False) + "\n")
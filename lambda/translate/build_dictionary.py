@@ -0,0 +1,78 @@
+"""
+Compiles the bilingual dictionary of a language pair for the dictionary tier of the translate Lambda.
+
+Reads pipe-separated word|gloss lines, the format of lambda/preprocessing/data/in, and writes
+dictionaries/<source>-<target>.dict. Only rows whose first column is a single word become entries;
+phrases are skipped, because the dictionary only answers single-word requests.
+
+Usage:
+    python build_dictionary.py ../preprocessing/data/in/es.csv --target en
+    python build_dictionary.py words.csv --source es --target de --output /tmp/es-de.dict
+"""
+
+import argparse
+import csv
+import os
+from typing import Iterable
+
+from data import valid_languages
+from dictionary import DICTIONARY_DIR, headword, write_dictionary
+
+# Stripped from glosses of single words, e.g. "Hello." becomes "Hello"
+_SENTENCE_PUNCTUATION = ".!?¡¿ "
+
+
+def read_entries(lines: Iterable[str]) -> tuple[list[tuple[str, str]], int]:
+    """
+    Read (word, gloss) pairs from pipe-separated lines.
+    :param lines: Lines of word|gloss or phrase|translation rows
+    :return: The entries, and the number of rows skipped because they are not a single word or incomplete
+    """
+    entries = []
+    skipped = 0
+    for row in csv.reader(lines, delimiter="|"):
+        if len(row) < 2:
+            skipped += 1
+            continue
+        word, gloss = row[0].strip(), row[1].strip(_SENTENCE_PUNCTUATION)
+        if len(word.split()) != 1 or not headword(word) or not gloss:
+            skipped += 1
+            continue
+        entries.append((word, gloss))
+    return entries, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("csv", help="Pipe-separated word|gloss file")
+    parser.add_argument(
+        "--source",
+        choices=valid_languages,
+        help="Language of the words. Defaults to the name of the CSV file, e.g. es for es.csv",
+    )
+    parser.add_argument(
+        "--target",
+        choices=valid_languages,
+        required=True,
+        help="Language of the glosses",
+    )
+    parser.add_argument(
+        "--output",
+        help="File to write. Defaults to dictionaries/<source>-<target>.dict",
+    )
+    args = parser.parse_args()
+
+    source = args.source or os.path.splitext(os.path.basename(args.csv))[0]
+    if source not in valid_languages:
+        parser.error(f"Unknown source language '{source}', please pass --source")
+    output = args.output or os.path.join(DICTIONARY_DIR, f"{source}-{args.target}.dict")
+
+    with open(args.csv, encoding="utf-8") as f:
+        entries, skipped = read_entries(f)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    count = write_dictionary(entries, output)
+    print(f"Wrote {count} entries to {output}, skipped {skipped} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,25 @@
+import re
 from enum import Enum
 from typing import Optional
 
 valid_languages = ["de", "en", "es", "fr", "it", "pt", "ru"]
 
+# Maximum number of texts in a batch request
+MAX_BATCH_SIZE = 500
+
+# Maximum number of tokens glossed per request
+MAX_GLOSS_TOKENS = 100
+
+# Words of a phrase, including contractions and hyphenated compounds
+_TOKEN_PATTERN = re.compile(r"\w+(?:[-'’]\w+)*")
+
+
+def tokenize(phrase: str) -> list[str]:
+    """
+    Split a phrase into its distinct words, in order of first occurrence.
+    """
+    return list(dict.fromkeys(_TOKEN_PATTERN.findall(phrase)))
+
 
 class TranslationEngine(Enum):
     AWS = "aws"
@@ -47,3 +64,126 @@ class Request:
         self.target_language = target_language
         self.context = context
         self.translation_engine = translation_engine
+
+
+class BatchRequest:
+    """
+    Several texts translated with the same source and target language.
+    Each item is either a text or an object with a "text" and an optional "context".
+    """
+
+    items: list[Request]
+    source_language: str
+    target_language: str
+    translation_engine: TranslationEngine
+
+    def __init__(
+        self,
+        items: list,
+        source_language: str,
+        target_language: str,
+        translation_engine: TranslationEngine,
+    ):
+        if not isinstance(items, list) or not items:
+            raise ValueError("Texts must be a non-empty list")
+
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"At most {MAX_BATCH_SIZE} texts can be translated at once"
+            )
+
+        self.items = [
+            self._parse_item(item, source_language, target_language, translation_engine)
+            for item in items
+        ]
+        self.source_language = source_language
+        self.target_language = target_language
+        self.translation_engine = translation_engine
+
+    @staticmethod
+    def _parse_item(
+        item,
+        source_language: str,
+        target_language: str,
+        translation_engine: TranslationEngine,
+    ) -> Request:
+        """
+        Validate an item like a single request, after checking that its text and context are strings.
+        """
+        text = item.get("text") if isinstance(item, dict) else item
+        context = item.get("context") if isinstance(item, dict) else None
+        if not isinstance(text, str) or not text:
+            raise ValueError("Texts must be non-empty strings")
+        if context is not None and not isinstance(context, str):
+            raise ValueError("Contexts must be strings")
+        return Request(
+            text, source_language, target_language, translation_engine, context
+        )
+
+    @property
+    def context(self) -> Optional[str]:
+        """
+        The first context of the items, if any. Requires a context-capable engine for the whole batch.
+        """
+        return next((item.context for item in self.items if item.context), None)
+
+
+class GlossRequest:
+    """
+    Tokens of a phrase, each translated as it is used in the phrase.
+    If no tokens are given, every word of the phrase is glossed.
+    """
+
+    phrase: str
+    tokens: list[str]
+    source_language: str
+    target_language: str
+    translation_engine: TranslationEngine
+
+    def __init__(
+        self,
+        phrase: str,
+        tokens: Optional[list[str]],
+        source_language: str,
+        target_language: str,
+        translation_engine: TranslationEngine,
+    ):
+        if not phrase or not isinstance(phrase, str):
+            raise ValueError("Phrase cannot be empty")
+
+        if not source_language or not target_language:
+            raise ValueError("Source and target languages must be provided")
+
+        if (
+            source_language not in valid_languages
+            or target_language not in valid_languages
+        ):
+            raise ValueError("Invalid source or target language")
+
+        if tokens is None:
+            tokens = tokenize(phrase)
+        elif not isinstance(tokens, list) or not all(
+            isinstance(token, str) and token.strip() for token in tokens
+        ):
+            raise ValueError("Tokens must be a list of non-empty strings")
+
+        if not tokens:
+            raise ValueError("Phrase contains no tokens to gloss")
+
+        if len(tokens) > MAX_GLOSS_TOKENS:
+            raise ValueError(
+                f"At most {MAX_GLOSS_TOKENS} tokens can be glossed at once"
+            )
+
+        self.phrase = phrase
+        self.tokens = list(dict.fromkeys(tokens))
+        self.source_language = source_language
+        self.target_language = target_language
+        self.translation_engine = translation_engine
+
+    @property
+    def context(self) -> str:
+        """
+        The phrase, which is the context of every token. Requires a context-capable engine.
+        """
+        return self.phrase
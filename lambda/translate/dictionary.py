@@ -0,0 +1,154 @@
+import logging
+import mmap
+import os
+import string
+import struct
+import threading
+import unicodedata
+from typing import Iterable, Optional
+
+logger = logging.getLogger("root")
+
+# Directory of the compiled dictionaries, named <source>-<target>.dict, e.g. es-en.dict
+DICTIONARY_DIR = os.getenv(
+    "TRANSLATE_DICTIONARY_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionaries"),
+)
+
+# Value of the "source" field of responses answered from a dictionary
+SOURCE = "dictionary"
+
+# File layout: header (magic, number of entries), an index of count + 1 offsets into the data section,
+# and the data section with one "<headword>\0<gloss>" record per entry, sorted by headword.
+# Offsets are relative to the start of the data section, all integers are little-endian.
+MAGIC = b"GRDICT\x00\x01"
+_HEADER = struct.Struct("<8sI")
+_OFFSET = struct.Struct("<I")
+
+# Stripped from headwords, so that e.g. "Hola." and "¡hola!" share an entry
+_PUNCTUATION = string.punctuation + "¡¿«»„“”‘’…–—"
+
+
+def headword(text: str) -> str:
+    """
+    Normalize a word for lookup: Unicode NFC, without surrounding whitespace and punctuation, case-folded.
+    """
+    return unicodedata.normalize("NFC", text).strip().strip(_PUNCTUATION).casefold()
+
+
+def write_dictionary(entries: Iterable[tuple[str, str]], path: str) -> int:
+    """
+    Compile (word, gloss) pairs into a dictionary file.
+    Words are normalized with headword(); the first gloss of a headword wins.
+    :param entries: The words and their glosses
+    :param path: The file to write
+    :return: The number of entries written
+    """
+    glosses: dict[bytes, bytes] = {}
+    for word, gloss in entries:
+        key = headword(word).encode()
+        if key and gloss and key not in glosses:
+            glosses[key] = gloss.encode()
+
+    records = [key + b"\0" + glosses[key] for key in sorted(glosses)]
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(records)))
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        for record in records:
+            f.write(record)
+    return len(records)
+
+
+class Dictionary:
+    """
+    A compiled dictionary of one language pair, memory-mapped rather than loaded.
+    Lookups binary-search the index, so only the pages of the records they compare are read.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a dictionary file")
+        self._data_start = _HEADER.size + (self._count + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Look up the gloss of a word.
+        :param word: The word, in any case and with or without surrounding punctuation
+        :return: The gloss, or None if the word is not in the dictionary
+        """
+        key = headword(word).encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record_key, gloss = self._record(middle)
+            if record_key == key:
+                return gloss.decode()
+            if record_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _record(self, index: int) -> tuple[bytes, bytes]:
+        start, end = struct.unpack_from(
+            "<2I", self._map, _HEADER.size + index * _OFFSET.size
+        )
+        record = self._map[self._data_start + start : self._data_start + end]
+        key, _, gloss = record.partition(b"\0")
+        return key, gloss
+
+    def close(self) -> None:
+        self._map.close()
+
+
+# Dictionaries are opened on first use and kept for the lifetime of the execution environment.
+# None marks language pairs without a dictionary.
+_dictionaries: dict[tuple[str, str], Optional[Dictionary]] = {}
+_lock = threading.Lock()
+
+
+def get_dictionary(source_language: str, target_language: str) -> Optional[Dictionary]:
+    """
+    Get the dictionary of a language pair, opening it on first use.
+    :return: The dictionary, or None if there is none for the language pair
+    """
+    pair = (source_language, target_language)
+    if pair not in _dictionaries:
+        with _lock:
+            if pair not in _dictionaries:
+                path = os.path.join(
+                    DICTIONARY_DIR, f"{source_language}-{target_language}.dict"
+                )
+                try:
+                    _dictionaries[pair] = Dictionary(path)
+                except FileNotFoundError:
+                    _dictionaries[pair] = None
+                except Exception as err:
+                    logger.warning(f"Could not open dictionary {path}: {err}")
+                    _dictionaries[pair] = None
+    return _dictionaries[pair]
+
+
+def lookup(text: str, source_language: str, target_language: str) -> Optional[str]:
+    """
+    Look up a single word in the dictionary of its language pair.
+    :return: The gloss, or None if the text is not a single word or not in the dictionary
+    """
+    if len(text.split()) != 1:
+        return None
+    dictionary = get_dictionary(source_language, target_language)
+    if dictionary is None:
+        return None
+    return dictionary.lookup(text)
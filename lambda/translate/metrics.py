@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+from data import TranslationEngine
+
+# CloudWatch namespace of the engine metrics
+NAMESPACE = os.getenv("TRANSLATE_METRICS_NAMESPACE", "grammr/translate")
+# "false" stops emitting metrics, e.g. for benchmarks that write to stdout
+ENABLED = os.getenv("TRANSLATE_METRICS", "true").lower() != "false"
+
+# Metrics of an engine call and their CloudWatch units. Optional metrics are only emitted by engines that report them.
+_UNITS = {
+    "Latency": "Milliseconds",
+    "Errors": "Count",
+    "Texts": "Count",
+    "BytesIn": "Bytes",
+    "BytesOut": "Bytes",
+    "BilledCharacters": "Count",
+    "PromptTokens": "Count",
+    "CompletionTokens": "Count",
+}
+
+
+def _size(texts: list[str]) -> int:
+    return sum(len(text.encode()) for text in texts)
+
+
+class EngineCall:
+    """
+    Measures a single call to a translation engine and emits it as a CloudWatch Embedded Metric Format (EMF) record.
+
+    Usage:
+        with EngineCall(self.engine, "translate", [text]) as call:
+            result = ...
+            call.record_output([result.text], billed_characters=result.billed_characters)
+    """
+
+    def __init__(self, engine: TranslationEngine, operation: str, texts: list[str]):
+        """
+        :param engine: The engine called
+        :param operation: The translator operation, e.g. "translate", "translate_batch" or "gloss"
+        :param texts: The texts sent to the engine
+        """
+        self.engine = engine
+        self.operation = operation
+        self.metrics: dict[str, float] = {"Texts": len(texts), "BytesIn": _size(texts)}
+
+    def record_output(
+        self,
+        texts: list[str],
+        billed_characters: Optional[int] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+    ) -> None:
+        """
+        Record the response of the engine.
+        :param texts: The texts received from the engine
+        :param billed_characters: Characters billed by DeepL or AWS Translate
+        :param prompt_tokens: Prompt tokens billed by OpenAI
+        :param completion_tokens: Completion tokens billed by OpenAI
+        """
+        self.metrics["BytesOut"] = _size(texts)
+        for name, value in [
+            ("BilledCharacters", billed_characters),
+            ("PromptTokens", prompt_tokens),
+            ("CompletionTokens", completion_tokens),
+        ]:
+            if value is not None:
+                self.metrics[name] = value
+
+    def __enter__(self) -> "EngineCall":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        self.metrics["Latency"] = round((time.perf_counter() - self._start) * 1e3, 3)
+        self.metrics["Errors"] = 0 if exc_type is None else 1
+        if ENABLED:
+            emit(self.record())
+
+    def record(self) -> dict:
+        """
+        Build the EMF record of the call, with the engine and operation as dimensions.
+        """
+        return {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": NAMESPACE,
+                        "Dimensions": [["Engine"], ["Engine", "Operation"]],
+                        "Metrics": [
+                            {"Name": name, "Unit": _UNITS[name]}
+                            for name in self.metrics
+                        ],
+                    }
+                ],
+            },
+            "Engine": self.engine.value,
+            "Operation": self.operation,
+            **self.metrics,
+        }
+
+
+def emit(record: dict) -> None:
+    """
+    Write an EMF record to stdout, where CloudWatch Logs extracts its metrics.
+    Written without the prefix of the Lambda log handler, since EMF requires each log event to be a JSON object.
+    """
+    sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,275 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, Optional, TypeVar
+
+from data import TranslationEngine
+from translator import Translator, get_executor
+
+logger = logging.getLogger("root")
+
+T = TypeVar("T")
+
+# Latency budget of a translation in seconds. Unset disables hedging and failover.
+LATENCY_BUDGET = os.getenv("TRANSLATE_LATENCY_BUDGET_SECONDS")
+# Seconds to wait for the primary engine before hedging with the secondary engine
+HEDGE_DELAY = float(os.getenv("TRANSLATE_HEDGE_DELAY_SECONDS", "1.0"))
+# Consecutive failures after which an engine is skipped, and seconds until it is tried again
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("TRANSLATE_BREAKER_FAILURES", "3"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("TRANSLATE_BREAKER_RESET_SECONDS", "30"))
+
+# Engines that can stand in for each other; only engines with the same capabilities qualify
+SECONDARY_ENGINES = {
+    TranslationEngine.DEEPL: TranslationEngine.AWS,
+    TranslationEngine.AWS: TranslationEngine.DEEPL,
+}
+
+
+class EngineUnavailableError(Exception):
+    """
+    Raised when no engine can serve a translation, because their circuit breakers are open.
+    """
+
+    pass
+
+
+class LatencyBudgetExceededError(Exception):
+    """
+    Raised when no engine answered within the latency budget.
+    """
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Skips an engine after repeated failures.
+    After `failure_threshold` consecutive failures, the breaker opens and rejects calls for `reset_timeout` seconds.
+    Then a single trial call is let through: success closes the breaker, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    @property
+    def can_probe(self) -> bool:
+        """
+        Check whether a call would be let through, without using up the trial call of an open breaker.
+        """
+        with self._lock:
+            return (
+                self._opened_at is None
+                or self._clock() - self._opened_at >= self.reset_timeout
+            )
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made, letting through one trial call once the reset timeout has passed.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                # Re-arm the timeout, so that only one trial call passes
+                self._opened_at = self._clock()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+
+
+_breakers: dict[TranslationEngine, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(engine: TranslationEngine) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker of an engine.
+    """
+    with _breakers_lock:
+        if engine not in _breakers:
+            _breakers[engine] = CircuitBreaker()
+        return _breakers[engine]
+
+
+class ResilientTranslator(Translator):
+    """
+    Translates with a primary engine within a latency budget.
+
+    If the primary engine has not answered after the hedge delay, or has failed, the same call is sent to the
+    secondary engine, and whichever answer arrives first is returned; the other call is ignored. Engines whose
+    circuit breaker is open are skipped. `call_attributed` reports the engine that actually answered, so that e.g. the
+    cache files a hedged translation under the secondary engine rather than the primary one.
+    """
+
+    def __init__(
+        self,
+        primary: Translator,
+        secondary: Optional[Translator],
+        budget: float,
+        hedge_delay: Optional[float] = None,
+    ):
+        """
+        :param primary: The translator of the requested engine
+        :param secondary: The translator to hedge and fail over with, if any
+        :param budget: Seconds to wait for an answer in total
+        :param hedge_delay: Seconds to wait for the primary engine before hedging. Defaults to HEDGE_DELAY.
+        """
+        self.primary = primary
+        self.secondary = secondary
+        self.budget = budget
+        self.hedge_delay = HEDGE_DELAY if hedge_delay is None else hedge_delay
+        self.engine = primary.engine
+        self.supports_context = primary.supports_context
+        # The translator that produced the latest result, for logging
+        self.answered_by: Optional[Translator] = None
+
+    def translate(
+        self, text: str, source_language: str, target_language: str, context: str
+    ) -> str:
+        return self._call(
+            lambda translator: translator.translate(
+                text, source_language, target_language, context
+            )
+        )[0]
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> list[str]:
+        return self._call(
+            lambda translator: translator.translate_batch(
+                texts, source_language, target_language, contexts
+            )
+        )[0]
+
+    def gloss(
+        self,
+        phrase: str,
+        tokens: list[str],
+        source_language: str,
+        target_language: str,
+    ) -> dict[str, str]:
+        return self._call(
+            lambda translator: translator.gloss(
+                phrase, tokens, source_language, target_language
+            )
+        )[0]
+
+    def call_attributed(
+        self, operation: Callable[[Translator], T]
+    ) -> tuple[T, TranslationEngine]:
+        """
+        Run an operation hedged, and report the engine that answered, which may be the secondary engine.
+        """
+        return self._call(operation)
+
+    def _call(
+        self, operation: Callable[[Translator], T]
+    ) -> tuple[T, TranslationEngine]:
+        """
+        Run an operation on the primary translator, hedged with the secondary translator.
+        The calls run on the executors of their engines, so that a slow call can be hedged or abandoned.
+        :raises EngineUnavailableError: If the breakers of all engines are open
+        :raises LatencyBudgetExceededError: If no engine answered within the budget
+        :return: The first successful result, and the engine that produced it
+        """
+        deadline = time.monotonic() + self.budget
+        candidates = [
+            translator
+            for translator in (self.primary, self.secondary)
+            if translator is not None
+        ]
+
+        pending: dict[Future, Translator] = {}
+        last_error: Optional[Exception] = None
+        while True:
+            # Start the next engine if nothing is running, or the running call has exceeded the hedge delay
+            if candidates and (not pending or time.monotonic() >= hedge_at):
+                translator = candidates.pop(0)
+                if get_breaker(translator.engine).allow():
+                    future = get_executor(translator.engine).submit(
+                        operation, translator
+                    )
+                    pending[future] = translator
+                    hedge_at = time.monotonic() + self.hedge_delay
+                else:
+                    logger.warning(f"Skipping {translator.engine.value}: circuit open")
+                continue
+
+            if not pending:
+                if last_error is not None:
+                    raise last_error
+                raise EngineUnavailableError(
+                    "No translation engine is available, please try again later"
+                )
+
+            timeout = deadline - time.monotonic()
+            if candidates:
+                timeout = min(timeout, hedge_at - time.monotonic())
+            done, _ = wait(
+                pending, timeout=max(timeout, 0), return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                translator = pending.pop(future)
+                breaker = get_breaker(translator.engine)
+                try:
+                    result = future.result()
+                except Exception as err:
+                    breaker.record_failure()
+                    logger.warning(f"{translator.engine.value} failed: {err}")
+                    last_error = err
+                    # Fail over right away
+                    hedge_at = time.monotonic()
+                    continue
+                breaker.record_success()
+                self.answered_by = translator
+                # The other call is abandoned; its result is ignored
+                for other in pending:
+                    other.cancel()
+                return result, translator.engine
+
+            if not done and time.monotonic() >= deadline:
+                for future, translator in pending.items():
+                    future.cancel()
+                    # A call that outlasts the budget counts as a failure
+                    get_breaker(translator.engine).record_failure()
+                raise LatencyBudgetExceededError(
+                    f"No translation within {self.budget}s"
+                )
+
+
+def latency_budget() -> Optional[float]:
+    """
+    Get the configured latency budget in seconds, or None if hedging and failover are disabled.
+    """
+    return float(LATENCY_BUDGET) if LATENCY_BUDGET else None
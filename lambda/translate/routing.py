@@ -0,0 +1,277 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+import resilience
+from data import TranslationEngine
+from translator import Translator
+
+logger = logging.getLogger("root")
+
+# "static" uses the requested engine; "adaptive" picks the fastest healthy engine
+ROUTING_POLICY = os.getenv("TRANSLATE_ROUTING", "static")
+ADAPTIVE = "adaptive"
+
+# Number of recent calls per engine that latency and error rate are computed from
+WINDOW = int(os.getenv("TRANSLATE_ROUTING_WINDOW", "50"))
+# Calls needed before an engine's latency is trusted; engines with fewer are tried first
+MIN_SAMPLES = 5
+# Engines failing more often than this are avoided
+MAX_ERROR_RATE = 0.5
+# Share of requests routed to a random candidate, to keep the latency of other engines current and let failed
+# engines recover
+EXPLORATION_RATE = float(os.getenv("TRANSLATE_ROUTING_EXPLORATION_RATE", "0.05"))
+
+
+class EngineStats:
+    """
+    Rolling latency and error rate of an engine over its most recent calls.
+    """
+
+    def __init__(self, window: int = WINDOW):
+        # (latency in seconds or None, success) per call
+        self._calls: deque[tuple[Optional[float], bool]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: Optional[float], success: bool) -> None:
+        """
+        Record a call.
+        :param latency: Seconds the call took, or None if it is not comparable, e.g. a batch call
+        :param success: Whether the call succeeded
+        """
+        with self._lock:
+            self._calls.append((latency, success))
+
+    @property
+    def samples(self) -> int:
+        return sum(
+            1 for latency, success in self._calls if latency is not None and success
+        )
+
+    @property
+    def error_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for _, success in self._calls if not success) / len(self._calls)
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        latencies = [
+            latency
+            for latency, success in self._calls
+            if latency is not None and success
+        ]
+        return sum(latencies) / len(latencies) if latencies else None
+
+    def snapshot(self) -> dict:
+        mean_latency = self.mean_latency
+        return {
+            "latency_ms": (
+                round(mean_latency * 1e3, 1) if mean_latency is not None else None
+            ),
+            "error_rate": round(self.error_rate, 3),
+            "samples": self.samples,
+        }
+
+
+class Router:
+    """
+    Picks the engine for a request from rolling per-engine latency and error rates.
+    """
+
+    def __init__(
+        self,
+        window: int = WINDOW,
+        min_samples: int = MIN_SAMPLES,
+        max_error_rate: float = MAX_ERROR_RATE,
+        exploration_rate: float = EXPLORATION_RATE,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.exploration_rate = exploration_rate
+        self._rng = rng
+        self._stats: dict[TranslationEngine, EngineStats] = {}
+        self._lock = threading.Lock()
+
+    def stats(self, engine: TranslationEngine) -> EngineStats:
+        with self._lock:
+            if engine not in self._stats:
+                self._stats[engine] = EngineStats(self.window)
+            return self._stats[engine]
+
+    def choose(
+        self, requested: TranslationEngine, candidates: list[TranslationEngine]
+    ) -> tuple[TranslationEngine, str]:
+        """
+        Choose the engine for a request.
+        :param requested: The engine the client asked for, preferred on ties
+        :param candidates: The configured engines able to serve the request
+        :return: The engine, and the reason for choosing it
+        """
+        if len(candidates) < 2:
+            return (candidates[0] if candidates else requested), "only candidate"
+
+        healthy = [
+            engine
+            for engine in candidates
+            if self.stats(engine).error_rate <= self.max_error_rate
+            and not resilience.get_breaker(engine).is_open
+        ]
+        if self._rng() < self.exploration_rate:
+            # Unhealthy engines are explored too, so that they can recover once their breaker lets a trial call through
+            probeable = [
+                engine
+                for engine in candidates
+                if resilience.get_breaker(engine).can_probe
+            ]
+            if probeable:
+                index = int(self._rng() * len(probeable)) % len(probeable)
+                return probeable[index], "exploration"
+
+        if not healthy:
+            return requested, "no healthy engine"
+
+        # Collect enough samples of every engine before comparing them
+        undersampled = [
+            engine
+            for engine in healthy
+            if self.stats(engine).samples < self.min_samples
+        ]
+        if undersampled:
+            engine = requested if requested in undersampled else undersampled[0]
+            return engine, "collecting samples"
+
+        fastest = min(
+            healthy,
+            key=lambda engine: (self.stats(engine).mean_latency, engine != requested),
+        )
+        return fastest, "fastest healthy engine"
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            engines = list(self._stats)
+        return {engine.value: self.stats(engine).snapshot() for engine in engines}
+
+
+class MeasuredTranslator(Translator):
+    """
+    Records the latency and outcome of every engine call with the router.
+    Only single translations are comparable in latency; batch and gloss calls only count towards the error rate.
+    """
+
+    def __init__(self, translator: Translator, router: Router):
+        self.translator = translator
+        self.router = router
+        self.engine = translator.engine
+        self.supports_context = translator.supports_context
+        # The routing decision that selected this translator, for logging
+        self.decision: Optional[dict] = None
+
+    def translate(
+        self, text: str, source_language: str, target_language: str, context: str
+    ) -> str:
+        return self._measure(
+            lambda: self.translator.translate(
+                text, source_language, target_language, context
+            ),
+            comparable=True,
+        )
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> list[str]:
+        return self._measure(
+            lambda: self.translator.translate_batch(
+                texts, source_language, target_language, contexts
+            )
+        )
+
+    def gloss(
+        self,
+        phrase: str,
+        tokens: list[str],
+        source_language: str,
+        target_language: str,
+    ) -> dict[str, str]:
+        return self._measure(
+            lambda: self.translator.gloss(
+                phrase, tokens, source_language, target_language
+            )
+        )
+
+    def _measure(self, call: Callable, comparable: bool = False):
+        stats = self.router.stats(self.engine)
+        start = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            stats.record(None, success=False)
+            raise
+        latency = time.perf_counter() - start
+        stats.record(latency if comparable else None, success=True)
+        logger.info(
+            json.dumps(
+                {
+                    "engine": self.engine.value,
+                    "observed_latency_ms": round(latency * 1e3, 1),
+                    "comparable": comparable,
+                }
+            )
+        )
+        return result
+
+
+_router = Router()
+
+
+def get_router() -> Router:
+    """
+    Get the process-wide router, whose statistics persist across invocations.
+    """
+    return _router
+
+
+def is_adaptive() -> bool:
+    """
+    Check whether adaptive routing is enabled via TRANSLATE_ROUTING.
+    """
+    return ROUTING_POLICY == ADAPTIVE
+
+
+def route(
+    requested: TranslationEngine, candidates: list[TranslationEngine]
+) -> tuple[TranslationEngine, dict]:
+    """
+    Choose an engine with the process-wide router and log the decision.
+    :return: The engine, and the logged decision
+    """
+    engine, reason = get_router().choose(requested, candidates)
+    return engine, log_decision(requested, engine, reason)
+
+
+def log_decision(
+    requested: TranslationEngine, chosen: TranslationEngine, reason: str
+) -> dict:
+    """
+    Log a routing decision together with the statistics it was based on.
+    :return: The logged decision
+    """
+    decision = {
+        "requested": requested.value,
+        "chosen": chosen.value,
+        "reason": reason,
+        "engines": get_router().snapshot(),
+    }
+    logger.info(json.dumps({"routing": decision}))
+    return decision
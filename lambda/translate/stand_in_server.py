@@ -0,0 +1,181 @@
+"""
+Local stand-in for the HTTP APIs of the translation engines.
+
+Serves the endpoints used by the translators (OpenAI chat completions, DeepL
+v2/translate and AWS Translate TranslateText) on localhost, so that tests and
+benchmarks can exercise the real HTTP clients without network access or
+credentials. Point the translators at it with OPENAI_API_URL,
+DEEPL_SERVER_URL and AWS_ENDPOINT_URL.
+
+Usage:
+    with StandInServer(delay=0.05) as server:
+        os.environ["OPENAI_API_URL"] = server.url + "/v1/chat/completions"
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+
+def _translate(text: str, target_language: str) -> str:
+    return f"{text} ({target_language.lower()})"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections alive, like the real APIs
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; don't let Nagle's algorithm
+        # hold back the body of responses on a reused connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        stand_in = self.server.stand_in
+        with stand_in.lock:
+            stand_in.connections += 1
+        # Emulates the TLS handshake round trips of a new connection
+        time.sleep(stand_in.handshake_delay)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        stand_in = self.server.stand_in
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with stand_in.lock:
+            stand_in.requests.append((self.path, body))
+
+        time.sleep(stand_in.delay)
+        if stand_in.status != 200:
+            self._respond(stand_in.status, {"message": "stand-in failure"})
+            return
+
+        payload = json.loads(body or b"{}")
+        if self.path.endswith("/chat/completions"):
+            self._respond(200, self._chat_completion(payload))
+        elif self.path.endswith("/v2/translate"):
+            self._respond(200, self._deepl(payload))
+        elif "TranslateText" in self.headers.get("X-Amz-Target", ""):
+            self._respond(200, self._aws(payload))
+        else:
+            self._respond(404, {"message": f"Unknown endpoint {self.path}"})
+
+    def _chat_completion(self, payload: dict) -> dict:
+        content = self.server.stand_in.completion(payload)
+        return {
+            "choices": [{"message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 50, "completion_tokens": 10, "total_tokens": 60},
+        }
+
+    @staticmethod
+    def _deepl(payload: dict) -> dict:
+        return {
+            "translations": [
+                {
+                    "detected_source_language": "EN",
+                    "text": _translate(text, payload["target_lang"]),
+                    "billed_characters": len(text),
+                }
+                for text in payload["text"]
+            ]
+        }
+
+    @staticmethod
+    def _aws(payload: dict) -> dict:
+        return {
+            "TranslatedText": _translate(
+                payload["Text"], payload["TargetLanguageCode"]
+            ),
+            "SourceLanguageCode": payload["SourceLanguageCode"],
+            "TargetLanguageCode": payload["TargetLanguageCode"],
+        }
+
+    def _respond(self, status: int, body: dict) -> None:
+        encoded = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: "StandInServer"
+
+
+def _default_completion(payload: dict) -> str:
+    response_format = payload.get("response_format") or {}
+    if response_format.get("json_schema", {}).get("name") == "batch_translation":
+        items = json.loads(payload["messages"][-1]["content"])["items"]
+        return json.dumps(
+            {
+                "translations": [
+                    {"id": item["id"], "translation": f"{item['word']} (stand-in)"}
+                    for item in items
+                ]
+            }
+        )
+    if response_format.get("json_schema", {}).get("name") == "phrase_gloss":
+        tokens = json.loads(payload["messages"][-1]["content"])["tokens"]
+        return json.dumps(
+            {
+                "glosses": [
+                    {"token": token, "translation": f"{token} (stand-in)"}
+                    for token in tokens
+                ]
+            }
+        )
+    return json.dumps({"translation": "stand-in translation"})
+
+
+class StandInServer:
+    """
+    A stand-in translation API server running in a background thread.
+
+    Attributes:
+        url: The base URL of the server, e.g. "http://127.0.0.1:8080".
+        delay: Seconds to wait before answering each request.
+        handshake_delay: Seconds to wait when a connection is opened.
+        status: The HTTP status to answer with; errors carry no translation.
+        completion: Produces the message content of a chat completion from
+                    the request payload.
+        connections: Number of connections opened so far.
+        requests: (path, body) of every request received so far.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        handshake_delay: float = 0.0,
+        status: int = 200,
+        completion: Optional[Callable[[dict], str]] = None,
+    ):
+        self.delay = delay
+        self.handshake_delay = handshake_delay
+        self.status = status
+        self.completion = completion or _default_completion
+        self.connections = 0
+        self.requests: list[tuple[str, bytes]] = []
+        self.lock = threading.Lock()
+
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stand_in = self
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+import dictionary
+import translate
+import translation_cache
+import translator
+from build_dictionary import read_entries
+from dictionary import Dictionary, write_dictionary
+from stand_in_server import StandInServer
+
+
+def test_should_read_single_words_from_preprocessing_format():
+    lines = ["Hola.|Hello.", "Me llamo Ana.|My name is Ana.", "¡Gracias!|Thank you!", "perro", "...|dots"]
+
+    entries, skipped = read_entries(lines)
+
+    assert entries == [("Hola.", "Hello"), ("¡Gracias!", "Thank you")]
+    assert skipped == 3
+
+
+def test_should_look_up_words_regardless_of_case_and_punctuation(tmp_path):
+    path = tmp_path / "es-en.dict"
+    assert write_dictionary([("Hola.", "Hello"), ("hola", "Hi"), ("Árbol", "tree")], str(path)) == 2
+
+    entries = Dictionary(str(path))
+    assert len(entries) == 2
+    assert entries.lookup("HOLA") == "Hello"
+    assert entries.lookup("¿árbol?") == "tree"
+    assert entries.lookup("perro") is None
+
+
+def test_should_find_every_entry_of_large_dictionary(tmp_path):
+    path = tmp_path / "es-en.dict"
+    words = {f"palabra{i}": f"word{i}" for i in range(1000)}
+    write_dictionary(words.items(), str(path))
+
+    entries = Dictionary(str(path))
+    assert all(entries.lookup(word) == gloss for word, gloss in words.items())
+    assert entries.lookup("palabra") is None
+    assert entries.lookup("palabra9999") is None
+
+
+def test_should_reject_other_files(tmp_path):
+    path = tmp_path / "es-en.dict"
+    path.write_bytes(b"not a dictionary")
+
+    with pytest.raises(ValueError):
+        Dictionary(str(path))
+
+
+@pytest.fixture
+def dictionaries(tmp_path, monkeypatch):
+    write_dictionary([("Hola", "Hello"), ("Gracias", "Thank you")], str(tmp_path / "es-en.dict"))
+    monkeypatch.setattr(dictionary, "DICTIONARY_DIR", str(tmp_path))
+    monkeypatch.setattr(dictionary, "_dictionaries", {})
+    with StandInServer() as server:
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_URL", server.url + "/v1/chat/completions")
+        monkeypatch.setenv("DEEPL_API_KEY", "test-key:fx")
+        monkeypatch.setenv("DEEPL_SERVER_URL", server.url)
+        monkeypatch.setattr(translator, "_translators", {})
+        translation_cache.get_cache().clear()
+        yield server
+        translation_cache.get_cache().clear()
+
+
+def _event(text: str, source_language: str = "es", context: str = None) -> dict:
+    body = {"text": text, "source_language": source_language, "target_language": "en"}
+    if context:
+        body["context"] = context
+    return {"body": json.dumps(body)}
+
+
+def test_handler_should_answer_single_words_from_dictionary(dictionaries):
+    response = translate.lambda_handler(_event("hola"), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"translation": "Hello", "source": "dictionary"}
+    assert not dictionaries.requests
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        _event("perro"),
+        _event("hola amigo"),
+        _event("hola", context="hola, amigo"),
+        _event("hola", source_language="pt"),
+    ],
+)
+def test_handler_should_use_engine_when_dictionary_does_not_apply(dictionaries, event):
+    response = translate.lambda_handler(event, None)
+
+    assert response["statusCode"] == 200
+    assert "source" not in json.loads(response["body"])
+    assert len(dictionaries.requests) == 1
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+import metrics
+import translate
+import translation_cache
+import translator
+from data import TranslationEngine
+from metrics import EngineCall
+from stand_in_server import StandInServer
+
+
+def _records(capsys) -> list[dict]:
+    lines = capsys.readouterr().out.splitlines()
+    return [json.loads(line) for line in lines if line.startswith('{"_aws"')]
+
+
+def test_should_emit_emf_record_per_call(capsys):
+    with EngineCall(TranslationEngine.DEEPL, "translate", ["Grüße"]) as call:
+        call.record_output(["Greetings"], billed_characters=5)
+
+    [record] = _records(capsys)
+    definition = record["_aws"]["CloudWatchMetrics"][0]
+    assert definition["Namespace"] == metrics.NAMESPACE
+    assert definition["Dimensions"] == [["Engine"], ["Engine", "Operation"]]
+    assert {metric["Name"] for metric in definition["Metrics"]} == {
+        "Texts", "BytesIn", "BytesOut", "BilledCharacters", "Latency", "Errors"
+    }
+    assert record["Engine"] == "deepl"
+    assert record["Operation"] == "translate"
+    assert record["BytesIn"] == 7
+    assert record["BytesOut"] == 9
+    assert record["BilledCharacters"] == 5
+    assert record["Errors"] == 0
+    assert record["Latency"] >= 0
+
+
+def test_should_count_failed_calls_as_errors(capsys):
+    with pytest.raises(ValueError):
+        with EngineCall(TranslationEngine.AWS, "translate", ["word"]):
+            raise ValueError("boom")
+
+    [record] = _records(capsys)
+    assert record["Errors"] == 1
+    assert "BytesOut" not in record
+
+
+def test_should_not_emit_when_disabled(capsys, monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    with EngineCall(TranslationEngine.AWS, "translate", ["word"]):
+        pass
+
+    assert not _records(capsys)
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    with StandInServer() as server:
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_URL", server.url + "/v1/chat/completions")
+        monkeypatch.setenv("DEEPL_API_KEY", "test-key:fx")
+        monkeypatch.setenv("DEEPL_SERVER_URL", server.url)
+        monkeypatch.setenv("AWS_ENDPOINT_URL", server.url)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+        monkeypatch.setattr(translator, "_translators", {})
+        translation_cache.get_cache().clear()
+        yield server
+        translation_cache.get_cache().clear()
+
+
+def _event(body: dict, engine: str = "deepl") -> dict:
+    return {"body": json.dumps({"source_language": "en", "target_language": "de", **body}),
+            "headers": {"X-Translation-Engine": engine}}
+
+
+@pytest.mark.parametrize("engine", ["deepl", "aws"])
+def test_should_record_billed_characters(stand_in, capsys, engine):
+    translate.lambda_handler(_event({"text": "Hello"}, engine), None)
+
+    [record] = _records(capsys)
+    assert record["Engine"] == engine
+    assert record["BilledCharacters"] == 5
+    assert record["BytesOut"] == len("Hello (de)")
+
+
+def test_should_record_openai_tokens(stand_in, capsys):
+    translate.lambda_handler(_event({"text": "bank", "context": "the river bank"}), None)
+
+    [record] = _records(capsys)
+    assert record["Engine"] == "openai"
+    assert record["PromptTokens"] == 50
+    assert record["CompletionTokens"] == 10
+    assert "BilledCharacters" not in record
+
+
+def test_should_emit_record_per_batch_chunk(stand_in, capsys):
+    texts = [f"word{i}" for i in range(60)]
+    translate.lambda_handler(_event({"texts": texts}), None)
+
+    records = _records(capsys)
+    assert [record["Operation"] for record in records] == ["translate_batch"] * 2
+    assert sum(record["Texts"] for record in records) == 60
+    assert sum(record["BilledCharacters"] for record in records) == sum(len(text) for text in texts)
+
+
+def test_should_not_emit_for_cached_translations(stand_in, capsys):
+    translate.lambda_handler(_event({"text": "Hello"}), None)
+    translate.lambda_handler(_event({"text": "Hello"}), None)
+
+    assert len(_records(capsys)) == 1
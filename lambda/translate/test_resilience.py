@@ -0,0 +1,218 @@
+import json
+import threading
+
+import deepl
+import pytest
+
+import resilience
+import translate
+import translation_cache
+import translator
+from data import TranslationEngine
+from resilience import (CircuitBreaker, EngineUnavailableError,
+                        LatencyBudgetExceededError, ResilientTranslator)
+from stand_in_server import StandInServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTranslator(translator.Translator):
+    def __init__(self, engine: TranslationEngine, gate: threading.Event = None, error: Exception = None):
+        """
+        :param gate: Blocks calls until it is set, e.g. to stand in for a slow engine
+        """
+        self.engine = engine
+        self.gate = gate
+        self.error = error
+        self.calls = 0
+
+    def translate(self, text, source_language, target_language, context):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return f"{text} ({self.engine.value})"
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+
+
+@pytest.fixture
+def slow():
+    """Blocks the calls of a translator until the test ends."""
+    gate = threading.Event()
+    yield gate
+    gate.set()
+
+
+def test_breaker_should_open_after_consecutive_failures_and_allow_trial_after_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_should_return_primary_answer_without_hedging():
+    primary = FakeTranslator(TranslationEngine.DEEPL)
+    secondary = FakeTranslator(TranslationEngine.AWS)
+    resilient = ResilientTranslator(primary, secondary, budget=1, hedge_delay=0.5)
+
+    assert resilient.translate("word", "en", "de", None) == "word (deepl)"
+    assert secondary.calls == 0
+    assert resilient.answered_by is primary
+
+
+def test_should_hedge_slow_primary_with_secondary(slow):
+    primary = FakeTranslator(TranslationEngine.DEEPL, gate=slow)
+    secondary = FakeTranslator(TranslationEngine.AWS)
+    resilient = ResilientTranslator(primary, secondary, budget=5, hedge_delay=0.01)
+
+    assert resilient.translate("word", "en", "de", None) == "word (aws)"
+    assert resilient.answered_by is secondary
+
+
+def test_should_cache_hedged_answer_under_engine_that_answered(slow):
+    primary = FakeTranslator(TranslationEngine.DEEPL, gate=slow)
+    secondary = FakeTranslator(TranslationEngine.AWS)
+    resilient = ResilientTranslator(primary, secondary, budget=5, hedge_delay=0.01)
+    cache = translation_cache.TranslationCache()
+
+    translation, _ = cache.translate(resilient, "word", "en", "de", None)
+
+    assert translation == "word (aws)"
+    assert cache.get(translation_cache.cache_key("deepl", "en", "de", "word", None))[0] is None
+    assert cache.get(translation_cache.cache_key("aws", "en", "de", "word", None))[0] == "word (aws)"
+
+
+def test_should_fail_over_immediately_when_primary_fails():
+    primary = FakeTranslator(TranslationEngine.DEEPL, error=RuntimeError("down"))
+    secondary = FakeTranslator(TranslationEngine.AWS)
+    # The hedge delay outlasts the budget, so only a failover reaches the secondary engine in time
+    resilient = ResilientTranslator(primary, secondary, budget=5, hedge_delay=10)
+
+    assert resilient.translate("word", "en", "de", None) == "word (aws)"
+
+
+def test_should_raise_last_error_when_all_engines_fail():
+    resilient = ResilientTranslator(
+        FakeTranslator(TranslationEngine.DEEPL, error=RuntimeError("deepl down")),
+        FakeTranslator(TranslationEngine.AWS, error=RuntimeError("aws down")),
+        budget=1,
+        hedge_delay=0.5,
+    )
+    with pytest.raises(RuntimeError, match="down"):
+        resilient.translate("word", "en", "de", None)
+
+
+def test_should_raise_when_budget_is_exceeded(slow):
+    resilient = ResilientTranslator(
+        FakeTranslator(TranslationEngine.OPENAI, gate=slow), None, budget=0.05
+    )
+
+    with pytest.raises(LatencyBudgetExceededError):
+        resilient.translate("word", "en", "de", "context")
+
+
+def test_should_skip_engine_with_open_breaker():
+    primary = FakeTranslator(TranslationEngine.DEEPL, error=RuntimeError("down"))
+    secondary = FakeTranslator(TranslationEngine.AWS)
+    resilient = ResilientTranslator(primary, secondary, budget=1, hedge_delay=0.5)
+
+    for _ in range(resilience.BREAKER_FAILURE_THRESHOLD + 2):
+        resilient.translate("word", "en", "de", None)
+
+    assert primary.calls == resilience.BREAKER_FAILURE_THRESHOLD
+
+
+def test_should_raise_unavailable_when_all_breakers_are_open():
+    for _ in range(resilience.BREAKER_FAILURE_THRESHOLD):
+        resilience.get_breaker(TranslationEngine.OPENAI).record_failure()
+
+    resilient = ResilientTranslator(FakeTranslator(TranslationEngine.OPENAI), None, budget=1)
+    with pytest.raises(EngineUnavailableError):
+        resilient.translate("word", "en", "de", "context")
+
+
+@pytest.fixture
+def stand_ins(monkeypatch):
+    """DeepL and OpenAI on one stand-in server, AWS on another."""
+    with StandInServer() as primary, StandInServer() as secondary:
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_URL", primary.url + "/v1/chat/completions")
+        monkeypatch.setenv("DEEPL_API_KEY", "test-key:fx")
+        monkeypatch.setenv("DEEPL_SERVER_URL", primary.url)
+        monkeypatch.setenv("AWS_ENDPOINT_URL", secondary.url)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+        monkeypatch.setenv("TRANSLATE_READ_TIMEOUT_OPENAI", "0.2")
+        monkeypatch.setattr(translator, "_translators", {})
+        monkeypatch.setattr(deepl.http_client, "max_network_retries", 0)
+        monkeypatch.setattr(resilience, "LATENCY_BUDGET", "2")
+        monkeypatch.setattr(resilience, "HEDGE_DELAY", 0.1)
+        translation_cache.get_cache().clear()
+        yield primary, secondary
+        translation_cache.get_cache().clear()
+
+
+def _event(text: str = "Hello", context: str = None) -> dict:
+    body = {"text": text, "source_language": "en", "target_language": "de"}
+    if context:
+        body["context"] = context
+    return {"body": json.dumps(body)}
+
+
+def test_handler_should_answer_from_secondary_engine_when_primary_is_slow(stand_ins, monkeypatch):
+    primary, secondary = stand_ins
+    # Without hedging, the primary engine would exceed the budget
+    monkeypatch.setattr(resilience, "LATENCY_BUDGET", "0.5")
+    primary.delay = 1.0
+
+    response = translate.lambda_handler(_event(), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"translation": "Hello (de)"}
+    assert len(secondary.requests) == 1
+
+
+def test_handler_should_stop_calling_failing_engine(stand_ins):
+    primary, secondary = stand_ins
+    primary.status = 500
+
+    for i in range(resilience.BREAKER_FAILURE_THRESHOLD + 2):
+        response = translate.lambda_handler(_event(f"Hello{i}"), None)
+        assert response["statusCode"] == 200
+
+    assert len(primary.requests) == resilience.BREAKER_FAILURE_THRESHOLD
+    assert len(secondary.requests) == resilience.BREAKER_FAILURE_THRESHOLD + 2
+
+
+def test_handler_should_apply_per_engine_timeout(stand_ins):
+    primary, _ = stand_ins
+    primary.delay = 1.0
+
+    response = translate.lambda_handler(_event("word", context="a word in context"), None)
+
+    # The read timeout of OpenAI ends the call well within the budget
+    assert response["statusCode"] == 500
+    assert "timed out" in response["body"]
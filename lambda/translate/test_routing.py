@@ -0,0 +1,233 @@
+import json
+import logging
+
+import pytest
+
+import resilience
+import routing
+import translate
+import translation_cache
+import translator
+from data import TranslationEngine
+from routing import EngineStats, MeasuredTranslator, Router
+from stand_in_server import StandInServer
+
+DEEPL = TranslationEngine.DEEPL
+AWS = TranslationEngine.AWS
+
+
+class FakeTranslator(translator.Translator):
+    def __init__(self, engine: TranslationEngine, error: Exception = None):
+        self.engine = engine
+        self.error = error
+
+    def translate(self, text, source_language, target_language, context):
+        if self.error:
+            raise self.error
+        return f"{text} ({self.engine.value})"
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+
+
+def _router(rng: float = 1.0, **kwargs) -> Router:
+    return Router(rng=lambda: rng, **kwargs)
+
+
+def _record(router: Router, engine: TranslationEngine, latency: float, count: int = 5):
+    for _ in range(count):
+        router.stats(engine).record(latency, success=True)
+
+
+def test_stats_should_only_keep_recent_calls():
+    stats = EngineStats(window=4)
+    stats.record(None, success=False)
+    stats.record(0.1, success=True)
+    assert stats.error_rate == 0.5
+
+    for _ in range(4):
+        stats.record(0.3, success=True)
+    assert stats.error_rate == 0
+    assert stats.samples == 4
+    assert stats.mean_latency == pytest.approx(0.3)
+
+
+def test_should_choose_fastest_engine():
+    router = _router()
+    _record(router, DEEPL, 0.3)
+    _record(router, AWS, 0.1)
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (AWS, "fastest healthy engine")
+
+
+def test_should_prefer_requested_engine_on_ties():
+    router = _router()
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.1)
+
+    assert router.choose(AWS, [DEEPL, AWS])[0] == AWS
+    assert router.choose(DEEPL, [DEEPL, AWS])[0] == DEEPL
+
+
+def test_should_collect_samples_of_every_engine_first():
+    router = _router()
+    _record(router, DEEPL, 0.3)
+    _record(router, AWS, 0.1, count=2)
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (AWS, "collecting samples")
+
+
+def test_should_avoid_failing_engine():
+    router = _router()
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.3)
+    for _ in range(6):
+        router.stats(DEEPL).record(None, success=False)
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (AWS, "fastest healthy engine")
+
+
+def test_should_avoid_engine_with_open_breaker():
+    router = _router()
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.3)
+    for _ in range(resilience.BREAKER_FAILURE_THRESHOLD):
+        resilience.get_breaker(DEEPL).record_failure()
+
+    assert router.choose(DEEPL, [DEEPL, AWS])[0] == AWS
+
+
+def test_should_explore_other_engines():
+    router = _router(rng=0.0)
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.3)
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (DEEPL, "exploration")
+
+
+def test_should_recover_failed_engine_by_exploring_it():
+    now = [0.0]
+    breaker = resilience.CircuitBreaker(clock=lambda: now[0])
+    resilience._breakers[DEEPL] = breaker
+    draws = iter([1.0, 0.0, 0.0, 1.0])
+    router = Router(rng=lambda: next(draws))
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.3)
+    deepl = MeasuredTranslator(FakeTranslator(DEEPL, error=RuntimeError("down")), router)
+    for _ in range(6):
+        with pytest.raises(RuntimeError):
+            deepl.translate("Hund", "de", "en", None)
+        breaker.record_failure()
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (AWS, "fastest healthy engine")
+
+    # Once the breaker lets a trial call through, exploration probes the failed engine
+    now[0] += breaker.reset_timeout
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (DEEPL, "exploration")
+    deepl.translator.error = None
+    for _ in range(10):
+        deepl.translate("Hund", "de", "en", None)
+    breaker.record_success()
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (DEEPL, "fastest healthy engine")
+
+
+def test_should_not_explore_engine_with_open_breaker():
+    router = _router(rng=0.0)
+    _record(router, DEEPL, 0.1)
+    _record(router, AWS, 0.3)
+    for _ in range(resilience.BREAKER_FAILURE_THRESHOLD):
+        resilience.get_breaker(DEEPL).record_failure()
+
+    assert router.choose(DEEPL, [DEEPL, AWS]) == (AWS, "exploration")
+
+
+def test_should_use_only_candidate():
+    assert _router().choose(DEEPL, [AWS]) == (AWS, "only candidate")
+
+
+def test_measured_translator_should_record_latency_and_failures():
+    router = _router()
+    MeasuredTranslator(FakeTranslator(DEEPL), router).translate("word", "en", "de", None)
+    with pytest.raises(ValueError):
+        MeasuredTranslator(FakeTranslator(AWS, ValueError("boom")), router).translate("word", "en", "de", None)
+    MeasuredTranslator(FakeTranslator(AWS), router).translate_batch(["word"], "en", "de", [None])
+
+    assert router.stats(DEEPL).samples == 1
+    assert router.stats(AWS).samples == 0
+    assert router.stats(AWS).error_rate == 0.5
+
+
+@pytest.fixture
+def stand_ins(monkeypatch):
+    """DeepL and OpenAI on one stand-in server, AWS on another."""
+    with StandInServer() as slow, StandInServer() as fast:
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_URL", slow.url + "/v1/chat/completions")
+        monkeypatch.setenv("DEEPL_API_KEY", "test-key:fx")
+        monkeypatch.setenv("DEEPL_SERVER_URL", slow.url)
+        monkeypatch.setenv("AWS_ENDPOINT_URL", fast.url)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+        monkeypatch.setattr(translator, "_translators", {})
+        monkeypatch.setattr(translator, "_configured", None)
+        monkeypatch.setattr(routing, "ROUTING_POLICY", routing.ADAPTIVE)
+        monkeypatch.setattr(routing, "_router", _router(min_samples=2))
+        translation_cache.get_cache().clear()
+        yield slow, fast
+        translation_cache.get_cache().clear()
+
+
+def _event(text: str, context: str = None) -> dict:
+    body = {"text": text, "source_language": "en", "target_language": "de", "translation_engine": "deepl"}
+    if context:
+        body["context"] = context
+    return {"body": json.dumps(body)}
+
+
+def test_handler_should_route_to_faster_engine(stand_ins, caplog):
+    slow, fast = stand_ins
+    slow.delay = 0.05
+
+    with caplog.at_level(logging.INFO, logger="root"):
+        for i in range(6):
+            response = translate.lambda_handler(_event(f"Hello{i}"), None)
+            assert response["statusCode"] == 200
+
+    # Two samples of each engine, then only the faster engine
+    assert len(slow.requests) == 2
+    assert len(fast.requests) == 4
+    decisions = [json.loads(r.message)["routing"] for r in caplog.records if r.message.startswith('{"routing"')]
+    assert decisions[-1]["chosen"] == "aws"
+    assert decisions[-1]["reason"] == "fastest healthy engine"
+    assert decisions[-1]["engines"]["deepl"]["samples"] == 2
+
+
+def test_handler_should_not_retry_creating_unconfigured_engine(stand_ins, monkeypatch):
+    slow, fast = stand_ins
+    attempts = []
+
+    def unconfigured():
+        attempts.append(1)
+        raise ValueError("DEEPL_API_KEY is not set")
+
+    monkeypatch.setitem(translator._TRANSLATORS, translate.TranslationEngine.DEEPL, unconfigured)
+    for i in range(3):
+        response = translate.lambda_handler(_event(f"Hello{i}"), None)
+        assert response["statusCode"] == 200
+
+    assert len(attempts) == 1
+    assert len(fast.requests) == 3
+
+
+def test_handler_should_keep_context_on_openai(stand_ins):
+    slow, fast = stand_ins
+    _record(routing.get_router(), AWS, 0.001)
+
+    response = translate.lambda_handler(_event("word", context="a word in context"), None)
+
+    assert response["statusCode"] == 200
+    assert slow.requests[-1][0].endswith("/chat/completions")
+    assert not fast.requests
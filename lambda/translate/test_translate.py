@@ -1,10 +1,22 @@
+import asyncio
 import json
+import threading
 import unittest.mock
 
 import pytest
 
 import translate
+import translation_cache
+import translator
+from data import tokenize
+from stand_in_server import StandInServer
 from translate import derive_appropriate_translator
+from translator import get_translator, prewarm_translators
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    translation_cache.get_cache().clear()
 
 
 def test_empty_text():
@@ -82,3 +94,322 @@ def test_extract_translation_engine(engine: str, expected: translate.Translation
     }
     translation_engine = translate._parse_translation_engine(event)
     assert translation_engine == expected
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    with StandInServer() as server:
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_URL", server.url + "/v1/chat/completions")
+        monkeypatch.setenv("DEEPL_API_KEY", "test-key:fx")
+        monkeypatch.setenv("DEEPL_SERVER_URL", server.url)
+        monkeypatch.setenv("AWS_ENDPOINT_URL", server.url)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+        monkeypatch.setattr(translator, "_translators", {})
+        yield server
+
+
+def test_should_reuse_translator_per_engine(stand_in):
+    first = get_translator(translate.TranslationEngine.OPENAI)
+    second = get_translator(translate.TranslationEngine.OPENAI)
+    assert first is second
+    assert get_translator(translate.TranslationEngine.DEEPL) is not first
+
+
+def test_should_reuse_connection_for_openai_requests(stand_in):
+    openai = get_translator(translate.TranslationEngine.OPENAI)
+    for _ in range(3):
+        assert openai.translate("word", "en", "de", "some context") == "stand-in translation"
+    assert len(stand_in.requests) == 3
+    assert stand_in.connections == 1
+
+
+def test_should_raise_for_failed_openai_request(stand_in):
+    stand_in.status = 500
+    with pytest.raises(Exception, match="status 500"):
+        get_translator(translate.TranslationEngine.OPENAI).translate("word", "en", "de", "context")
+
+
+@pytest.mark.parametrize("engine", [translate.TranslationEngine.AWS, translate.TranslationEngine.DEEPL])
+def test_should_translate_with_pooled_clients(stand_in, engine):
+    engine_translator = get_translator(engine)
+    assert engine_translator.translate("Hello", "en", "de", None) == "Hello (de)"
+    assert engine_translator.translate("World", "en", "de", None) == "World (de)"
+    assert stand_in.connections == 1
+
+
+def test_should_prewarm_configured_translators_only(stand_in, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY")
+    prewarm_translators()
+    assert set(translator._translators) == {
+        translate.TranslationEngine.AWS,
+        translate.TranslationEngine.DEEPL,
+    }
+
+
+def test_should_report_cache_hits_in_log_context(stand_in):
+    event = {"body": json.dumps({"text": "Hello", "source_language": "en", "target_language": "de"})}
+    with unittest.mock.patch("lambda_util.ok", wraps=translate.lambda_util.ok) as ok:
+        first = translate.lambda_handler(event, None)
+        second = translate.lambda_handler(event, None)
+
+    assert first["body"] == second["body"] == json.dumps({"translation": "Hello (de)"})
+    assert len(stand_in.requests) == 1
+    assert [call.args[1]["cache"] for call in ok.call_args_list] == ["miss", "local"]
+    assert "latency_ms" in ok.call_args_list[1].args[1]
+
+
+def _batch_event(texts: list, engine: str = "deepl") -> dict:
+    return {
+        "body": json.dumps({"texts": texts, "source_language": "en", "target_language": "de"}),
+        "headers": {"X-Translation-Engine": engine},
+    }
+
+
+def _translate_paths(stand_in) -> list[str]:
+    return [path for path, _ in stand_in.requests]
+
+
+def test_should_chunk_texts_within_limits():
+    assert list(translator.chunk(["a", "b", "c"], max_items=2, max_bytes=100)) == [["a", "b"], ["c"]]
+    assert list(translator.chunk(["aaa", "bb", "c"], max_items=10, max_bytes=4)) == [["aaa"], ["bb", "c"]]
+    assert list(translator.chunk(["aaaaa", "b"], max_items=10, max_bytes=4)) == [["aaaaa"], ["b"]]
+
+
+def test_should_reject_invalid_batches():
+    for texts, reason in [
+        ([], "non-empty list"),
+        (["Hello", ""], "Texts must be non-empty strings"),
+        (["Hello", None], "Texts must be non-empty strings"),
+        (["Hello", 42], "Texts must be non-empty strings"),
+        ([{"context": "Bank"}], "Texts must be non-empty strings"),
+        ([{"text": "Bank", "context": 42}], "Contexts must be strings"),
+        ([{"text": "two words", "context": "two words here"}], "Context can only be provided"),
+        (["word"] * 501, "At most 500 texts"),
+    ]:
+        response = translate.lambda_handler(_batch_event(texts), None)
+        assert response["statusCode"] == 400
+        assert reason in response["body"]
+
+
+def test_should_translate_batch_with_one_deepl_call_per_chunk(stand_in):
+    texts = [f"word{i}" for i in range(60)] + ["word0"]
+    response = translate.lambda_handler(_batch_event(texts), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["translations"] == [f"{text} (de)" for text in texts]
+    assert _translate_paths(stand_in) == ["/v2/translate", "/v2/translate"]
+
+
+def test_should_only_translate_uncached_batch_items(stand_in):
+    translate.lambda_handler(_batch_event(["Hello", "World"]), None)
+    response = translate.lambda_handler(_batch_event(["World", "Again", "Hello"]), None)
+
+    assert json.loads(response["body"])["translations"] == ["World (de)", "Again (de)", "Hello (de)"]
+    assert json.loads(stand_in.requests[-1][1])["text"] == ["Again"]
+
+
+def test_should_translate_aws_batch_in_order(stand_in):
+    texts = [f"word{i}" for i in range(25)]
+    response = translate.lambda_handler(_batch_event(texts, engine="aws"), None)
+
+    assert json.loads(response["body"])["translations"] == [f"{text} (de)" for text in texts]
+    assert len(stand_in.requests) == 25
+
+
+class ChunkTranslator(translator.Translator):
+    """Translates chunks of at most ten texts, and tracks the calls in flight."""
+
+    engine = translate.TranslationEngine.DEEPL
+    MAX_TEXTS_PER_CALL = 10
+
+    def __init__(self, on_call=lambda in_flight: None):
+        """
+        :param on_call: Called at the start of every chunk call with the number of calls in flight
+        """
+        self.on_call = on_call
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def translate(self, text, source_language, target_language, context):
+        return f"{text} ({target_language})"
+
+    def translate_chunk(self, texts, source_language, target_language, contexts):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            in_flight = self.in_flight
+        try:
+            self.on_call(in_flight)
+            return super().translate_chunk(texts, source_language, target_language, contexts)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    monkeypatch.setattr(translator, "_executors", {})
+    yield
+    for executor in translator._executors.values():
+        executor.shutdown(cancel_futures=True)
+
+
+def test_should_send_batch_chunks_concurrently(executors):
+    # Every chunk call waits for the other two, so the batch only completes if they run concurrently
+    barrier = threading.Barrier(3, timeout=5)
+    texts = [f"word{i}" for i in range(30)]
+
+    translations = ChunkTranslator(lambda _: barrier.wait()).translate_batch(texts, "en", "de", [None] * 30)
+
+    assert translations == [f"{text} (de)" for text in texts]
+
+
+def test_should_bound_concurrent_calls_per_engine(executors):
+    # Calls wait until all workers and the calling thread are busy, or the calls run out
+    saturated = threading.Event()
+    bound = translator.POOL_SIZE + 1
+
+    def on_call(in_flight):
+        if in_flight == bound:
+            saturated.set()
+        saturated.wait(timeout=5)
+
+    chunk_translator = ChunkTranslator(on_call)
+    texts = [f"word{i}" for i in range(10 * 2 * translator.POOL_SIZE)]
+    translations = chunk_translator.translate_batch(texts, "en", "de", [None] * len(texts))
+
+    assert translations == [f"{text} (de)" for text in texts]
+    assert saturated.is_set()
+    assert chunk_translator.max_in_flight == bound
+
+
+def test_should_translate_batch_when_all_workers_are_busy(executors):
+    release = threading.Event()
+    executor = translator.get_executor(translate.TranslationEngine.DEEPL)
+    for _ in range(translator.POOL_SIZE):
+        executor.submit(release.wait, 5)
+
+    texts = [f"word{i}" for i in range(30)]
+    try:
+        translations = ChunkTranslator().translate_batch(texts, "en", "de", [None] * 30)
+    finally:
+        release.set()
+
+    # The calling thread translated the chunks the busy workers could not start
+    assert translations == [f"{text} (de)" for text in texts]
+
+
+def test_should_translate_batch_within_event_loop(stand_in):
+    async def translate_in_loop():
+        return get_translator(translate.TranslationEngine.DEEPL).translate_batch(["Hello", "World"], "en", "de",
+                                                                                 [None, None])
+
+    assert asyncio.run(translate_in_loop()) == ["Hello (de)", "World (de)"]
+
+
+def test_should_translate_context_pairs_in_one_openai_call_per_chunk(stand_in):
+    texts = [{"text": f"word{i}", "context": f"a phrase with word{i}"} for i in range(30)]
+    response = translate.lambda_handler(_batch_event(texts), None)
+
+    assert json.loads(response["body"])["translations"] == [f"word{i} (stand-in)" for i in range(30)]
+    assert _translate_paths(stand_in) == ["/v1/chat/completions"] * 2
+    # The chunks are sent concurrently, so their requests may arrive in any order
+    payloads = [json.loads(body) for _, body in stand_in.requests]
+    assert all(payload["response_format"]["json_schema"]["strict"] is True for payload in payloads)
+    assert sorted(len(json.loads(payload["messages"][-1]["content"])["items"]) for payload in payloads) == [5, 25]
+
+
+def test_should_fail_batch_if_openai_omits_items(stand_in):
+    stand_in.completion = lambda payload: json.dumps({"translations": [{"id": 0, "translation": "x"}]})
+    texts = [{"text": "one", "context": "one phrase"}, {"text": "two", "context": "two phrases"}]
+    response = translate.lambda_handler(_batch_event(texts), None)
+
+    assert response["statusCode"] == 500
+    assert "lacks translations for items [1]" in response["body"]
+
+
+def _gloss_event(phrase: str, tokens: list | None = None) -> dict:
+    body = {"phrase": phrase, "source_language": "en", "target_language": "de"}
+    if tokens is not None:
+        body["tokens"] = tokens
+    return {"body": json.dumps(body)}
+
+
+def test_should_tokenize_phrase_into_distinct_words():
+    assert tokenize("It's a well-known fact, a fact.") == ["It's", "a", "well-known", "fact"]
+
+
+def test_should_gloss_all_tokens_in_one_openai_call(stand_in):
+    response = translate.lambda_handler(_gloss_event("the bank of the river"), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["glosses"] == {
+        token: f"{token} (stand-in)" for token in ["the", "bank", "of", "river"]
+    }
+    assert len(stand_in.requests) == 1
+    payload = json.loads(stand_in.requests[0][1])
+    assert payload["response_format"]["json_schema"]["name"] == "phrase_gloss"
+    assert payload["response_format"]["json_schema"]["strict"] is True
+
+
+def test_should_gloss_only_uncached_tokens(stand_in):
+    translate.lambda_handler(_gloss_event("the bank of the river", ["bank"]), None)
+    response = translate.lambda_handler(_gloss_event("the bank of the river", ["river", "bank"]), None)
+
+    assert list(json.loads(response["body"])["glosses"]) == ["river", "bank"]
+    assert json.loads(json.loads(stand_in.requests[-1][1])["messages"][-1]["content"])["tokens"] == ["river"]
+
+
+def test_glosses_should_serve_single_word_context_requests(stand_in):
+    translate.lambda_handler(_gloss_event("the bank of the river", ["bank"]), None)
+    event = {"body": json.dumps({"text": "bank", "context": "the bank of the river", "source_language": "en", "target_language": "de"})}
+    response = translate.lambda_handler(event, None)
+
+    assert json.loads(response["body"]) == {"translation": "bank (stand-in)"}
+    assert len(stand_in.requests) == 1
+
+
+def test_should_fail_gloss_if_openai_omits_tokens(stand_in):
+    stand_in.completion = lambda payload: json.dumps({"glosses": [{"token": "bank", "translation": "Ufer"}]})
+    response = translate.lambda_handler(_gloss_event("the bank", ["the", "bank"]), None)
+
+    assert response["statusCode"] == 500
+    assert "lacks glosses for tokens ['the']" in response["body"]
+
+
+@pytest.mark.parametrize(
+    "phrase,tokens,reason",
+    [
+        ("", None, "Phrase cannot be empty"),
+        ("...", None, "no tokens"),
+        ("a phrase", ["a", ""], "non-empty strings"),
+        (" ".join(f"w{i}" for i in range(101)), None, "At most 100 tokens"),
+    ],
+)
+def test_should_reject_invalid_gloss_requests(phrase, tokens, reason):
+    response = translate.lambda_handler(_gloss_event(phrase, tokens), None)
+    assert response["statusCode"] == 400
+    assert reason in response["body"]
+
+
+def test_should_gloss_token_by_token_with_translators_without_context_support(stand_in):
+    deepl = get_translator(translate.TranslationEngine.DEEPL)
+    glosses = deepl.gloss("Hello world", ["Hello", "world", "Hello"], "en", "de")
+
+    assert glosses == {"Hello": "Hello (de)", "world": "world (de)"}
+    assert _translate_paths(stand_in) == ["/v2/translate"]
+
+
+def test_should_reject_unsupported_operations_with_client_error(stand_in, monkeypatch):
+    def unsupported(*_):
+        raise NotImplementedError("OpenAITranslator cannot gloss phrases")
+
+    monkeypatch.setattr(translator.OpenAITranslator, "gloss", unsupported)
+    response = translate.lambda_handler(_gloss_event("Hello world"), None)
+
+    assert response["statusCode"] == 400
+    assert "cannot gloss phrases" in response["body"]
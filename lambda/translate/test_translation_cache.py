@@ -0,0 +1,122 @@
+import pytest
+
+from data import TranslationEngine
+from translator import Translator
+from translation_cache import (
+    LOCAL_HIT,
+    MISS,
+    SHARED_HIT,
+    SQLiteBackend,
+    TranslationCache,
+    cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTranslator(Translator):
+    engine = TranslationEngine.DEEPL
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, text, source_language, target_language, context):
+        self.calls += 1
+        return f"{text} ({target_language})"
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def backend(tmp_path, clock):
+    return SQLiteBackend(str(tmp_path / "cache.db"), clock=clock)
+
+
+def test_key_ignores_whitespace_but_not_case():
+    key = cache_key("deepl", "en", "de", "hello  world", None)
+    assert key == cache_key("deepl", "en", "de", " hello world\n", None)
+    assert key != cache_key("deepl", "en", "de", "Hello world", None)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        ("aws", "en", "de", "hello", None),
+        ("deepl", "fr", "de", "hello", None),
+        ("deepl", "en", "it", "hello", None),
+        ("deepl", "en", "de", "hello", "hello there"),
+    ],
+)
+def test_key_separates_engine_languages_and_context(other):
+    assert cache_key("deepl", "en", "de", "hello", None) != cache_key(*other)
+
+
+def test_should_translate_once_and_then_hit_local_tier(clock):
+    cache = TranslationCache(clock=clock)
+    translator = FakeTranslator()
+
+    first, first_stats = cache.translate(translator, "hello", "en", "de", None)
+    second, second_stats = cache.translate(translator, "hello", "en", "de", None)
+
+    assert first == second == "hello (de)"
+    assert translator.calls == 1
+    assert first_stats["cache"] == MISS
+    assert second_stats["cache"] == LOCAL_HIT
+    assert {"cache_lookup_ms", "latency_ms"} <= set(second_stats)
+
+
+def test_should_expire_entries_after_ttl(clock):
+    cache = TranslationCache(ttl=60, clock=clock)
+    cache.put("key", "translation")
+
+    clock.now += 59
+    assert cache.get("key") == ("translation", LOCAL_HIT)
+    clock.now += 2
+    assert cache.get("key") == (None, MISS)
+    assert len(cache) == 0
+
+
+def test_should_evict_least_recently_used(clock):
+    cache = TranslationCache(max_size=2, clock=clock)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") == (None, MISS)
+    assert cache.get("a") == ("1", LOCAL_HIT)
+    assert cache.get("c") == ("3", LOCAL_HIT)
+
+
+def test_should_serve_from_shared_backend_and_promote(clock, backend):
+    TranslationCache(backend=backend, clock=clock).put("key", "translation")
+    cache = TranslationCache(backend=backend, clock=clock)
+
+    assert cache.get("key") == ("translation", SHARED_HIT)
+    assert cache.get("key") == ("translation", LOCAL_HIT)
+
+
+def test_shared_backend_should_expire_entries(clock, backend):
+    backend.put("key", "translation", ttl=60)
+    clock.now += 61
+    assert backend.get("key") is None
+
+
+def test_should_not_cache_failed_translations(clock):
+    class FailingTranslator(FakeTranslator):
+        def translate(self, *args):
+            raise RuntimeError("engine down")
+
+    cache = TranslationCache(clock=clock)
+    with pytest.raises(RuntimeError):
+        cache.translate(FailingTranslator(), "hello", "en", "de", None)
+    assert len(cache) == 0
@@ -1,28 +1,102 @@
 import json
 import logging
+import os
 
 import lambda_util
-from data import Request, TranslationEngine
+import dictionary
+import resilience
+import routing
+import translation_cache
+from data import BatchRequest, GlossRequest, Request, TranslationEngine
 from translator import (AWSTranslator, DeepLTranslator, OpenAITranslator,
-                        Translator)
+                        Translator, configured_engines, get_translator,
+                        prewarm_translators)
 
 logger = logging.getLogger("root")
 logger.setLevel(logging.INFO)
 
+# Runs during the Lambda init phase only, so that importing the module, e.g. in tests and tools, creates no clients.
+# Engines that cannot be created, e.g. for lack of credentials, are skipped and created on first use.
+if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+    prewarm_translators()
+
+# Engines that translate text without context, and so can stand in for each other when routing
+CONTEXT_FREE_ENGINES = [TranslationEngine.DEEPL, TranslationEngine.AWS]
+
 
 def derive_appropriate_translator(
-    request: Request
+    request: Request | BatchRequest | GlossRequest
 ) -> Translator:
+    decision = None
     if request.context:
         # Supersedes requested engine, because only OpenAITranslator can handle disambiguation via context
-        return OpenAITranslator()
+        engine = TranslationEngine.OPENAI
+        if routing.is_adaptive():
+            decision = routing.log_decision(
+                request.translation_engine, engine, "context requires openai"
+            )
+    elif request.translation_engine in CONTEXT_FREE_ENGINES:
+        engine = request.translation_engine
+        if routing.is_adaptive():
+            candidates = [candidate for candidate in CONTEXT_FREE_ENGINES if candidate in configured_engines()]
+            engine, decision = routing.route(engine, candidates)
     else:
-        if request.translation_engine == TranslationEngine.AWS:
-            return AWSTranslator()
-        elif request.translation_engine == TranslationEngine.DEEPL:
-            return DeepLTranslator()
-        else:
-            raise ValueError(f"Unsupported translation engine: {request.translation_engine}")
+        raise ValueError(f"Unsupported translation engine: {request.translation_engine}")
+
+    translator = _measured(get_translator(engine), decision)
+    budget = resilience.latency_budget()
+    if budget is None:
+        return translator
+    return resilience.ResilientTranslator(
+        translator, _secondary_translator(engine), budget
+    )
+
+
+def _measured(translator: Translator, decision: dict | None = None) -> Translator:
+    """
+    Report the calls of a translator to the router, if adaptive routing is enabled.
+    """
+    if not routing.is_adaptive():
+        return translator
+    measured = routing.MeasuredTranslator(translator, routing.get_router())
+    measured.decision = decision
+    return measured
+
+
+def _secondary_translator(engine: TranslationEngine) -> Translator | None:
+    """
+    Get the translator to hedge and fail over with, if the engine has a configured secondary engine.
+    """
+    secondary_engine = resilience.SECONDARY_ENGINES.get(engine)
+    if secondary_engine is None:
+        return None
+    try:
+        return _measured(get_translator(secondary_engine))
+    except Exception as err:
+        logger.warning(f"No failover for {engine.value}: {err}")
+        return None
+
+
+def _translator_fields(translator: Translator) -> dict:
+    """
+    Describe the translator of a request for logging, including which engine answered a hedged request
+    and why the engine was chosen.
+    """
+    fields = {}
+    if isinstance(translator, resilience.ResilientTranslator):
+        if translator.answered_by is not None:
+            fields["answered_by"] = _unwrap(translator.answered_by).__class__.__name__
+        translator = translator.primary
+    if isinstance(translator, routing.MeasuredTranslator) and translator.decision:
+        fields["routing"] = translator.decision["reason"]
+    fields["translator"] = _unwrap(translator).__class__.__name__
+    return fields
+
+
+def _unwrap(translator: Translator) -> Translator:
+    if isinstance(translator, routing.MeasuredTranslator):
+        return translator.translator
+    return translator
 
 
 def _parse_translation_engine(event: dict) -> TranslationEngine:
@@ -49,21 +123,60 @@ def lambda_handler(event, _) -> dict:
     try:
         try:
             data = json.loads(event["body"])
-            parsed = Request(
-                data.get("text"),
-                data.get("source_language"),
-                data.get("target_language"),
-                _parse_translation_engine(event),
-                data.get("context"),
-            )
+            if "phrase" in data:
+                parsed = GlossRequest(
+                    data.get("phrase"),
+                    data.get("tokens"),
+                    data.get("source_language"),
+                    data.get("target_language"),
+                    _parse_translation_engine(event),
+                )
+            elif "texts" in data:
+                parsed = BatchRequest(
+                    data.get("texts"),
+                    data.get("source_language"),
+                    data.get("target_language"),
+                    _parse_translation_engine(event),
+                )
+            else:
+                parsed = Request(
+                    data.get("text"),
+                    data.get("source_language"),
+                    data.get("target_language"),
+                    _parse_translation_engine(event),
+                    data.get("context"),
+                )
         except (ValueError, TypeError) as err:
             return lambda_util.fail(
                 400, str(err), {"raw_event": event, "reason": str(err)}
             )
 
+        if isinstance(parsed, BatchRequest):
+            return _translate_batch(parsed)
+        if isinstance(parsed, GlossRequest):
+            return _gloss(parsed)
+
+        # Common words are answered offline, before any engine or cache lookup
+        if not parsed.context:
+            gloss = dictionary.lookup(
+                parsed.text, parsed.source_language, parsed.target_language
+            )
+            if gloss is not None:
+                return lambda_util.ok(
+                    {"translation": gloss, "source": dictionary.SOURCE},
+                    {
+                        "source_language": parsed.source_language,
+                        "target_language": parsed.target_language,
+                        "source": dictionary.SOURCE,
+                        "text": parsed.text,
+                        "text_length": len(parsed.text),
+                    },
+                )
+
         translator = derive_appropriate_translator(parsed)
 
-        translation = translator.translate(
+        translation, cache_stats = translation_cache.get_cache().translate(
+            translator,
             parsed.text,
             parsed.source_language,
             parsed.target_language,
@@ -75,16 +188,83 @@ def lambda_handler(event, _) -> dict:
             {
                 "source_language": parsed.source_language,
                 "target_language": parsed.target_language,
-                "translator": translator.__class__.__name__,
+                **_translator_fields(translator),
                 "text": parsed.text,
                 "context": parsed.context,
                 "text_length": len(parsed.text),
+                **cache_stats,
             },
         )
+    except NotImplementedError as err:
+        # The engine of the request does not support the operation
+        return lambda_util.fail(400, str(err), {"raw_event": event, "reason": str(err)})
+    except resilience.EngineUnavailableError as err:
+        return lambda_util.fail(503, str(err), {"raw_event": event, "reason": str(err)})
+    except resilience.LatencyBudgetExceededError as err:
+        return lambda_util.fail(504, str(err), {"raw_event": event, "reason": str(err)})
     except Exception as err:
         return lambda_util.fail(500, str(err), {"raw_event": event, "reason": str(err)})
 
 
+def _translate_batch(request: BatchRequest) -> dict:
+    """
+    Translate the texts of a batch request with as few engine calls as possible.
+    Translation errors fail the whole batch, to be handled by the caller of lambda_handler.
+    :param request: The batch request
+    :return: The translations, in the order of the texts
+    """
+    translator = derive_appropriate_translator(request)
+
+    translations, cache_stats = translation_cache.get_cache().translate_batch(
+        translator,
+        [item.text for item in request.items],
+        request.source_language,
+        request.target_language,
+        [item.context for item in request.items],
+    )
+
+    return lambda_util.ok(
+        {"translations": translations},
+        {
+            "source_language": request.source_language,
+            "target_language": request.target_language,
+            **_translator_fields(translator),
+            "batch_size": len(request.items),
+            "text_length": sum(len(item.text) for item in request.items),
+            **cache_stats,
+        },
+    )
+
+
+def _gloss(request: GlossRequest) -> dict:
+    """
+    Translate tokens of a phrase in context, with a single engine call for all uncached tokens.
+    :param request: The gloss request
+    :return: The translation of every token
+    """
+    translator = derive_appropriate_translator(request)
+
+    glosses, cache_stats = translation_cache.get_cache().gloss(
+        translator,
+        request.phrase,
+        request.tokens,
+        request.source_language,
+        request.target_language,
+    )
+
+    return lambda_util.ok(
+        {"glosses": glosses},
+        {
+            "source_language": request.source_language,
+            "target_language": request.target_language,
+            **_translator_fields(translator),
+            "phrase_length": len(request.phrase),
+            "tokens": len(request.tokens),
+            **cache_stats,
+        },
+    )
+
+
 if __name__ == "__main__":
     with open("event.json") as f:
         e = json.load(f)
@@ -0,0 +1,358 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from translator import Translator
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for use in a cache key: Unicode NFC, trimmed, with collapsed whitespace.
+    Case is kept, because it can change the translation.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(
+    engine: str,
+    source_language: str,
+    target_language: str,
+    text: str,
+    context: Optional[str],
+) -> str:
+    """
+    Derive the cache key of a translation.
+    :param engine: Name of the translation engine
+    :param source_language: Language of the text
+    :param target_language: Language the text is translated into
+    :param text: The text to translate
+    :param context: The contextual phrase, if any
+    :return: A hex digest identifying the translation
+    """
+    parts = [
+        engine,
+        source_language,
+        target_language,
+        normalize(text),
+        normalize(context) if context else None,
+    ]
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+
+
+class CacheBackend(ABC):
+    """
+    A cache shared between execution environments, e.g. a database.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a translation.
+        :param key: The cache key
+        :return: The translation, or None if it is missing or expired
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, translation: str, ttl: float) -> None:
+        """
+        Store a translation.
+        :param key: The cache key
+        :param translation: The translation
+        :param ttl: Seconds until the translation expires
+        """
+        pass
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Cache backend storing translations in a SQLite database.
+    Shares translations between processes on the same host, and serves as a local stand-in for a shared store.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, translation TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT translation FROM translations WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, translation: str, ttl: float) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                (key, translation, self._clock() + ttl),
+            )
+
+
+# Values of the "cache" field reported by TranslationCache.translate
+LOCAL_HIT = "local"
+SHARED_HIT = "shared"
+MISS = "miss"
+
+
+class TranslationCache:
+    """
+    Two-tier cache of translations: an in-process LRU in front of an optional shared backend.
+    Translations found in the shared backend are copied to the in-process tier.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 86400.0,
+        backend: Optional[CacheBackend] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param max_size: Maximum number of translations in the in-process tier. 0 disables it.
+        :param ttl: Seconds until a cached translation expires
+        :param backend: The shared tier, if any
+        :param clock: Source of the current time, in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[Optional[str], str]:
+        """
+        Look up a translation in both tiers.
+        :param key: The cache key
+        :return: The translation, or None, and the tier that served it: LOCAL_HIT, SHARED_HIT or MISS
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                translation, expires_at = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    return translation, LOCAL_HIT
+                del self._entries[key]
+
+        if self.backend is not None:
+            translation = self.backend.get(key)
+            if translation is not None:
+                self._put_local(key, translation)
+                return translation, SHARED_HIT
+
+        return None, MISS
+
+    def put(self, key: str, translation: str) -> None:
+        """
+        Store a translation in both tiers.
+        """
+        self._put_local(key, translation)
+        if self.backend is not None:
+            self.backend.put(key, translation, self.ttl)
+
+    def _put_local(self, key: str, translation: str) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (translation, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Empty the in-process tier.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def translate(
+        self,
+        translator: Translator,
+        text: str,
+        source_language: str,
+        target_language: str,
+        context: Optional[str],
+    ) -> tuple[str, dict]:
+        """
+        Translate text with a translator, unless the translation is cached.
+        Failed translations are not cached.
+        :return: The translation, and the cache tier and latencies in milliseconds for logging
+        """
+        start = time.perf_counter()
+        key = cache_key(
+            translator.engine.value, source_language, target_language, text, context
+        )
+        translation, tier = self.get(key)
+        lookup_ms = (time.perf_counter() - start) * 1e3
+
+        if translation is None:
+            translation, engine = translator.call_attributed(
+                lambda t: t.translate(text, source_language, target_language, context)
+            )
+            # A hedged translation may come from another engine, and is filed under that engine
+            self.put(
+                cache_key(
+                    engine.value, source_language, target_language, text, context
+                ),
+                translation,
+            )
+
+        return translation, {
+            "cache": tier,
+            "cache_lookup_ms": round(lookup_ms, 3),
+            "latency_ms": round((time.perf_counter() - start) * 1e3, 3),
+        }
+
+    def translate_batch(
+        self,
+        translator: Translator,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> tuple[list[str], dict]:
+        """
+        Translate texts with a translator, translating only those that are not cached, and each only once.
+        :return: The translations in the order of the texts, and cache counts and latencies in milliseconds for logging
+        """
+        start = time.perf_counter()
+        keys = [
+            cache_key(
+                translator.engine.value,
+                source_language,
+                target_language,
+                text,
+                context,
+            )
+            for text, context in zip(texts, contexts)
+        ]
+
+        translations: dict[str, str] = {}
+        missing: dict[str, tuple[str, Optional[str]]] = {}
+        hits = {LOCAL_HIT: 0, SHARED_HIT: 0}
+        for key, text, context in zip(keys, texts, contexts):
+            if key in translations or key in missing:
+                continue
+            translation, tier = self.get(key)
+            if translation is None:
+                missing[key] = (text, context)
+            else:
+                translations[key] = translation
+                hits[tier] += 1
+        lookup_ms = (time.perf_counter() - start) * 1e3
+
+        if missing:
+            results, engine = translator.call_attributed(
+                lambda t: t.translate_batch(
+                    [text for text, _ in missing.values()],
+                    source_language,
+                    target_language,
+                    [context for _, context in missing.values()],
+                )
+            )
+            for key, (text, context), translation in zip(
+                missing, missing.values(), results
+            ):
+                self.put(
+                    cache_key(
+                        engine.value, source_language, target_language, text, context
+                    ),
+                    translation,
+                )
+                translations[key] = translation
+
+        return [translations[key] for key in keys], {
+            "cache_local_hits": hits[LOCAL_HIT],
+            "cache_shared_hits": hits[SHARED_HIT],
+            "cache_misses": len(missing),
+            "cache_lookup_ms": round(lookup_ms, 3),
+            "latency_ms": round((time.perf_counter() - start) * 1e3, 3),
+        }
+
+    def gloss(
+        self,
+        translator: Translator,
+        phrase: str,
+        tokens: list[str],
+        source_language: str,
+        target_language: str,
+    ) -> tuple[dict[str, str], dict]:
+        """
+        Gloss tokens of a phrase with a translator, glossing only those that are not cached.
+        Glosses share their cache entries with single-word translations that have the phrase as context.
+        :return: The translation of every token, and cache counts and latencies in milliseconds for logging
+        """
+        start = time.perf_counter()
+        glosses: dict[str, Optional[str]] = {}
+        keys: dict[str, str] = {}
+        hits = {LOCAL_HIT: 0, SHARED_HIT: 0}
+        for token in tokens:
+            keys[token] = cache_key(
+                translator.engine.value, source_language, target_language, token, phrase
+            )
+            glosses[token], tier = self.get(keys[token])
+            if glosses[token] is not None:
+                hits[tier] += 1
+        missing = [token for token, gloss in glosses.items() if gloss is None]
+        lookup_ms = (time.perf_counter() - start) * 1e3
+
+        if missing:
+            results, engine = translator.call_attributed(
+                lambda t: t.gloss(phrase, missing, source_language, target_language)
+            )
+            for token in missing:
+                self.put(
+                    cache_key(
+                        engine.value, source_language, target_language, token, phrase
+                    ),
+                    results[token],
+                )
+                glosses[token] = results[token]
+
+        return glosses, {
+            "cache_local_hits": hits[LOCAL_HIT],
+            "cache_shared_hits": hits[SHARED_HIT],
+            "cache_misses": len(missing),
+            "cache_lookup_ms": round(lookup_ms, 3),
+            "latency_ms": round((time.perf_counter() - start) * 1e3, 3),
+        }
+
+
+def _create_cache() -> TranslationCache:
+    sqlite_path = os.getenv("TRANSLATION_CACHE_SQLITE_PATH")
+    return TranslationCache(
+        max_size=int(os.getenv("TRANSLATION_CACHE_SIZE", "1024")),
+        ttl=float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400")),
+        backend=SQLiteBackend(sqlite_path) if sqlite_path else None,
+    )
+
+
+_cache = _create_cache()
+
+
+def get_cache() -> TranslationCache:
+    """
+    Get the process-wide translation cache, configured via TRANSLATION_CACHE_SIZE,
+    TRANSLATION_CACHE_TTL_SECONDS and TRANSLATION_CACHE_SQLITE_PATH.
+    """
+    return _cache
@@ -1,14 +1,51 @@
 import json
+import logging
 import os
+import sys
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TypeVar
 
 import boto3
 import deepl
 import requests
+from botocore.config import Config
+from requests.adapters import HTTPAdapter
+
+import metrics
+from data import TranslationEngine
+
+logger = logging.getLogger("root")
+
+T = TypeVar("T")
+
+# Timeouts for calls to the translation engines, in seconds. Connecting fails fast,
+# reading leaves room for the response within the 30s Lambda timeout.
+CONNECT_TIMEOUT = float(os.getenv("TRANSLATE_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("TRANSLATE_READ_TIMEOUT", "20"))
+
+# Maximum number of pooled connections per engine
+POOL_SIZE = 10
+
+# The DeepL client reads its retries, and its timeout, from module-level settings
+deepl.http_client.max_network_retries = 2
+
+
+def read_timeout(engine: TranslationEngine) -> float:
+    """
+    Get the read timeout of an engine, in seconds.
+    Configured per engine with TRANSLATE_READ_TIMEOUT_<ENGINE>, e.g. TRANSLATE_READ_TIMEOUT_OPENAI,
+    and defaults to TRANSLATE_READ_TIMEOUT.
+    """
+    return float(os.getenv(f"TRANSLATE_READ_TIMEOUT_{engine.name}", READ_TIMEOUT))
 
 
 class Translator(ABC):
-    pass
+    # The engine the translator uses, e.g. to separate cached translations per engine
+    engine: TranslationEngine
+    # Whether the translator considers context, and so can disambiguate words and gloss phrases
+    supports_context: bool = False
 
     @abstractmethod
     def translate(
@@ -24,6 +61,154 @@ class Translator(ABC):
         """
         pass
 
+    # Limits of a single engine call, see translate_chunk. By default, every text is translated on its own.
+    MAX_TEXTS_PER_CALL = 1
+    MAX_BYTES_PER_CALL = sys.maxsize
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> list[str]:
+        """
+        Translate several texts with the same source and target language.
+        Sends one engine call per chunk of texts within the engine's limits, concurrently on the executor of the engine.
+        The calling thread translates chunks itself that no worker has started yet, so that a batch completes
+        even when every worker is busy, e.g. with the batch of another request.
+        :param texts: Texts to translate
+        :param source_language: Language of the input texts
+        :param target_language: Language to translate the texts into
+        :param contexts: A contextual phrase, or None, for every text
+        :return: The translations, in the order of the texts
+        """
+        chunks = split_batch(self, texts, contexts)
+        if not chunks:
+            return []
+
+        executor = get_executor(self.engine)
+        futures = [
+            executor.submit(
+                self.translate_chunk,
+                texts_chunk,
+                source_language,
+                target_language,
+                contexts_chunk,
+            )
+            for texts_chunk, contexts_chunk in chunks[1:]
+        ]
+        try:
+            results = [
+                self.translate_chunk(
+                    chunks[0][0], source_language, target_language, chunks[0][1]
+                )
+            ]
+            for future, (texts_chunk, contexts_chunk) in zip(futures, chunks[1:]):
+                if future.cancel():
+                    result = self.translate_chunk(
+                        texts_chunk, source_language, target_language, contexts_chunk
+                    )
+                else:
+                    result = future.result()
+                results.append(result)
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+        return [translation for result in results for translation in result]
+
+    def translate_chunk(
+        self,
+        texts: list[str],
+        source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> list[str]:
+        """
+        Translate texts within MAX_TEXTS_PER_CALL and MAX_BYTES_PER_CALL.
+        Engines that accept multiple texts per call override this with a single call.
+        :return: The translations, in the order of the texts
+        """
+        return [
+            self.translate(text, source_language, target_language, context)
+            for text, context in zip(texts, contexts)
+        ]
+
+    def gloss(
+        self,
+        phrase: str,
+        tokens: list[str],
+        source_language: str,
+        target_language: str,
+    ) -> dict[str, str]:
+        """
+        Translate tokens of a phrase as they are used in the phrase.
+        By default, the tokens are translated as a batch, each with the phrase as its context. Translators that do not
+        support context translate the tokens on their own; translators that do override this with a single call.
+        :param phrase: The phrase the tokens are taken from
+        :param tokens: The tokens to translate
+        :param source_language: Language of the phrase
+        :param target_language: Language to translate the tokens into
+        :return: The translation of every token, in the order of the tokens
+        """
+        distinct = list(dict.fromkeys(tokens))
+        translations = self.translate_batch(
+            distinct, source_language, target_language, [phrase] * len(distinct)
+        )
+        return dict(zip(distinct, translations))
+
+    def call_attributed(
+        self, operation: Callable[["Translator"], T]
+    ) -> tuple[T, TranslationEngine]:
+        """
+        Run an operation on the translator, and report the engine that produced its result.
+        Translators that delegate to several engines override this, so that e.g. the cache can file a result
+        under the engine that actually produced it.
+        :param operation: Calls a method of the translator it is given, e.g. translate
+        :return: The result, and the engine that produced it
+        """
+        return operation(self), self.engine
+
+
+def chunk(texts: list[str], max_items: int, max_bytes: int) -> Iterator[list[str]]:
+    """
+    Split texts into consecutive chunks within an engine's limits per call.
+    A single text exceeding max_bytes forms a chunk of its own.
+    :param texts: Texts to split
+    :param max_items: Maximum number of texts per chunk
+    :param max_bytes: Maximum UTF-8 size of the texts of a chunk
+    :return: The chunks, in order
+    """
+    current: list[str] = []
+    size = 0
+    for text in texts:
+        text_size = len(text.encode())
+        if current and (len(current) == max_items or size + text_size > max_bytes):
+            yield current
+            current, size = [], 0
+        current.append(text)
+        size += text_size
+    if current:
+        yield current
+
+
+def split_batch(
+    translator: Translator, texts: list[str], contexts: list[Optional[str]]
+) -> list[tuple[list[str], list[Optional[str]]]]:
+    """
+    Split a batch into chunks within the limits of a translator's engine per call.
+    :return: The texts and contexts of every chunk, in order
+    """
+    chunks = []
+    start = 0
+    for texts_chunk in chunk(
+        texts, translator.MAX_TEXTS_PER_CALL, translator.MAX_BYTES_PER_CALL
+    ):
+        chunks.append((texts_chunk, contexts[start : start + len(texts_chunk)]))
+        start += len(texts_chunk)
+    return chunks
+
 
 class DeepLTranslator(Translator):
     """
@@ -31,12 +216,18 @@ class DeepLTranslator(Translator):
     Requires DeepL API key for initialization.
     """
 
+    engine = TranslationEngine.DEEPL
+
     def __init__(self):
         api_key = os.getenv("DEEPL_API_KEY")
         if not api_key:
             raise ValueError("DeepL API key not found in environment variables")
 
-        self.client = deepl.DeepLClient(api_key)
+        deepl.http_client.min_connection_timeout = read_timeout(self.engine)
+        # The client keeps a requests.Session, so connections are reused across calls
+        self.client = deepl.DeepLClient(
+            api_key, server_url=os.getenv("DEEPL_SERVER_URL")
+        )
 
     def translate(
         self, text: str, _source_language: str, target_language: str, _context: str
@@ -49,20 +240,70 @@ class DeepLTranslator(Translator):
         :param _context: context, not used.
         :return:
         """
+        with metrics.EngineCall(self.engine, "translate", [text]) as call:
+            result = self.client.translate_text(
+                text, target_lang=self._target_lang(target_language)
+            )
+            call.record_output(
+                [result.text], billed_characters=result.billed_characters
+            )
+        return result.text
+
+    # Limits of a single /v2/translate request; DeepL allows 128 KiB per request
+    MAX_TEXTS_PER_CALL = 50
+    MAX_BYTES_PER_CALL = 120 * 1024
+
+    def translate_chunk(
+        self,
+        texts: list[str],
+        _source_language: str,
+        target_language: str,
+        _contexts: list[Optional[str]],
+    ) -> list[str]:
+        """
+        Translate texts with a single DeepL API call. Does not consider context.
+        """
+        with metrics.EngineCall(self.engine, "translate_batch", texts) as call:
+            results = self.client.translate_text(
+                texts, target_lang=self._target_lang(target_language)
+            )
+            translations = [result.text for result in results]
+            call.record_output(
+                translations,
+                billed_characters=sum(result.billed_characters for result in results),
+            )
+        return translations
+
+    @staticmethod
+    def _target_lang(target_language: str) -> str:
         # "target_lang=\"EN\" is deprecated, please use \"EN-GB\" or \"EN-US\"instead."
         if target_language == "en":
-            target_language = "EN-US"
-        return self.client.translate_text(text, target_lang=target_language).text
+            return "EN-US"
+        return target_language
 
 
 class AWSTranslator(Translator):
     """
     AWS Translator using the AWS Translate service.
     Requires AWS credentials to be configured with at least translate:TranslateText permission.
+
+    TranslateText accepts a single text per call, and batch translation jobs are asynchronous and S3-based,
+    so batches are translated with concurrent single-text calls over the pooled connections.
     """
 
+    engine = TranslationEngine.AWS
+
     def __init__(self):
-        self.client = boto3.client("translate")
+        self.client = boto3.client(
+            "translate",
+            config=Config(
+                connect_timeout=CONNECT_TIMEOUT,
+                read_timeout=read_timeout(self.engine),
+                retries={"max_attempts": 2, "mode": "standard"},
+                max_pool_connections=POOL_SIZE,
+                tcp_keepalive=True,
+            ),
+        )
 
     def translate(
         self, text: str, source_language: str, target_language: str, _context: str
@@ -75,11 +316,16 @@ class AWSTranslator(Translator):
         :param _context: context, not used.
         :return:
         """
-        response = self.client.translate_text(
-            Text=text,
-            SourceLanguageCode=source_language,
-            TargetLanguageCode=target_language,
-        )
+        with metrics.EngineCall(self.engine, "translate", [text]) as call:
+            response = self.client.translate_text(
+                Text=text,
+                SourceLanguageCode=source_language,
+                TargetLanguageCode=target_language,
+            )
+            # AWS Translate bills the characters of the source text, and does not report them
+            call.record_output(
+                [response["TranslatedText"]], billed_characters=len(text)
+            )
         return response["TranslatedText"]
 
 
@@ -92,17 +338,33 @@ class OpenAITranslator(Translator):
     to provide more nuanced translations based on the provided context.
     """
 
+    engine = TranslationEngine.OPENAI
+    supports_context = True
+
     def __init__(self):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key not found in environment variables")
 
-        self.api_key = api_key
-        self.api_url = "https://api.openai.com/v1/chat/completions"
+        self.read_timeout = read_timeout(self.engine)
+        self.api_url = os.getenv(
+            "OPENAI_API_URL", "https://api.openai.com/v1/chat/completions"
+        )
+
+        # Reuse connections across calls instead of a TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            }
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-        # I have considered using the Structured Output feature of OpenAI to enforce JSON output,
-        # but that requires Pydantic to be installed, which can sometimes be messy in the Lambda runtime.
-        # Might want to look into refactoring later to reduce token usage and improve reliability.
+        # The single-word prompt asks for JSON in the prompt itself. translate_batch enforces its output
+        # with Structured Outputs, using a plain JSON schema, since Pydantic can be messy in the Lambda runtime.
         self.system_prompt = """
         You are a language expert providing literal word translations.
         Given a phrase in and a specific word from that phrase, provide the literal translation of that word into {target_language}.
@@ -115,6 +377,19 @@ class OpenAITranslator(Translator):
             Phrase: "{}"
             Word to translate: "{}"`
         """
+        self.batch_system_prompt = """
+        You are a language expert providing literal word translations.
+        You are given a JSON list of items, each with an id, a word and optionally the phrase the word is taken from.
+        For every item, provide the literal translation of the word into {target_language}.
+        If a phrase is given, consider it to provide the most accurate translation for how the word is used.
+        Respond with one translation per item, with the id of the item.
+        """
+        self.gloss_system_prompt = """
+        You are a language expert providing literal word translations.
+        You are given a JSON object with a phrase and a list of tokens taken from that phrase.
+        For every token, provide the literal translation into {target_language} of how the token is used in the phrase.
+        Respond with one gloss per token, repeating the token exactly as given.
+        """
         self.model = "gpt-4o-mini"
 
     def translate(
@@ -128,14 +403,8 @@ class OpenAITranslator(Translator):
         :param context: The context in which the word is used
         :return:
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": [
+        content = self._complete(
+            [
                 {
                     "role": "system",
                     "content": self.system_prompt.format(
@@ -147,20 +416,276 @@ class OpenAITranslator(Translator):
                     "content": self.user_prompt.format(context, word),
                 },
             ],
-            "temperature": 0.3,
+            operation="translate",
+        )
+        return json.loads(content)["translation"]
+
+    # Word/context pairs per chat completion; keeps responses short enough to stay reliable
+    MAX_TEXTS_PER_CALL = 25
+
+    def translate_chunk(
+        self,
+        words: list[str],
+        _source_language: str,
+        target_language: str,
+        contexts: list[Optional[str]],
+    ) -> list[str]:
+        """
+        Translate several words, each within its own context, with a single chat completion.
+        :param words: Single words in any given language
+        :param _source_language: source_language, not used.
+        :param target_language: The language to translate the words into
+        :param contexts: The context in which each word is used, or None
+        :return: The translations, in the order of the words
+        """
+        items = [
+            {"id": i, "phrase": context, "word": word}
+            for i, (word, context) in enumerate(zip(words, contexts))
+        ]
+        content = self._complete(
+            [
+                {
+                    "role": "system",
+                    "content": self.batch_system_prompt.format(
+                        target_language=target_language
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": json.dumps({"items": items}, ensure_ascii=False),
+                },
+            ],
+            response_format=_BATCH_RESPONSE_FORMAT,
+            operation="translate_batch",
+        )
+
+        by_id = {
+            result["id"]: result["translation"]
+            for result in json.loads(content)["translations"]
         }
+        missing = [item["id"] for item in items if item["id"] not in by_id]
+        if missing:
+            raise Exception(f"OpenAI response lacks translations for items {missing}")
+        return [by_id[item["id"]] for item in items]
 
-        response = requests.post(
-            self.api_url,
-            headers=headers,
-            json=payload,
+    def gloss(
+        self,
+        phrase: str,
+        tokens: list[str],
+        _source_language: str,
+        target_language: str,
+    ) -> dict[str, str]:
+        """
+        Translate tokens of a phrase in context with a single chat completion.
+        :param phrase: The phrase the tokens are taken from
+        :param tokens: The tokens to translate
+        :param _source_language: source_language, not used.
+        :param target_language: The language to translate the tokens into
+        :return: The translation of every token, in the order of the tokens
+        """
+        content = self._complete(
+            [
+                {
+                    "role": "system",
+                    "content": self.gloss_system_prompt.format(
+                        target_language=target_language
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": json.dumps(
+                        {"phrase": phrase, "tokens": tokens}, ensure_ascii=False
+                    ),
+                },
+            ],
+            response_format=_GLOSS_RESPONSE_FORMAT,
+            operation="gloss",
         )
 
-        if response.status_code != 200:
-            raise Exception(
-                f"OpenAI API request failed with status {response.status_code}: {response.text}"
+        by_token = {
+            result["token"]: result["translation"]
+            for result in json.loads(content)["glosses"]
+        }
+        missing = [token for token in tokens if token not in by_token]
+        if missing:
+            raise Exception(f"OpenAI response lacks glosses for tokens {missing}")
+        return {token: by_token[token] for token in tokens}
+
+    def _complete(
+        self, messages: list[dict], response_format: dict = None, operation: str = None
+    ) -> str:
+        """
+        Request a chat completion, and emit its metrics.
+        :param messages: The messages of the conversation
+        :param response_format: The response format, e.g. a JSON schema, if any
+        :param operation: The translator operation the completion is requested for, for metrics
+        :return: The content of the completion's message
+        """
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.3,
+        }
+        if response_format:
+            payload["response_format"] = response_format
+
+        with metrics.EngineCall(
+            self.engine, operation, [message["content"] for message in messages]
+        ) as call:
+            response = self.session.post(
+                self.api_url,
+                json=payload,
+                timeout=(CONNECT_TIMEOUT, self.read_timeout),
             )
 
-        response_data = response.json()
-        content = response_data["choices"][0]["message"]["content"]
-        return json.loads(content)["translation"]
+            if response.status_code != 200:
+                raise Exception(
+                    f"OpenAI API request failed with status {response.status_code}: {response.text}"
+                )
+
+            response_data = response.json()
+            content = response_data["choices"][0]["message"]["content"]
+            usage = response_data.get("usage") or {}
+            call.record_output(
+                [content],
+                prompt_tokens=usage.get("prompt_tokens"),
+                completion_tokens=usage.get("completion_tokens"),
+            )
+        return content
+
+
+# Structured output schema of OpenAITranslator.translate_batch. A plain JSON schema, which needs no Pydantic.
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "batch_translation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "translations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "translation": {"type": "string"},
+                        },
+                        "required": ["id", "translation"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["translations"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Structured output schema of OpenAITranslator.gloss
+_GLOSS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "phrase_gloss",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "glosses": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "token": {"type": "string"},
+                            "translation": {"type": "string"},
+                        },
+                        "required": ["token", "translation"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["glosses"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Run concurrent engine calls, one executor per engine, sized to the engine's connection pool. Shared by
+# batches and hedged calls of resilience.ResilientTranslator.
+_executors: dict[TranslationEngine, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(engine: TranslationEngine) -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor of an engine, which bounds its concurrent calls to POOL_SIZE.
+    """
+    with _executors_lock:
+        if engine not in _executors:
+            _executors[engine] = ThreadPoolExecutor(
+                max_workers=POOL_SIZE, thread_name_prefix=engine.value
+            )
+        return _executors[engine]
+
+
+_TRANSLATORS: dict[TranslationEngine, type[Translator]] = {
+    TranslationEngine.AWS: AWSTranslator,
+    TranslationEngine.DEEPL: DeepLTranslator,
+    TranslationEngine.OPENAI: OpenAITranslator,
+}
+
+# Translators are kept for the lifetime of the execution environment, so that
+# their HTTP connections are reused by subsequent invocations.
+_translators: dict[TranslationEngine, Translator] = {}
+_lock = threading.Lock()
+
+
+def get_translator(engine: TranslationEngine) -> Translator:
+    """
+    Get the shared translator for an engine, creating it on first use.
+    :param engine: The translation engine
+    :return: The translator of the engine
+    :raises ValueError: If the engine is not configured, e.g. lacks an API key
+    """
+    translator = _translators.get(engine)
+    if translator is None:
+        with _lock:
+            translator = _translators.get(engine)
+            if translator is None:
+                translator = _TRANSLATORS[engine]()
+                _translators[engine] = translator
+    return translator
+
+
+# Engines whose translator could be created, determined once per execution environment
+_configured: Optional[frozenset[TranslationEngine]] = None
+
+
+def prewarm_translators() -> frozenset[TranslationEngine]:
+    """
+    Create the translators of all configured engines.
+    Called during the Lambda init phase, so that client setup is not paid by the first request.
+    Engines that cannot be created yet are created on first use, which then surfaces the error.
+    :return: The engines whose translator was created
+    """
+    global _configured
+    configured = set()
+    for engine in TranslationEngine:
+        try:
+            get_translator(engine)
+        except Exception as err:
+            logger.warning(f"Could not create translator for {engine.value}: {err}")
+            continue
+        configured.add(engine)
+    _configured = frozenset(configured)
+    return _configured
+
+
+def configured_engines() -> frozenset[TranslationEngine]:
+    """
+    Get the engines whose translator can be created, e.g. because their API key is set.
+    Determined by prewarm_translators, or on first use, and not retried for engines that failed.
+    """
+    if _configured is None:
+        return prewarm_translators()
+    return _configured
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+
+def cache_key(
+    text: str, language_code: str, voice_id: str, engine: str, output_format: str
+) -> str:
+    """
+    Derive the content address of synthesized speech.
+    Text is normalized to Unicode NFC and trimmed; case and inner whitespace are kept, because they can change the speech.
+    :return: A hex digest identifying the audio
+    """
+    parts = [
+        unicodedata.normalize("NFC", text).strip(),
+        language_code,
+        voice_id,
+        engine,
+        output_format,
+    ]
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+
+
+class ObjectStore(ABC):
+    """
+    Storage for audio objects shared between execution environments, e.g. an S3 bucket.
+    """
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[bytes]:
+        """
+        Read an object.
+        :param name: The object name, e.g. "<key>.mp3"
+        :return: The content, or None if the object does not exist
+        """
+        pass
+
+    @abstractmethod
+    def put(self, name: str, data: bytes, content_type: str) -> None:
+        """
+        Write an object.
+        :param name: The object name
+        :param data: The content
+        :param content_type: The MIME type of the content
+        """
+        pass
+
+    @abstractmethod
+    def put_stream(self, name: str, stream: BinaryIO, content_type: str) -> None:
+        """
+        Write an object from a stream, without holding all of its content in memory.
+        :param name: The object name
+        :param stream: The content, e.g. the AudioStream of a Polly response
+        :param content_type: The MIME type of the content
+        """
+        pass
+
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        """
+        Check whether an object exists, without reading it.
+        """
+        pass
+
+    @abstractmethod
+    def url(self, name: str, expires_in: int) -> str:
+        """
+        Create a URL that downloads an object without further authorization.
+        :param name: The object name
+        :param expires_in: Seconds until the URL expires
+        :return: The URL
+        """
+        pass
+
+
+class S3ObjectStore(ObjectStore):
+    """
+    Object store backed by an S3 bucket.
+    Expire objects with a lifecycle rule on the prefix; the cache never deletes them.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "tts/", client=None):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client or boto3.client("s3")
+
+    def get(self, name: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=self.prefix + name
+            )
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+    def put(self, name: str, data: bytes, content_type: str) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self.prefix + name,
+            Body=data,
+            ContentType=content_type,
+        )
+
+    def put_stream(self, name: str, stream: BinaryIO, content_type: str) -> None:
+        # Uploads in parts, so that memory use does not grow with the size of the object
+        self.client.upload_fileobj(
+            stream,
+            self.bucket,
+            self.prefix + name,
+            ExtraArgs={"ContentType": content_type},
+        )
+
+    def exists(self, name: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.prefix + name)
+        except ClientError as err:
+            if err.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def url(self, name: str, expires_in: int) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self.prefix + name},
+            ExpiresIn=expires_in,
+        )
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Object store in a local directory. A stand-in for S3 in tests and local runs.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def get(self, name: str) -> Optional[bytes]:
+        try:
+            with open(self.path(name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, name: str, data: bytes, content_type: str) -> None:
+        self._write(name, lambda f: f.write(data))
+
+    def put_stream(self, name: str, stream: BinaryIO, content_type: str) -> None:
+        self._write(name, lambda f: shutil.copyfileobj(stream, f))
+
+    def _write(self, name: str, write: Callable[[BinaryIO], object]) -> None:
+        # Write to a temporary file first, so that concurrent readers never see a partial object
+        temporary = f"{self.path(name)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            write(f)
+        os.replace(temporary, self.path(name))
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    def url(self, name: str, expires_in: int) -> str:
+        """
+        Create a file URL. The expiry is only recorded in the URL, like in the query of a presigned S3 URL.
+        """
+        expires = int(time.time()) + expires_in
+        return f"file://{os.path.abspath(self.path(name))}?expires={expires}"
+
+
+# Values of the "cache" field logged by the TTS handler
+LOCAL_HIT = "local"
+STORE_HIT = "store"
+MISS = "miss"
+
+
+class AudioCache:
+    """
+    Two-tier, content-addressed cache of synthesized speech: an in-process LRU, bounded by the size of its audio,
+    in front of an optional object store. Audio found in the object store is copied to the in-process tier.
+    Audio never changes for a key, so entries do not expire.
+    """
+
+    def __init__(
+        self, max_bytes: int = 32 * 1024 * 1024, store: Optional[ObjectStore] = None
+    ):
+        """
+        :param max_bytes: Maximum total size of the audio in the in-process tier. 0 disables it.
+        :param store: The shared tier, if any
+        """
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> tuple[Optional[bytes], str]:
+        """
+        Look up audio in both tiers.
+        :param name: The object name, e.g. "<key>.mp3"
+        :return: The audio, or None, and the tier that served it: LOCAL_HIT, STORE_HIT or MISS
+        """
+        with self._lock:
+            audio = self._entries.get(name)
+            if audio is not None:
+                self._entries.move_to_end(name)
+                return audio, LOCAL_HIT
+
+        if self.store is not None:
+            audio = self.store.get(name)
+            if audio is not None:
+                self._put_local(name, audio)
+                return audio, STORE_HIT
+
+        return None, MISS
+
+    def put(self, name: str, audio: bytes, content_type: str) -> None:
+        """
+        Store audio in both tiers.
+        """
+        self._put_local(name, audio)
+        if self.store is not None:
+            self.store.put(name, audio, content_type)
+
+    def _put_local(self, name: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            if name in self._entries:
+                self._size -= len(self._entries.pop(name))
+            self._entries[name] = audio
+            self._size += len(audio)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """
+        Empty the in-process tier.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _create_cache() -> AudioCache:
+    bucket = os.getenv("TTS_CACHE_BUCKET")
+    directory = os.getenv("TTS_CACHE_DIR")
+    if bucket:
+        store = S3ObjectStore(bucket, os.getenv("TTS_CACHE_PREFIX", "tts/"))
+    elif directory:
+        store = LocalObjectStore(directory)
+    else:
+        store = None
+    return AudioCache(
+        max_bytes=int(os.getenv("TTS_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+        store=store,
+    )
+
+
+_cache = _create_cache()
+
+
+def get_cache() -> AudioCache:
+    """
+    Get the process-wide audio cache, configured via TTS_CACHE_MAX_BYTES, and TTS_CACHE_BUCKET
+    (with TTS_CACHE_PREFIX) or TTS_CACHE_DIR for the object store tier.
+    """
+    return _cache
@@ -1,9 +1,13 @@
 import base64
 import json
 import logging
+import os
+import threading
 
 import boto3
 
+import audio_cache
+
 languages = {
     "RU": {"languageCode": "ru-RU", "voiceId": "Tatyana", "engine": "standard"},
     "EN": {
@@ -21,19 +25,107 @@ languages = {
 logger = logging.getLogger("root")
 logger.setLevel(logging.INFO)
 
+OUTPUT_FORMAT = "mp3"
+CONTENT_TYPE = "audio/mpeg"
+
+# Delivery modes: the audio in the response body, a JSON body with a URL to the audio, or a redirect to that URL.
+# URL and redirect keep Lambda memory and response size flat for long texts, but require an object store.
+INLINE = "inline"
+URL = "url"
+REDIRECT = "redirect"
+DELIVERY_MODES = [INLINE, URL, REDIRECT]
+
+# Seconds until a delivered URL expires
+URL_EXPIRY = int(os.getenv("TTS_URL_EXPIRY_SECONDS", "300"))
+# Whether existing objects are delivered as they are, rather than synthesized again
+REUSE_OBJECTS = os.getenv("TTS_REUSE_OBJECTS", "true").lower() != "false"
+
+# The Polly client is kept for the lifetime of the execution environment, so that its connections are reused
+_polly_client = None
+_polly_lock = threading.Lock()
+
+
+def get_polly_client():
+    """
+    Get the shared Polly client, creating it on first use.
+    """
+    global _polly_client
+    with _polly_lock:
+        if _polly_client is None:
+            _polly_client = boto3.client("polly")
+        return _polly_client
+
 
 class Request:
     text: str
     language: str
+    delivery: str
 
-    def __init__(self, text: str, language: str):
+    def __init__(self, text: str, language: str, delivery: str = INLINE):
         if not text:
             raise ValueError("Text cannot be empty")
         language = language.upper()
         if not language or language not in languages:
             raise ValueError("Invalid language supplied")
+        if delivery not in DELIVERY_MODES:
+            raise ValueError(f"Delivery must be one of {', '.join(DELIVERY_MODES)}")
         self.text = text
         self.language = language
+        self.delivery = delivery
+
+
+def object_name(text: str, language_code: str, voice: str, engine: str) -> str:
+    """
+    Get the content-addressed name of the audio object of a text.
+    """
+    key = audio_cache.cache_key(text, language_code, voice, engine, OUTPUT_FORMAT)
+    return f"{key}.{OUTPUT_FORMAT}"
+
+
+def synthesize(
+    text: str, language_code: str, voice: str, engine: str
+) -> tuple[bytes, str]:
+    """
+    Synthesize speech with Polly, unless the same text was already synthesized with the same voice, engine and format.
+    :return: The MP3 audio, and the cache tier that served it, or audio_cache.MISS
+    """
+    name = object_name(text, language_code, voice, engine)
+    cache = audio_cache.get_cache()
+    audio, tier = cache.get(name)
+    if audio is None:
+        audio = _synthesize_speech(text, language_code, voice, engine).read()
+        cache.put(name, audio, CONTENT_TYPE)
+    return audio, tier
+
+
+def deliver(text: str, language_code: str, voice: str, engine: str) -> tuple[str, bool]:
+    """
+    Write the speech of a text to the object store, and create a short-lived URL to it.
+    Polly's audio stream is passed to the store as it is, so the audio is never held in memory as a whole.
+    :return: The URL, and whether an existing object was reused
+    """
+    store = audio_cache.get_cache().store
+    name = object_name(text, language_code, voice, engine)
+    reused = REUSE_OBJECTS and store.exists(name)
+    if not reused:
+        stream = _synthesize_speech(text, language_code, voice, engine)
+        store.put_stream(name, stream, CONTENT_TYPE)
+    return store.url(name, URL_EXPIRY), reused
+
+
+def _synthesize_speech(text: str, language_code: str, voice: str, engine: str):
+    """
+    Synthesize speech with Polly.
+    :return: The audio stream of the response
+    """
+    response = get_polly_client().synthesize_speech(
+        Text=text,
+        OutputFormat=OUTPUT_FORMAT,
+        LanguageCode=language_code,
+        VoiceId=voice,
+        Engine=engine,
+    )
+    return response["AudioStream"]
 
 
 def lambda_handler(event, _):
@@ -61,32 +153,39 @@ def lambda_handler(event, _):
         voice = languages.get(language)["voiceId"]
         engine = languages.get(language)["engine"]
 
-        polly_client = boto3.client("polly")
-        response = polly_client.synthesize_speech(
-            Text=text,
-            OutputFormat="mp3",
-            LanguageCode=language_code,
-            VoiceId=voice,
-            Engine=engine,
-        )
+        # Without an object store there is nothing to link to, so the audio is returned inline
+        delivery = parsed.delivery
+        if audio_cache.get_cache().store is None:
+            delivery = INLINE
 
-        audio_stream = base64.b64encode(response["AudioStream"].read()).decode("utf-8")
+        log_context = {
+            "success": True,
+            "language": language,
+            "voice": voice,
+            "engine": engine,
+            "text_length": len(text),
+            "delivery": delivery,
+        }
 
-        logger.info(
-            json.dumps(
-                {
-                    "success": True,
-                    "language": language,
-                    "voice": voice,
-                    "engine": engine,
-                    "text_length": len(text),
-                }
-            )
-        )
+        if delivery != INLINE:
+            url, reused = deliver(text, language_code, voice, engine)
+            logger.info(json.dumps({**log_context, "reused": reused}))
+            if delivery == REDIRECT:
+                return {"statusCode": 302, "headers": {"Location": url}, "body": ""}
+            return {
+                "statusCode": 200,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps({"url": url, "expiresIn": URL_EXPIRY}),
+            }
+
+        audio, cache = synthesize(text, language_code, voice, engine)
+        audio_stream = base64.b64encode(audio).decode("utf-8")
+
+        logger.info(json.dumps({**log_context, "cache": cache}))
         return {
             "statusCode": 200,
             "headers": {
-                "Content-Type": "audio/mpeg",
+                "Content-Type": CONTENT_TYPE,
                 "Content-Disposition": 'inline; filename="speech.mp3"',
             },
             "body": audio_stream,
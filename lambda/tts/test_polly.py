@@ -0,0 +1,182 @@
+import base64
+import io
+import json
+
+import pytest
+
+import audio_cache
+import polly
+from audio_cache import AudioCache, LocalObjectStore, cache_key
+
+
+class FakePolly:
+    def __init__(self):
+        self.calls = []
+
+    def synthesize_speech(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"AudioStream": io.BytesIO(f"mp3:{kwargs['Text']}:{kwargs['VoiceId']}".encode())}
+
+
+@pytest.fixture
+def fake_polly(monkeypatch):
+    client = FakePolly()
+    monkeypatch.setattr(polly, "_polly_client", client)
+    return client
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalObjectStore(str(tmp_path / "objects"))
+    monkeypatch.setattr(audio_cache, "_cache", AudioCache(store=store))
+    return store
+
+
+def _event(text: str = "Hallo Welt", language: str = "de") -> dict:
+    return {"body": json.dumps({"text": text, "language": language})}
+
+
+def test_key_should_separate_text_voice_engine_and_format():
+    key = cache_key("Hallo", "de-DE", "Vicki", "generative", "mp3")
+
+    assert cache_key(" Hallo ", "de-DE", "Vicki", "generative", "mp3") == key
+    assert cache_key("hallo", "de-DE", "Vicki", "generative", "mp3") != key
+    assert cache_key("Hallo", "de-DE", "Daniel", "generative", "mp3") != key
+    assert cache_key("Hallo", "de-DE", "Vicki", "neural", "mp3") != key
+    assert cache_key("Hallo", "de-DE", "Vicki", "generative", "ogg_vorbis") != key
+
+
+def test_should_evict_least_recently_used_audio_by_size():
+    cache = AudioCache(max_bytes=10)
+    cache.put("a.mp3", b"aaaa", "audio/mpeg")
+    cache.put("b.mp3", b"bbbb", "audio/mpeg")
+    cache.get("a.mp3")
+    cache.put("c.mp3", b"cccc", "audio/mpeg")
+
+    assert cache.get("a.mp3") == (b"aaaa", audio_cache.LOCAL_HIT)
+    assert cache.get("b.mp3") == (None, audio_cache.MISS)
+    assert len(cache) == 2
+
+
+def test_should_synthesize_once_and_then_hit_local_tier(fake_polly, store):
+    first = polly.lambda_handler(_event(), None)
+    second = polly.lambda_handler(_event(), None)
+
+    assert first["statusCode"] == second["statusCode"] == 200
+    assert base64.b64decode(second["body"]) == b"mp3:Hallo Welt:Vicki"
+    assert len(fake_polly.calls) == 1
+    assert audio_cache.get_cache().get(_name())[1] == audio_cache.LOCAL_HIT
+
+
+def test_should_serve_from_object_store_after_cold_start(fake_polly, store):
+    polly.lambda_handler(_event(), None)
+    audio_cache.get_cache().clear()
+
+    response = polly.lambda_handler(_event(), None)
+
+    assert base64.b64decode(response["body"]) == b"mp3:Hallo Welt:Vicki"
+    assert len(fake_polly.calls) == 1
+    assert store.get(_name()) == b"mp3:Hallo Welt:Vicki"
+
+
+def test_should_synthesize_different_voices_separately(fake_polly, store):
+    polly.lambda_handler(_event(language="de"), None)
+    polly.lambda_handler(_event(language="fr"), None)
+
+    assert [call["VoiceId"] for call in fake_polly.calls] == ["Vicki", "Lea"]
+
+
+class FailingPolly:
+    def synthesize_speech(self, **_):
+        raise Exception("throttled")
+
+
+def test_should_not_cache_failed_synthesis(store, monkeypatch):
+    monkeypatch.setattr(polly, "_polly_client", FailingPolly())
+
+    response = polly.lambda_handler(_event(), None)
+
+    assert response["statusCode"] == 500
+    assert store.get(_name()) is None
+
+
+def _name() -> str:
+    return cache_key("Hallo Welt", "de-DE", "Vicki", "generative", "mp3") + ".mp3"
+
+
+class ChunkedStream(io.BytesIO):
+    """An audio stream that fails if it is read as a whole."""
+
+    def read(self, size=-1):
+        assert size is not None and size > 0, "stream read as a whole"
+        return super().read(size)
+
+
+class StreamingPolly(FakePolly):
+    def synthesize_speech(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"AudioStream": ChunkedStream(b"mp3" * 100_000)}
+
+
+@pytest.fixture
+def streaming_polly(monkeypatch):
+    client = StreamingPolly()
+    monkeypatch.setattr(polly, "_polly_client", client)
+    return client
+
+
+def _delivery_event(delivery: str, text: str = "Hallo Welt") -> dict:
+    return {"body": json.dumps({"text": text, "language": "de", "delivery": delivery})}
+
+
+def test_should_stream_audio_to_store_and_return_url(streaming_polly, store):
+    response = polly.lambda_handler(_delivery_event("url"), None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["url"].startswith(f"file://{store.path(_name())}?expires=")
+    assert body["expiresIn"] == polly.URL_EXPIRY
+    assert store.get(_name()) == b"mp3" * 100_000
+    assert len(audio_cache.get_cache()) == 0
+
+
+def test_should_redirect_to_existing_object(streaming_polly, store):
+    polly.lambda_handler(_delivery_event("url"), None)
+    response = polly.lambda_handler(_delivery_event("redirect"), None)
+
+    assert response["statusCode"] == 302
+    assert response["headers"]["Location"].startswith(f"file://{store.path(_name())}")
+    assert len(streaming_polly.calls) == 1
+
+
+def test_should_reuse_object_of_inline_request(fake_polly, store):
+    polly.lambda_handler(_event(), None)
+    polly.lambda_handler(_delivery_event("url"), None)
+
+    assert len(fake_polly.calls) == 1
+
+
+def test_should_synthesize_again_without_reuse(streaming_polly, store, monkeypatch):
+    monkeypatch.setattr(polly, "REUSE_OBJECTS", False)
+    polly.lambda_handler(_delivery_event("url"), None)
+    polly.lambda_handler(_delivery_event("url"), None)
+
+    assert len(streaming_polly.calls) == 2
+
+
+@pytest.mark.parametrize("delivery", ["url", "redirect"])
+def test_should_fall_back_to_inline_delivery_without_store(fake_polly, monkeypatch, delivery):
+    monkeypatch.setattr(audio_cache, "_cache", AudioCache())
+
+    response = polly.lambda_handler(_delivery_event(delivery), None)
+
+    assert response["statusCode"] == 200
+    assert response["headers"]["Content-Type"] == polly.CONTENT_TYPE
+    assert base64.b64decode(response["body"]) == b"mp3:Hallo Welt:Vicki"
+
+
+def test_should_reject_unknown_delivery(fake_polly, store):
+    response = polly.lambda_handler(_delivery_event("email"), None)
+
+    assert response["statusCode"] == 400
+    assert "Delivery must be one of" in response["body"]
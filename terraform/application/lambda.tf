@@ -120,12 +120,25 @@ module "polly_lambda" {
   runtime       = "python3.14"
   memory_size   = 256
   timeout       = 30
-  source_path   = "${path.module}/../../lambda/tts"
+  source_path = [{
+    path             = "${path.module}/../../lambda/tts"
+    pip_requirements = true
+    # Tests are not deployed
+    patterns = [
+      "!test_.*\\.py",
+      "!.*\\.md",
+    ]
+  }]
 
   trigger_on_package_timestamp = false
 
   cloudwatch_logs_retention_in_days = 14
 
+  environment_variables = {
+    TTS_CACHE_BUCKET = aws_s3_bucket.tts_cache.bucket
+    TTS_CACHE_PREFIX = local.tts_cache_prefix
+  }
+
   # https://github.com/terraform-aws-modules/terraform-aws-lambda/issues/36#issuecomment-650217274
   create_current_version_allowed_triggers = false
   allowed_triggers                        = local.lambda_allowed_triggers
@@ -140,6 +153,25 @@ module "polly_lambda" {
           "polly:SynthesizeSpeech",
         ]
         Resource = "*"
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject",
+          "s3:PutObject",
+        ]
+        Resource = "${aws_s3_bucket.tts_cache.arn}/${local.tts_cache_prefix}*"
+      },
+      {
+        # Lets HeadObject report missing audio as 404 rather than 403, so that url delivery can reuse objects
+        Effect   = "Allow"
+        Action   = ["s3:ListBucket"]
+        Resource = aws_s3_bucket.tts_cache.arn
+        Condition = {
+          StringLike = {
+            "s3:prefix" = ["${local.tts_cache_prefix}*"]
+          }
+        }
       }
     ]
   })
@@ -155,7 +187,18 @@ module "translate_lambda" {
   runtime       = "python3.14"
   memory_size   = 256
   timeout       = 30
-  source_path   = "${path.module}/../../lambda/translate"
+  source_path   = [{
+    path = "${path.module}/../../lambda/translate"
+    # Tests, the stand-in server and tooling are not deployed
+    patterns = [
+      "!test_.*\\.py",
+      "!stand_in_server\\.py",
+      "!build_dictionary\\.py",
+      "!benchmark/.*",
+      "!.*\\.md",
+      "!event\\.json",
+    ]
+  }]
 
   cloudwatch_logs_retention_in_days = 14
 
@@ -26,6 +26,9 @@ locals {
 
   inflections_ru_version = "0.1.7"
 
+  # Prefix of the audio objects in the TTS cache bucket
+  tts_cache_prefix = "tts/"
+
   inflections_latin = {
     languages = toset(["es", "it", "pt", "fr"])
     version   = "0.3.1"
@@ -0,0 +1,31 @@
+# Synthesized speech, shared by all execution environments of the TTS Lambda
+resource "aws_s3_bucket" "tts_cache" {
+  bucket = "grammr-tts-cache-${var.environment}-${data.aws_caller_identity.current.account_id}"
+}
+
+resource "aws_s3_bucket_public_access_block" "tts_cache" {
+  bucket = aws_s3_bucket.tts_cache.id
+
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+# The cache never deletes audio, so storage is bounded by expiring objects
+resource "aws_s3_bucket_lifecycle_configuration" "tts_cache" {
+  bucket = aws_s3_bucket.tts_cache.id
+
+  rule {
+    id     = "expire-tts-audio"
+    status = "Enabled"
+
+    filter {
+      prefix = local.tts_cache_prefix
+    }
+
+    expiration {
+      days = 30
+    }
+  }
+}